@@ -24,7 +24,9 @@
  * Dario Correal
  """
 
+import io
 import os
+import math
 import csv
 import time
 import tracemalloc
@@ -37,45 +39,188 @@ from DataStructures.Map import map_linear_probing as lp
 from DataStructures.List import array_list as al
 # TODO Realice la importación del mapa separate chaining - HECHO
 from DataStructures.Map import map_separate_chaining as sp
+# Multimapa para los índices de uno a muchos (llave -> varios valores)
+from DataStructures.Map import multimap as mm
+# Árbol rojo-negro para los índices ordenados que permiten consultas por rango
+from DataStructures.Tree import red_black_tree as rbt
 
 
 data_dir = os.path.dirname(os.path.realpath('__file__')) + '/Data/GoodReads/'
 
-def new_logic():
+def new_logic(sizes=None):
     """
     Inicializa el catálogo de libros. Crea una lista vacía para guardar
     los libros y utiliza tablas de hash para almacenar los datos restantes con diferentes índices
     utilizando linear probing como tipo de tabla de hash
+
+    Cada tabla se crea con el número de llaves estimado en sizes (ver estimate_sizes),
+    de modo que la carga no tenga que hacer rehash. Si sizes es None se estima a partir
+    de los archivos de data_dir; sin archivos se usan 1000 llaves por tabla.
     """
+    if sizes is None:
+        sizes = estimate_sizes()
     catalog = {"books": None,
                "books_by_id": None,
                "books_by_year_author":None,
                "books_by_authors": None,
+               "books_by_year": None,
+               "books_by_rating": None,
                "tags": None,
-               "book_tags": None}
+               "book_tags": None,
+               "size_estimates": sizes}
 
     #Lista que contiene la totalidad de los libros cargados
     catalog['books'] = al.new_list()
 
     #Tabla de Hash que contiene los libros indexados por good_reads_book_id  
     #(good_read_id -> book)
-    catalog['books_by_id'] = lp.new_map(1000, 0.7) #TODO completar la creación del mapa -HECHO
+    catalog['books_by_id'] = lp.new_map(initial_size(sizes, 'books_by_id'), 0.7, exact_capacity=True) #TODO completar la creación del mapa -HECHO
 
-    #Tabla de Hash con la siguiente pareja llave valor: (author_name -> List(books))
-    catalog['books_by_authors'] = lp.new_map(1000, 0.7) #TODO completar la creación del mapa - HECHO
+    #Multimapa con la siguiente pareja llave valor: (author_name -> books)
+    catalog['books_by_authors'] = mm.new_map(initial_size(sizes, 'books_by_authors'), 0.7, exact_capacity=True) #TODO completar la creación del mapa - HECHO
 
     #Tabla de Hash con la siguiente pareja llave valor: (tag_name -> tag)
-    catalog['tags'] = lp.new_map(1000, 0.7) #TODO completar la creación del mapa-HECHO
+    catalog['tags'] = lp.new_map(initial_size(sizes, 'tags'), 0.7, exact_capacity=True) #TODO completar la creación del mapa-HECHO
+
+    #Multimapa con la siguiente pareja llave valor: (tag_id -> book_tags)
+    catalog['book_tags'] = mm.new_map(initial_size(sizes, 'book_tags'), 0.7, exact_capacity=True)
 
-    #Tabla de Hash con la siguiente pareja llave valor: (tag_id -> book_tags)
-    catalog['book_tags'] = lp.new_map(1000,0.7)
+    #Multimapa con llave compuesta por autor y año de publicación:
+    #((author_name, original_publication_year) -> books)
+    catalog['books_by_year_author'] = mm.new_map(initial_size(sizes, 'books_by_year_author'), 0.7, exact_capacity=True) #TODO completar la creación del mapa - HECHO
 
-    #Tabla de Hash principal que contiene sub-mapas dentro de los valores
-    #con la siguiente representación de la pareja llave valor: (author_name -> (original_publication_year -> list(books)))
-    catalog['books_by_year_author'] = lp.new_map(1000, 0.7) #TODO completar la creación del mapa - HECHO
+    #Árboles ordenados para consultas por rango: (original_publication_year -> list(books))
+    #y (average_rating -> list(books))
+    catalog['books_by_year'] = rbt.new_map()
+    catalog['books_by_rating'] = rbt.new_map()
     
     return catalog
 
+
+def initial_size(sizes, index):
+    """
+    Retorna el número de llaves con el que se crea un índice: la estimación de sizes,
+    sin bajar de 1000, el valor que se usaba para todas las tablas. Los índices se crean
+    con exact_capacity=True para que la capacidad sea la estimación entre el factor de
+    carga, sin redondear a la siguiente capacidad de la tabla de primos.
+    """
+    return max(1000, int(sizes.get(index, 0)))
+
+
+def estimate_rows(filename, sample_size=1000):
+    """
+    Estima el número de filas de un archivo CSV sin leerlo completo: tamaño del archivo
+    dividido por la longitud promedio de una muestra de filas.
+
+    La muestra se toma repartida en todo el archivo y no solo al inicio, donde las filas
+    pueden ser más cortas (por ejemplo, ids pequeños): se salta a sample_size posiciones
+    equidistantes, se descarta la fila partida y se lee la siguiente completa.
+
+    Retorna la pareja (filas estimadas, filas de muestra como diccionarios). Si el
+    archivo no existe o está vacío retorna (0, []).
+    """
+    if not os.path.exists(filename):
+        return 0, []
+    file_size = os.path.getsize(filename)
+    with open(filename, 'rb') as file:
+        header = file.readline()
+        body_start = file.tell()
+        step = (file_size - body_start) / sample_size
+        lines = []
+        read_until = body_start
+        for i in range(sample_size):
+            offset = body_start + int(i * step)
+            if offset < read_until:
+                continue  # La fila en esa posición ya está en la muestra
+            file.seek(offset)
+            if offset > body_start:
+                file.readline()
+            line = file.readline()
+            if not line:
+                break
+            read_until = file.tell()
+            lines.append(line)
+    if not lines:
+        return 0, []
+
+    average_length = sum(len(line) for line in lines) / len(lines)
+    rows = int((file_size - body_start) / average_length)
+    sample = list(csv.DictReader(io.StringIO((header + b''.join(lines)).decode('utf-8'))))
+    return max(rows, len(lines)), sample
+
+
+def estimate_distinct(sample_keys, total):
+    """
+    Estima cuántas llaves distintas hay en una población de total apariciones a partir
+    de las llaves de una muestra, con el estimador Chao1: d + f1 (f1 - 1) / (2 (f2 + 1)),
+    donde d es el número de llaves distintas de la muestra, f1 las que aparecen una vez
+    y f2 las que aparecen dos veces. El resultado no pasa de total.
+    """
+    counts = {}
+    for key in sample_keys:
+        counts[key] = counts.get(key, 0) + 1
+    if not counts:
+        return 0
+    frequencies = list(counts.values())
+    singletons = frequencies.count(1)
+    doubletons = frequencies.count(2)
+    estimate = len(counts) + singletons * (singletons - 1) / (2 * (doubletons + 1))
+    return min(total, estimate)
+
+
+def estimate_sizes(directory=None, margin=1.1):
+    """
+    Estima el número de llaves de cada índice del catálogo a partir de los archivos.
+
+    - books_by_id: filas de books.csv.
+    - books_by_authors y books_by_year_author: llaves distintas (autor y (autor, año))
+      estimadas con estimate_distinct sobre la muestra de libros, a lo sumo el número de
+      parejas libro-autor.
+    - tags: filas de tags.csv.
+    - book_tags: tag_id distintos, a lo sumo el número de tags o de filas de book_tags.csv.
+
+    Todas se multiplican por margin para cubrir el error de la estimación.
+    """
+    if directory is None:
+        directory = data_dir
+    books, book_sample = estimate_rows(directory + "books.csv")
+    tags, _ = estimate_rows(directory + "tags.csv")
+    book_tags, _ = estimate_rows(directory + "book_tags.csv")
+
+    authors, author_years = 0, 0
+    if book_sample:
+        sample_pairs = [(author.strip(), book['original_publication_year'])
+                        for book in book_sample for author in book['authors'].split(",")]
+        pairs = books * len(sample_pairs) / len(book_sample)
+        authors = estimate_distinct((author for author, _ in sample_pairs), pairs)
+        author_years = estimate_distinct(sample_pairs, pairs)
+    tag_ids = min(tags, book_tags) if tags > 0 else book_tags
+
+    return {'books_by_id': int(books * margin),
+            'books_by_authors': int(authors * margin),
+            'books_by_year_author': int(author_years * margin),
+            'tags': int(tags * margin),
+            'book_tags': int(tag_ids * margin)}
+
+
+def size_report(catalog):
+    """
+    Compara, para cada índice de hash del catálogo, el número de llaves estimado antes
+    de la carga con el real, junto con su capacidad y los rehash que hizo.
+
+    Retorna un diccionario índice -> {'estimated', 'actual', 'capacity', 'rehash_count'}.
+    """
+    report = {}
+    for index, estimate in catalog['size_estimates'].items():
+        my_map = catalog[index]
+        if 'map' in my_map:
+            my_map = my_map['map']  # Multimapa: las llaves están en su mapa interno
+        report[index] = {'estimated': estimate,
+                         'actual': lp.size(my_map),
+                         'capacity': my_map['capacity'],
+                         'rehash_count': my_map['rehash_count']}
+    return report
+
 #  -------------------------------------------------------------
 # Funciones para la carga de datos
 #  -------------------------------------------------------------
@@ -175,59 +320,75 @@ def add_book(catalog, book):
     for author in authors:
         add_book_author(catalog, author.strip(), book)
         add_book_author_and_year(catalog,author.strip(), book)
+    add_book_year_rating(catalog, book)
+    return catalog
+
+
+def add_book_year_rating(catalog, book):
+    """
+    Adiciona el libro a los árboles ordenados por año de publicación y por rating.
+    Los libros sin año o sin rating no se agregan al árbol correspondiente.
+    """
+    for index, key in (('books_by_year', parse_year(book['original_publication_year'])),
+                       ('books_by_rating', parse_number(book['average_rating']))):
+        if key is None:
+            continue
+        books = rbt.get(catalog[index], key)
+        if books is None:
+            books = al.new_list()
+            rbt.put(catalog[index], key, books)
+        al.add_last(books, book)
     return catalog
 
 
+def parse_number(text):
+    """
+    Convierte un campo numérico del archivo a float. Retorna None si está vacío, no es un
+    número o no es finito (nan, inf).
+    """
+    try:
+        value = float(text)
+    except (TypeError, ValueError):
+        return None
+    # float() acepta 'nan' e 'inf', que no sirven como llave de los árboles
+    if not math.isfinite(value):
+        return None
+    return value
+
+
+def parse_year(text):
+    """
+    Convierte un año de publicación del archivo (por ejemplo '1997.0') a entero.
+    Retorna None si está vacío o no es un año válido.
+    """
+    year = parse_number(text)
+    if year is None:
+        return None
+    return int(year)
+
+
 def add_book_author(catalog, author_name, book):
     """
     Adiciona un autor al mapa de autores, la cual guarda referencias
     a los libros de dicho autor
     """
-    authors = catalog['books_by_authors']
-    author_value = lp.get(authors,author_name)
-    if author_value:
-        #Si el autor ya se había agregado al mapa, se obtiene la lista que contiene sus libros y se agrega el nuevo elemento.
-        al.add_last(author_value,book)
-    else:
-        #Si es un autor nuevo, se agrega al mapa teniendo como llave el nombre del autor 
-        # y como valor una lista que contiene los libros asociados al autor.
-        authors_books = al.new_list()
-        al.add_last(authors_books,book)
-        lp.put(authors,author_name,authors_books)
+    #El multimapa crea el grupo del autor si es nuevo y agrega el libro con un solo sondeo
+    mm.add(catalog['books_by_authors'], author_name, book)
     return catalog
 
 
 def add_book_author_and_year(catalog, author_name, book):
     """
-    Adiciona un autor a los mapas indexados por autor y por año de publicación.
-    Si el autor ya se había agregado: 
-        - Si el año de publicación también se había agregado, se obtiene la lista en el tercer nivel y se agrega el libro.
-        - Si el año de publicación no se había agregado, se agrega un nuevo mapa dentro del indice del autor y dentro de 
-        este mapa se agrega una lista con el libro asociado.
-    Si el autor no se había agregado:
-        - Se crea el indice del nuevo autor, se crea dentro del valor el mapa asociado al nuevo año de publicación y 
-        en el tercer nivel se agrega una lista como valor de este ultimo mapa con el libro asociado
+    Adiciona el libro al multimapa indexado por la pareja (autor, año de publicación).
+
+    Una sola tabla con llave compuesta reemplaza el mapa de años que antes se creaba
+    para cada autor, aunque la mayoría de autores solo tiene uno o dos años.
     """
     books_by_year_author = catalog['books_by_year_author']
     pub_year = book['original_publication_year']
     #Si el año de publicación está vacío se reemplaza por un valor simbolico
     #TODO Completar manejo de los escenarios donde el año de publicación es vacío.
-    author_value = lp.get(books_by_year_author,author_name)
-    if author_value:
-        pub_year_value = lp.get(author_value, pub_year)
-        if pub_year_value:
-            al.add_last(pub_year_value, book)
-        else:
-            pub_year_value = al.new_list()
-            al.add_last(pub_year_value, book)
-            lp.put(author_value, pub_year, pub_year_value)
-    else:
-     # TODO Completar escenario donde no se había agregado el autor al mapa principal
-        pub_year_map = lp.new_map(1000, 0.7)
-        pub_year_value = al.new_list()
-        al.add_last(pub_year_value, book)
-        lp.put(pub_year_map, pub_year, pub_year_value)
-        lp.put(books_by_year_author, author_name, pub_year_map)
+    mm.add(books_by_year_author, (author_name, pub_year), book)
         
     return catalog
 
@@ -243,22 +404,11 @@ def add_tag(catalog, tag):
 
 def add_book_tag(catalog, book_tag):
     """
-    Adiciona un tag a la lista de tags.
-    Si el book_tag ya había sido agregado:
-        - Se obtiene la lista asociada al valor del indice y se agrega el book_yag
-    Si el book_tag no había sido agregado:
-        - Se crea el nuevo indice en el mapa y como valor se agrega una nueva lista con el book_tag asociado.
+    Adiciona un book_tag al grupo de su tag_id en el multimapa book_tags.
+    Si el tag_id es nuevo, el multimapa crea su grupo.
     """
     t = new_book_tag(book_tag['tag_id'], book_tag['goodreads_book_id'], book_tag['count'])
-    book_tag_value = lp.contains(catalog['book_tags'],t['tag_id'])
-    if book_tag_value:
-        book_tag_list = lp.get(catalog['book_tags'],t['tag_id'])
-        al.add_last(book_tag_list,book_tag)
-    else:
-        #TODO Completar escenario donde el book_tag no se había agregado al mapa  
-        book_tag_list = al.new_list()
-        al.add_last(book_tag_list,book_tag)
-        lp.put(catalog['book_tags'],t['tag_id'],book_tag_list) 
+    mm.add(catalog['book_tags'], t['tag_id'], book_tag)
     return catalog
 
 #  -------------------------------------------------------------
@@ -278,7 +428,9 @@ def get_books_by_author(catalog, author_name):
     Retorna los libros asociado al autor ingresado por párametro
     """
     #TODO Completar función de consulta
-    books_by_author = lp.get(catalog["books_by_authors"],author_name)
+    books_by_author = mm.get_all(catalog["books_by_authors"], author_name)
+    if al.size(books_by_author) == 0:
+        return None
     return books_by_author
 
 
@@ -296,15 +448,56 @@ def get_books_by_tag(catalog, tag_name):
     books_by_tag = lp.get(catalog["tags"], tag_name)
     if books_by_tag:
         tag_id = books_by_tag["tag_id"]
-        books_by_tag = lp.get(catalog["book_tags"],tag_id)
-        return books_by_tag
+        books_by_tag = mm.get_all(catalog["book_tags"], tag_id)
+        if al.size(books_by_tag) > 0:
+            return books_by_tag
+
+
+def get_tagged_books(catalog, tag_name):
+    """
+    Retorna la lista de libros etiquetados con el tag_name especificado.
+    - Se obtienen las filas de book_tags del tag con get_books_by_tag.
+    - Los libros de todas las filas se buscan en books_by_id con una sola llamada a get_many.
+    Las filas cuyo libro no está en el catálogo quedan con None.
+    """
+    book_tags = get_books_by_tag(catalog, tag_name)
+    if book_tags is None:
+        return al.new_list()
+    book_ids = [row['goodreads_book_id'] for row in book_tags['elements']]
+    return lp.get_many(catalog['books_by_id'], book_ids)
+
+
+def get_books_by_year_range(catalog, year_initial, year_final):
+    """
+    Retorna la lista de libros publicados entre year_initial y year_final (incluidos),
+    ordenados por año. Usa el árbol books_by_year, así que solo se recorren los años del rango.
+    """
+    return flatten_ranges(rbt.values(catalog['books_by_year'], year_initial, year_final))
+
+
+def get_books_by_rating_range(catalog, rating_initial, rating_final):
+    """
+    Retorna la lista de libros con average_rating entre rating_initial y rating_final
+    (incluidos), ordenados por rating.
+    """
+    return flatten_ranges(rbt.values(catalog['books_by_rating'], rating_initial, rating_final))
+
+
+def flatten_ranges(book_lists):
+    """
+    Une en una sola lista los libros de las listas que retorna una consulta por rango del árbol.
+    """
+    books = al.new_list()
+    for book_list in book_lists['elements']:
+        for book in book_list['elements']:
+            al.add_last(books, book)
+    return books
 
 
 def get_books_by_author_pub_year(catalog, author_name, pub_year):
     """
-    - Se obtiene el mapa asociado al author_name dado
-    - Si el author existe, se obtiene el mapa asociado al año de publicación
-    Retorna los libros asociados a un autor y un año de publicación específicos
+    Retorna los libros asociados a un autor y un año de publicación específicos,
+    buscando la pareja (author_name, pub_year) en el mapa books_by_year_author.
     """
     # Iniciar medición de tiempo
     start_time = getTime()
@@ -315,9 +508,8 @@ def get_books_by_author_pub_year(catalog, author_name, pub_year):
     
     # TODO: Completar la función de consulta
     resultado = None  # Sustituir con la lógica real
-    books_by_author = lp.get(catalog["books_by_year_author"],author_name)
-    if books_by_author:
-        books_by_author_pub_year = lp.get(books_by_author,pub_year)
+    books_by_author_pub_year = mm.get_all(catalog["books_by_year_author"], (author_name, pub_year))
+    if al.size(books_by_author_pub_year) > 0:
         resultado = books_by_author_pub_year
     
     # Detener medición de memoria
@@ -340,7 +532,7 @@ def book_size(catalog):
 
 
 def author_size(catalog):
-    return lp.size(catalog['books_by_authors'])
+    return mm.key_count(catalog['books_by_authors'])
 
 
 def tag_size(catalog):
@@ -348,7 +540,7 @@ def tag_size(catalog):
 
 
 def book_tag_size(catalog):
-    return lp.size(catalog['book_tags'])
+    return mm.key_count(catalog['book_tags'])
 
 #  -------------------------------------------------------------
 # Funciones utilizadas para obtener memoria y tiempo
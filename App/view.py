@@ -91,8 +91,7 @@ def print_books_by_author(author, books_by_author):
     """
     if books_by_author:
         print(f"Para el autor {author} se encontraron los siguientes libros: " )
-        for book_pos in range(0, al.size(books_by_author)):
-            book = al.get_element(books_by_author, book_pos)
+        for book in al.iterator(books_by_author):
             print('Titulo: ' + book['title'] + '  ISBN: ' +
                   book['isbn'] + ' Rating: ' + book['average_rating'] +
                     ' Work text reviews count : ' + book['work_text_reviews_count'])
@@ -106,8 +105,7 @@ def print_books_by_tag(tag_name, books_by_tag):
     """
     if books_by_tag:
         print("Tag encontrado: " + tag_name)
-        for book_pos in range(0, al.size(books_by_tag)):
-            book = al.get_element(books_by_tag, book_pos)
+        for book in al.iterator(books_by_tag):
             print('Titulo: ' + book['title'] + '  ISBN: ' +
                   book['isbn'] + ' Rating: ' + book['average_rating'] +
                     ' Work text reviews count : ' + book['work_text_reviews_count'])
@@ -121,8 +119,7 @@ def print_books_by_auth_year(author, pub_year, books_by_author_year, tiempo_tran
     """
     if books_by_author_year:
         print(f"Para el autor {author}, se encontraron los siguientes libros publicados en el año {pub_year}:")
-        for book_pos in range(0, al.size(books_by_author_year)):
-            book = al.get_element(books_by_author_year, book_pos)
+        for book in al.iterator(books_by_author_year):
             print(f"Titulo: {book['title']}  ISBN: {book['isbn']}  Rating: {book['average_rating']}  "
                   f"Work text reviews count: {book['work_text_reviews_count']}")
     else:
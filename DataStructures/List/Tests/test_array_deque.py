@@ -0,0 +1,80 @@
+import pytest
+
+from DataStructures.List import array_deque as dq
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    # Lista circular pequeña para que las pruebas den la vuelta al arreglo y crezca
+    return dq.new_list(4)
+
+
+@handle_not_implemented
+def test_new_list():
+    lista = setup_tests()
+    assert dq.size(lista) == 0
+    assert dq.is_empty(lista)
+    assert lista["capacity"] == 4
+    assert dq.new_list(5)["capacity"] == 8
+
+
+@handle_not_implemented
+def test_add_first_add_last():
+    lista = setup_tests()
+    for i in range(3):
+        dq.add_last(lista, i)
+    for i in range(1, 4):
+        dq.add_first(lista, -i)
+
+    assert dq.size(lista) == 6
+    assert lista["capacity"] == 8
+    assert list(dq.iterator(lista)) == [-3, -2, -1, 0, 1, 2]
+    assert dq.get_element(lista, 0) == -3
+    assert dq.get_element(lista, 5) == 2
+    assert dq.first_element(lista) == -3
+    assert dq.last_element(lista) == 2
+    with pytest.raises(IndexError):
+        dq.get_element(lista, 6)
+
+
+@handle_not_implemented
+def test_remove():
+    lista = setup_tests()
+    with pytest.raises(IndexError):
+        dq.remove_first(lista)
+
+    # Cola que da varias vueltas al arreglo sin crecer
+    for i in range(20):
+        dq.add_last(lista, i)
+        if dq.size(lista) == 3:
+            assert dq.remove_first(lista) == i - 2
+    assert lista["capacity"] == 4
+    assert list(dq.iterator(lista)) == [18, 19]
+
+    assert dq.remove_last(lista) == 19
+    assert dq.remove_first(lista) == 18
+    assert dq.is_empty(lista)
+    assert lista["elements"] == [None] * 4
+
+
+@handle_not_implemented
+def test_to_array_list():
+    lista = setup_tests()
+    for i in range(10):
+        dq.add_first(lista, i)
+    array = dq.to_array_list(lista)
+    assert lt.size(array) == 10
+    assert array["elements"] == list(range(9, -1, -1))
+
+
+@handle_not_implemented
+def test_iterator_range_reverse():
+    lista = setup_tests()
+    for i in range(3):
+        dq.add_last(lista, i)
+    dq.add_first(lista, -1)
+
+    assert list(dq.iterator(lista, reverse=True)) == [2, 1, 0, -1]
+    assert list(dq.iterator(lista, 1, 3)) == [0, 1]
+    assert list(dq.iterator(lista, 1, 3, reverse=True)) == [1, 0]
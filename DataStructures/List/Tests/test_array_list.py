@@ -200,3 +200,18 @@ def test_sublist():
 
     assert sub_list is not None
     assert type(sub_list) == dict
+
+
+@handle_not_implemented
+def test_iterator():
+    lista = setup_tests()
+
+    lista["size"] = 5
+    lista["elements"] = [10, 20, 30, 40, 50]
+
+    assert list(lt.iterator(lista)) == [10, 20, 30, 40, 50]
+    assert list(lt.iterator(lista, reverse=True)) == [50, 40, 30, 20, 10]
+    assert list(lt.iterator(lista, 1, 4)) == [20, 30, 40]
+    assert list(lt.iterator(lista, 1, 4, reverse=True)) == [40, 30, 20]
+    assert list(lt.iterator(lista, 3, 10)) == [40, 50]
+    assert list(lt.iterator(setup_tests())) == []
@@ -109,4 +109,23 @@ def test_shell_sort():
     lt.shell_sort(inverted_list, sort_criteria_increasingly)
     assert lt.size(inverted_list) == 15
 
- 
\ No newline at end of file
+ 
+
+@handle_not_implemented
+def test_shell_sort_order():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    lt.shell_sort(random_lista, sort_criteria_increasingly)
+    assert list(lt.iterator(random_lista)) == ordered_list
+
+    lt.shell_sort(inverted_list, sort_criteria_increasingly)
+    assert list(lt.iterator(inverted_list)) == list(range(1, 16))
+
+
+@handle_not_implemented
+def test_insertion_sort_get_element():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    sorted_list = lt.insertion_sort(random_lista, sort_criteria_increasingly)
+    assert lt.get_element(sorted_list, 0) == 10
+    assert lt.get_element(sorted_list, 14) == 50
@@ -50,6 +50,23 @@ def test_merge_sort():
     lt.merge_sort(inverted_list, sort_criteria_increasingly)
     assert lt.size(inverted_list) == 15
 
+@handle_not_implemented
+def test_merge_sort_order():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    lt.merge_sort(random_lista, sort_criteria_increasingly)
+    assert random_lista["elements"] == ordered_list
+
+    lt.merge_sort(inverted_list, sort_criteria_increasingly)
+    assert inverted_list["elements"] == list(range(1, 16))
+
+    # Bloques de inserción más cortos que la lista para probar las mezclas y la estabilidad
+    pairs = lt.new_list()
+    for pair in [(2, "a"), (1, "b"), (2, "c"), (1, "d"), (0, "e"), (2, "f"), (0, "g")]:
+        lt.add_last(pairs, pair)
+    lt.merge_sort(pairs, lambda pair1, pair2: pair1[0] < pair2[0], 2)
+    assert [pair[1] for pair in pairs["elements"]] == ["e", "g", "b", "d", "a", "c", "f"]
+
 @handle_not_implemented
 def test_quick_sort():
     empty_list, one_element_list, random_lista, inverted_list = setup_tests()
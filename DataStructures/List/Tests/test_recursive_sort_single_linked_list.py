@@ -76,3 +76,24 @@ def test_quick_sort():
     lt.quick_sort(inverted_list, sort_criteria_increasingly)
     assert lt.size(inverted_list) == 15
 
+
+@handle_not_implemented
+def test_sorted_order():
+    # merge_sort y quick_sort reenlazan los nodos: se valida el orden, 'last' y la estabilidad
+    for sort in (lt.merge_sort, lt.quick_sort):
+        empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+        sort(random_lista, sort_criteria_increasingly)
+        assert list(lt.iterator(random_lista)) == ordered_list
+        assert lt.get_element(random_lista, 14) == 50
+        assert random_lista["last"]["info"] == 50
+        assert random_lista["last"]["next"] is None
+
+        sort(inverted_list, sort_criteria_increasingly)
+        assert list(lt.iterator(inverted_list)) == list(range(1, 16))
+
+        pairs = lt.new_list()
+        for pair in [(2, "a"), (1, "b"), (2, "c"), (1, "d"), (0, "e"), (2, "f")]:
+            lt.add_last(pairs, pair)
+        sort(pairs, lambda pair1, pair2: pair1[0] < pair2[0])
+        assert [pair[1] for pair in lt.iterator(pairs)] == ["e", "b", "d", "a", "c", "f"]
@@ -194,3 +194,40 @@ def test_sub_list():
 
     assert sub_list is not None
     assert type(sub_list) == dict
+
+
+@handle_not_implemented
+def test_iterator():
+    lista = setup_tests()
+
+    for element in [10, 20, 30, 40, 50]:
+        lt.add_last(lista, element)
+
+    assert list(lt.iterator(lista)) == [10, 20, 30, 40, 50]
+    assert list(lt.iterator(lista, reverse=True)) == [50, 40, 30, 20, 10]
+    assert list(lt.iterator(lista, 1, 4)) == [20, 30, 40]
+    assert list(lt.iterator(lista, 1, 4, reverse=True)) == [40, 30, 20]
+    assert list(lt.iterator(lista, 3, 10)) == [40, 50]
+    assert list(lt.iterator(setup_tests())) == []
+
+
+@handle_not_implemented
+def test_get_element_cursor():
+    lista = setup_tests()
+
+    for element in range(10):
+        lt.add_last(lista, element)
+
+    assert [lt.get_element(lista, pos) for pos in range(10)] == list(range(10))
+    assert lista["cursor"][0] == 8
+
+    # Acceso hacia atrás: se recorre de nuevo desde el primero
+    assert lt.get_element(lista, 3) == 3
+    assert lista["cursor"][0] == 3
+
+    # add_first corre las posiciones y borra el cursor
+    lt.add_first(lista, -1)
+    assert lista["cursor"] is None
+    assert lt.get_element(lista, 4) == 3
+    assert lt.sub_list(lista, 2, 3)["size"] == 3
+    assert list(lt.iterator(lt.sub_list(lista, 2, 3))) == [0, 1, 2]
@@ -0,0 +1,155 @@
+"""
+    Lista sobre un arreglo circular (**deque**), compañera de array_list.
+
+    Los elementos se guardan en un arreglo de capacidad potencia de dos a partir de la
+    posición 'first', dando la vuelta al final del arreglo. Agregar o quitar en cualquiera
+    de los dos extremos solo mueve 'first' o el tamaño, sin correr los demás elementos:
+    add_first, add_last, remove_first y remove_last son O(1) amortizado, mientras que en
+    array_list add_first y delete_element(0) copian toda la lista.
+
+    Las posiciones de get_element empiezan en 0, como en array_list.
+"""
+
+from DataStructures.List import array_list as al
+
+
+def new_list(capacity=8):
+    """
+    Crea una lista circular vacía.
+
+    La lista tiene los siguientes atributos:
+
+    * **elements**: Arreglo circular con capacity casillas.
+    * **first**: Casilla del arreglo en la que está el primer elemento.
+    * **size**: Número de elementos de la lista.
+    * **capacity**: Número de casillas del arreglo, siempre una potencia de dos.
+
+    :param capacity: Número de elementos que caben antes de crecer.
+    :type capacity: int
+
+    :return: Lista circular vacía.
+    :rtype: dict
+    """
+    capacity = max(1, capacity)
+    capacity = 1 << (capacity - 1).bit_length()
+    return {'elements': [None] * capacity, 'first': 0, 'size': 0, 'capacity': capacity}
+
+
+def grow(my_list):
+    """
+    Duplica la capacidad del arreglo y deja los elementos en orden desde la casilla 0.
+    """
+    elements = my_list['elements']
+    first = my_list['first']
+    my_list['elements'] = elements[first:] + elements[:first] + [None] * my_list['capacity']
+    my_list['first'] = 0
+    my_list['capacity'] *= 2
+    return my_list
+
+
+def add_first(my_list, element):
+    """
+    Agrega un elemento al inicio de la lista en O(1) amortizado.
+    """
+    if my_list['size'] == my_list['capacity']:
+        grow(my_list)
+    first = (my_list['first'] - 1) & (my_list['capacity'] - 1)
+    my_list['elements'][first] = element
+    my_list['first'] = first
+    my_list['size'] += 1
+    return my_list
+
+
+def add_last(my_list, element):
+    """
+    Agrega un elemento al final de la lista en O(1) amortizado.
+    """
+    if my_list['size'] == my_list['capacity']:
+        grow(my_list)
+    last = (my_list['first'] + my_list['size']) & (my_list['capacity'] - 1)
+    my_list['elements'][last] = element
+    my_list['size'] += 1
+    return my_list
+
+
+def remove_first(my_list):
+    """
+    Retira y retorna el primer elemento de la lista. Lanza IndexError si está vacía.
+    """
+    if my_list['size'] == 0:
+        raise IndexError("list index out of range")
+    first = my_list['first']
+    element = my_list['elements'][first]
+    my_list['elements'][first] = None  # No retiene la referencia al elemento retirado
+    my_list['first'] = (first + 1) & (my_list['capacity'] - 1)
+    my_list['size'] -= 1
+    return element
+
+
+def remove_last(my_list):
+    """
+    Retira y retorna el último elemento de la lista. Lanza IndexError si está vacía.
+    """
+    if my_list['size'] == 0:
+        raise IndexError("list index out of range")
+    last = (my_list['first'] + my_list['size'] - 1) & (my_list['capacity'] - 1)
+    element = my_list['elements'][last]
+    my_list['elements'][last] = None
+    my_list['size'] -= 1
+    return element
+
+
+def get_element(my_list, index):
+    """
+    Retorna el elemento en la posición index (desde 0). Lanza IndexError si no existe.
+    """
+    if index < 0 or index >= my_list['size']:
+        raise IndexError("list index out of range")
+    return my_list['elements'][(my_list['first'] + index) & (my_list['capacity'] - 1)]
+
+
+def first_element(my_list):
+    """Retorna el primer elemento sin retirarlo. Lanza IndexError si la lista está vacía."""
+    return get_element(my_list, 0)
+
+
+def last_element(my_list):
+    """Retorna el último elemento sin retirarlo. Lanza IndexError si la lista está vacía."""
+    return get_element(my_list, my_list['size'] - 1)
+
+
+def size(my_list):
+    """Retorna el número de elementos de la lista."""
+    return my_list['size']
+
+
+def is_empty(my_list):
+    """Indica si la lista no tiene elementos."""
+    return my_list['size'] == 0
+
+
+def iterator(my_list, start=0, stop=None, reverse=False):
+    """
+    Recorre los elementos de las posiciones [start, stop), del primero al último o, con
+    reverse=True, del último al primero. Si stop es None se recorre hasta el final.
+    """
+    elements = my_list['elements']
+    first = my_list['first']
+    mask = my_list['capacity'] - 1
+    if stop is None or stop > my_list['size']:
+        stop = my_list['size']
+    start = max(start, 0)
+    positions = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+    for index in positions:
+        yield elements[(first + index) & mask]
+
+
+def to_array_list(my_list):
+    """
+    Retorna una lista (array_list) con los elementos en orden, para usar las funciones
+    de array_list que no tiene la lista circular (ordenamientos, sub_list).
+    """
+    result = al.new_list()
+    result['elements'] = list(iterator(my_list))
+    result['size'] = my_list['size']
+    return result
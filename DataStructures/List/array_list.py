@@ -81,9 +81,17 @@ def sub_list(my_list, pos_i, num_elements):
     }
     return sublist
 
-def iterator(lst):
-   
-    return [element for element in lst] 
+def iterator(my_list, start=0, stop=None, reverse=False):
+    #Recorre los elementos de la lista en las posiciones [start, stop), sin copiarlos.
+    #Si stop es None se recorre hasta el final. Con reverse=True se recorre el mismo rango del último al primero.
+    #Es un generador: usa O(1) memoria adicional y se puede abandonar en cualquier momento.
+    elements = my_list['elements']
+    if stop is None or stop > my_list['size']:
+        stop = my_list['size']
+    start = max(start, 0)
+    positions = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+    for pos in positions:
+        yield elements[pos]
 
 def default_sort_criteria(element_1, element_2):
     
@@ -138,42 +146,61 @@ def shellSort(my_list, sort_crit):
         gap //= 2
     return my_list
 
-def merge(my_list, l, m, r, sort_crit):
-    elements = my_list["elements"]
-    n1 = m - l + 1
-    n2 = r - m
-    L = elements[l:m + 1]
-    R = elements[m + 1:r + 1]
-    i = 0     
-    j = 0     
-    k = l    
-
-    while i < n1 and j < n2:
-        if sort_crit(L[i], R[j]) < 0:
-            elements[k] = L[i]
-            i += 1
-        else:
-            elements[k] = R[j]
+def merge_sort(my_list, sort_crit, cutoff=16):
+    #Ordena la lista con Merge Sort iterativo de abajo hacia arriba, estable y sin recursión.
+    #Primero ordena bloques de cutoff elementos con inserción, que es rápida en bloques cortos y ya ordenados.
+    #Luego mezcla bloques vecinos de tamaño 1, 2, 4... veces cutoff usando un único buffer auxiliar de n casillas.
+    #Si el último elemento del bloque izquierdo no es mayor que el primero del derecho, ya están en orden y no se mezclan:
+    #una lista ordenada cuesta O(n) y cualquier otra O(n log n).
+    elements = my_list['elements']
+    n = my_list['size']
+    if n < 2:
+        return my_list
+
+    for lo in range(0, n, cutoff):
+        insertion_sort_range(elements, lo, min(lo + cutoff, n), sort_crit)
+
+    buffer = [None] * n
+    width = cutoff
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            mid = lo + width
+            if sort_crit(elements[mid], elements[mid - 1]):
+                merge(elements, buffer, lo, mid, min(lo + 2 * width, n), sort_crit)
+        width *= 2
+    return my_list
+
+def insertion_sort_range(elements, lo, hi, sort_crit):
+    #Ordena por inserción las posiciones [lo, hi) de elements. Es estable.
+    for i in range(lo + 1, hi):
+        current_value = elements[i]
+        position = i
+        while position > lo and sort_crit(current_value, elements[position - 1]):
+            elements[position] = elements[position - 1]
+            position -= 1
+        elements[position] = current_value
+    return elements
+
+def merge(elements, buffer, lo, mid, hi, sort_crit):
+    #Mezcla los bloques ordenados [lo, mid) y [mid, hi) de elements.
+    #Copia el bloque izquierdo en el buffer y mezcla hacia elements; el resto del bloque derecho ya queda en su lugar.
+    #Ante elementos equivalentes va primero el del bloque izquierdo, lo que hace estable el ordenamiento.
+    for k in range(lo, mid):
+        buffer[k] = elements[k]
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if sort_crit(elements[j], buffer[i]):
+            elements[k] = elements[j]
             j += 1
+        else:
+            elements[k] = buffer[i]
+            i += 1
         k += 1
-    while i < n1:
-        elements[k] = L[i]
+    while i < mid:
+        elements[k] = buffer[i]
         i += 1
         k += 1
-    while j < n2:
-        elements[k] = R[j]
-        j += 1
-        k += 1
-    return my_list
-        
-def mergeSort(my_list, l, r, sort_crit):
-    
-    if l < r:
-        m = l+(r-l)//2
-        mergeSort(my_list, l, r, sort_crit)
-        mergeSort(my_list, m + 1, r, sort_crit)
-        merge(my_list, l, m, r, sort_crit)
-    return my_list
+    return elements
 
 def partition(my_list, low, high, sort_crit):
     elements = my_list["elements"]
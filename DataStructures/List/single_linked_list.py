@@ -1,18 +1,18 @@
+import random
+
 def new_list():
     newlist = {
         "first": None,
         "last": None,
         "size": 0,
+        "cursor": None,
     }
     return newlist
 
 def get_element(my_list, pos):
-    searchpos = 0
-    node = my_list["first"]
-    while searchpos < pos:
-        node = node["next"]
-        searchpos += 1
-    return node["info"]
+    #Retorna el elemento en la posición pos (0-based).
+    #Parte del último nodo consultado (cursor) si está antes de pos, así un ciclo por posiciones es lineal.
+    return get_node_at(my_list, pos)["info"]
         
 def is_present(my_list, element, cmp_function):
     is_in_array = False
@@ -39,6 +39,8 @@ def add_first(my_list, element):
         my_list['last'] = new_node
     
     my_list['first'] = new_node
+    #Las posiciones de los nodos existentes se corren en 1, el cursor deja de ser válido
+    my_list['cursor'] = None
     my_list['size'] += 1
     
     return my_list
@@ -80,21 +82,48 @@ def sub_list(my_list, pos_i, num_elements):
         raise IndexError("Posición fuera de rango.")
 
     new_sublist = new_list()  
-    current = my_list["first"]
-    index = 1
+    current = get_node_at(my_list, pos_i - 1)
 
     while current is not None and num_elements > 0:
-        if index >= pos_i:
-            add_last(new_sublist, current["info"])
-            num_elements -= 1
+        add_last(new_sublist, current["info"])
+        num_elements -= 1
         current = current["next"]
-        index += 1
 
     return new_sublist
 
-def iterator(lst):
-   
-    return [element for element in lst]
+def iterator(my_list, start=0, stop=None, reverse=False):
+    """
+    Recorre los elementos de la lista en las posiciones [start, stop) siguiendo los nodos,
+    en O(n) total en vez de un get_element por posición. Si stop es None se recorre hasta
+    el final.
+
+    Hacia adelante es un generador con O(1) memoria adicional. Los nodos solo enlazan al
+    siguiente, así que con reverse=True se guardan los elementos del rango en una pila
+    (O(n) memoria) y se recorren del último al primero.
+    """
+    if stop is None or stop > my_list['size']:
+        stop = my_list['size']
+    start = max(start, 0)
+    node = my_list['first']
+    pos = 0
+    while pos < start and node is not None:
+        node = node['next']
+        pos += 1
+
+    if reverse:
+        stack = []
+        while pos < stop:
+            stack.append(node['info'])
+            node = node['next']
+            pos += 1
+        while stack:
+            yield stack.pop()
+        return
+
+    while pos < stop:
+        yield node['info']
+        node = node['next']
+        pos += 1
 
 def selection_sort(my_list, sort_crit):
     
@@ -154,12 +183,27 @@ def insertion_sort(my_list, sort_crit):
     return sorted_list
 
 def get_node_at(my_list, pos):
-    """Devuelve el nodo en la posición 'pos' (0-based)."""
-    current = my_list["first"]
-    index = 0
+    """
+    Devuelve el nodo en la posición 'pos' (0-based).
+
+    La lista recuerda en 'cursor' la pareja (posición, nodo) de la última consulta. Si
+    pos está en o después del cursor el recorrido continúa desde ahí en vez de desde
+    'first', de modo que consultar las posiciones en orden cuesta O(n) en total. Las
+    operaciones que cambian la posición de los nodos (add_first) borran el cursor.
+    """
+    # Las listas que retorna insertion_sort no tienen 'last': se recorren desde el cursor
+    if pos == my_list["size"] - 1 and my_list.get("last") is not None:
+        return my_list["last"]
+    cursor = my_list.get("cursor")
+    if cursor is not None and cursor[0] <= pos:
+        index, current = cursor
+    else:
+        index, current = 0, my_list["first"]
     while current and index < pos:
         current = current["next"]
         index += 1
+    if current is not None:
+        my_list["cursor"] = (index, current)
     return current
 
 def swap_nodes(node1, node2):
@@ -167,61 +211,115 @@ def swap_nodes(node1, node2):
     node1["info"], node2["info"] = node2["info"], node1["info"]
 
 def shell_sort(my_list, sort_crit):
-    """Ordena la lista enlazada usando Shell Sort."""
-    n = my_list["size"]
-    gap = n // 2
+    """
+    Ordena la lista enlazada usando Shell Sort con la secuencia de saltos de Knuth
+    (1, 4, 13, 40, ...).
+
+    Los saltos necesitan acceso por posición, que en una lista enlazada es O(n) por
+    consulta; por eso los elementos se copian a un arreglo (O(n) memoria), se ordenan
+    ahí y se escriben de vuelta en los nodos en una sola pasada.
+    """
+    elements = list(iterator(my_list))
+    n = len(elements)
+    gap = 1
+    while gap < n // 3:
+        gap = 3 * gap + 1
 
     while gap > 0:
         for i in range(gap, n):
-            temp_node = get_node_at(my_list, i)
+            temp = elements[i]
             j = i
-
-            while j >= gap and sort_crit(get_node_at(my_list, j - gap)["info"], temp_node["info"]) > 0:
-                swap_nodes(get_node_at(my_list, j), get_node_at(my_list, j - gap))
+            while j >= gap and sort_crit(temp, elements[j - gap]):
+                elements[j] = elements[j - gap]
                 j -= gap
+            elements[j] = temp
+        gap //= 3
 
-        gap //= 2
-
+    node = my_list["first"]
+    for element in elements:
+        node["info"] = element
+        node = node["next"]
     return my_list
 
 def merge_sort(my_list, sort_crit):
-    """Ordena la lista enlazada usando Merge Sort."""
-    if my_list["size"] <= 1:
-        return my_list
+    """
+    Ordena la lista enlazada usando Merge Sort natural de abajo hacia arriba.
 
-    mid = my_list["size"] // 2
-    left_list = sub_list(my_list, 1, mid)  # Corregido: inicio desde 1
-    right_list = sub_list(my_list, mid + 1, my_list["size"] - mid)
+    Cada pasada recorre la lista separando corridas ya ordenadas (las descendentes se
+    invierten) y mezcla las corridas de dos en dos reenlazando los nodos, hasta que queda
+    una sola. No se crean nodos ni listas: O(1) memoria adicional y O(n log r) tiempo
+    para r corridas, O(n) si la lista ya estaba ordenada. Es estable.
+    """
+    if my_list["size"] < 2:
+        return my_list
 
-    left_sorted = merge_sort(left_list, sort_crit)
-    right_sorted = merge_sort(right_list, sort_crit)
+    head = my_list["first"]
+    while True:
+        sentinel = {"info": None, "next": None}
+        tail = sentinel
+        runs = 0
+        node = head
+        while node is not None:
+            left, node = split_run(node, sort_crit)
+            right = None
+            if node is not None:
+                right, node = split_run(node, sort_crit)
+            tail = merge_runs(tail, left, right, sort_crit)
+            runs += 1
+        head = sentinel["next"]
+        if runs == 1:
+            break
+
+    my_list["first"] = head
+    my_list["last"] = tail
+    my_list["cursor"] = None
+    return my_list
 
-    return merge(left_sorted, right_sorted, sort_crit)
+def split_run(node, sort_crit):
+    """
+    Separa la corrida ordenada que empieza en node. Una corrida estrictamente
+    descendente se invierte para que quede ascendente.
 
-def merge(left, right, sort_crit):
-    """Fusiona dos listas enlazadas ordenadas en una sola lista enlazada ordenada."""
-    merged_list = new_list()
-    left_node = left["first"]
-    right_node = right["first"]
+    Retorna la pareja (primer nodo de la corrida, nodo siguiente a la corrida).
+    """
+    following = node["next"]
+    if following is not None and sort_crit(following["info"], node["info"]):
+        previous = None
+        current = node
+        while current is not None and (previous is None or sort_crit(current["info"], previous["info"])):
+            following = current["next"]
+            current["next"] = previous
+            previous = current
+            current = following
+        return previous, current
+
+    last = node
+    while following is not None and not sort_crit(following["info"], last["info"]):
+        last = following
+        following = last["next"]
+    last["next"] = None
+    return node, following
+
+def merge_runs(tail, left, right, sort_crit):
+    """
+    Mezcla las corridas left y right (right puede ser None) y las enlaza después de tail.
+    Ante elementos equivalentes va primero el de left, lo que hace estable el ordenamiento.
 
-    while left_node and right_node:
-        if sort_crit(left_node["info"], right_node["info"]) <= 0:
-            add_last(merged_list, left_node["info"])
-            left_node = left_node["next"]
+    Retorna el último nodo de la mezcla.
+    """
+    while left is not None and right is not None:
+        if sort_crit(right["info"], left["info"]):
+            tail["next"] = right
+            right = right["next"]
         else:
-            add_last(merged_list, right_node["info"])
-            right_node = right_node["next"]
-
-    while left_node:
-        add_last(merged_list, left_node["info"])
-        left_node = left_node["next"]
+            tail["next"] = left
+            left = left["next"]
+        tail = tail["next"]
 
-    while right_node:
-        add_last(merged_list, right_node["info"])
-        right_node = right_node["next"]
-
-    merged_list["size"] = left["size"] + right["size"]  # Corregido
-    return merged_list
+    tail["next"] = left if left is not None else right
+    while tail["next"] is not None:
+        tail = tail["next"]
+    return tail
 
 def get_previous(my_list, node):
     """Devuelve el nodo anterior a 'node' en la lista."""
@@ -232,27 +330,69 @@ def get_previous(my_list, node):
         current = current["next"]
     return current
 
-def partition(my_list, low, high, sort_crit):
-    """Realiza la partición de la lista enlazada para QuickSort."""
-    pivot = high["info"]
-    i = low
-
-    j = low
-    while j is not high:
-        if sort_crit(j["info"], pivot) < 0:
-            i["info"], j["info"] = j["info"], i["info"]
-            i = i["next"]
-        j = j["next"]
-
-    i["info"], high["info"] = high["info"], i["info"]
-    return i
+def partition(first, pivot, sort_crit):
+    """
+    Reparte los nodos de la cadena que empieza en first en tres cadenas: menores,
+    equivalentes y mayores que pivot, conservando el orden relativo de los nodos.
 
-def quick_sort(my_list, low, high, sort_crit):
-    """Ordena la lista enlazada usando QuickSort."""
-    if low is not None and high is not None and low != high and low != high["next"]:
-        pivot = partition(my_list, low, high, sort_crit)
+    Retorna una lista [primero, último, tamaño] por cada cadena.
+    """
+    chains = [[None, None, 0], [None, None, 0], [None, None, 0]]
+    node = first
+    while node is not None:
+        following = node["next"]
+        node["next"] = None
+        if sort_crit(node["info"], pivot):
+            chain = chains[0]
+        elif sort_crit(pivot, node["info"]):
+            chain = chains[2]
+        else:
+            chain = chains[1]
+        if chain[0] is None:
+            chain[0] = node
+        else:
+            chain[1]["next"] = node
+        chain[1] = node
+        chain[2] += 1
+        node = following
+    return chains
 
-        quick_sort(my_list, low, get_previous(my_list, pivot), sort_crit)
-        quick_sort(my_list, pivot["next"], high, sort_crit)
+def quick_sort_nodes(first, size, sort_crit):
+    """
+    Ordena la cadena de size nodos que empieza en first con QuickSort de tres vías y
+    pivote aleatorio, reenlazando los nodos. Retorna la pareja (primero, último).
+    """
+    if size < 2:
+        return first, first
+
+    pivot = first
+    for _ in range(random.randrange(size)):
+        pivot = pivot["next"]
+    less, equal, greater = partition(first, pivot["info"], sort_crit)
+
+    less_first, less_last = quick_sort_nodes(less[0], less[2], sort_crit)
+    greater_first, greater_last = quick_sort_nodes(greater[0], greater[2], sort_crit)
+
+    first, last = equal[0], equal[1]
+    if less_first is not None:
+        less_last["next"] = first
+        first = less_first
+    if greater_first is not None:
+        last["next"] = greater_first
+        last = greater_last
+    return first, last
+
+def quick_sort(my_list, sort_crit):
+    """
+    Ordena la lista enlazada usando QuickSort.
 
-    return my_list
\ No newline at end of file
+    Cada partición reparte los nodos en tres cadenas (menores, equivalentes y mayores que
+    el pivote) en una sola pasada y las vuelve a enlazar, sin buscar nodos anteriores.
+    El pivote aleatorio da profundidad de recursión O(log n) esperada, también en listas
+    ya ordenadas. Es estable.
+    """
+    first, last = quick_sort_nodes(my_list["first"], my_list["size"], sort_crit)
+    my_list["first"] = first
+    my_list["last"] = last
+    my_list["cursor"] = None
+    return my_list
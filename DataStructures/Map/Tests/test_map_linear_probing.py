@@ -176,3 +176,313 @@ def test_rehash():
 
     for i in range(5):
         assert mp.contains(map, i)
+
+
+@handle_not_implemented
+def test_remove_reuses_deleted_slot():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    mp.remove(map, 1)
+    assert map["tombstones"] == 1
+
+    mp.put(map, 1, "B")
+    assert map["tombstones"] == 0
+    assert mp.size(map) == 1
+    assert mp.get(map, 1) == "B"
+
+
+@handle_not_implemented
+def test_churn_compacts_deleted_slots():
+    map = mp.new_map(5, 0.5, 7)
+    for i in range(200):
+        mp.put(map, i, i)
+        if i >= 3:
+            mp.remove(map, i - 3)
+
+        assert map["size"] + map["tombstones"] <= map["limit_factor"] * map["capacity"]
+
+    assert mp.size(map) == 3
+    for i in range(197, 200):
+        assert mp.get(map, i) == i
+    assert not mp.contains(map, 0)
+
+
+@handle_not_implemented
+def test_robin_hood():
+    map = mp.new_map(5, 0.5, 7, robin_hood=True)
+    for i in range(100):
+        mp.put(map, i * 7, i)
+    for i in range(0, 100, 2):
+        mp.remove(map, i * 7)
+
+    assert mp.size(map) == 50
+    assert map["tombstones"] == 0
+    for i in range(100):
+        assert mp.contains(map, i * 7) == (i % 2 == 1)
+    assert mp.get(map, 3 * 7) == 3
+    assert mp.get(map, 2 * 7) is None
+
+    # Cada entrada está a lo sumo una casilla más desplazada que la anterior
+    table = map["table"]
+    capacity = map["capacity"]
+    for pos in range(capacity):
+        next_pos = (pos + 1) % capacity
+        if table["keys"][next_pos] is not None:
+            next_dist = (next_pos - table["hashes"][next_pos] % capacity) % capacity
+            if table["keys"][pos] is None:
+                assert next_dist == 0
+            else:
+                dist = (pos - table["hashes"][pos] % capacity) % capacity
+                assert next_dist <= dist + 1
+
+
+@handle_not_implemented
+def test_displacement_stats():
+    map = mp.new_map(5, 0.5, 7)
+    assert mp.displacement_stats(map) == {"max_displacement": 0, "mean_displacement": 0}
+
+    mp.put(map, 0, "A")
+    mp.put(map, map["prime"], "B")
+    stats = mp.displacement_stats(map)
+    assert stats["max_displacement"] == 1
+    assert stats["mean_displacement"] == 0.5
+
+
+@handle_not_implemented
+def test_incremental_rehash():
+    map = mp.new_map(5, 0.5, 7, incremental=True)
+    migrating = False
+    for i in range(100):
+        mp.put(map, i, str(i))
+        if i % 10 == 0:
+            mp.remove(map, i // 2)
+        migrating = migrating or map["old_table"] is not None
+
+    assert migrating
+    assert mp.size(map) == 90
+    assert lt.size(mp.key_set(map)) == 90
+    for i in range(100):
+        expected = None if (i % 5 == 0 and i < 50) else str(i)
+        assert mp.get(map, i) == expected
+        assert mp.contains(map, i) == (expected is not None)
+
+    # Actualizar una llave que sigue en la tabla anterior no cambia el tamaño
+    mp.put(map, 99, "X")
+    assert mp.get(map, 99) == "X"
+    assert mp.size(map) == 90
+
+
+@handle_not_implemented
+def test_from_items():
+    items = [(i, str(i)) for i in range(100)] + [(0, "cero")]
+    map = mp.from_items(items, 0.5)
+    assert mp.size(map) == 100
+    assert map["capacity"] == mf.next_capacity(202)
+    assert mp.get(map, 0) == "cero"
+    assert mp.get(map, 99) == "99"
+    assert not mp.contains(map, 100)
+
+
+@handle_not_implemented
+def test_put_all():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, "a", 1)
+    # La estimación se queda corta: la tabla debe crecer sin perder entradas
+    mp.put_all(map, ((i, i * 2) for i in range(100)), size_hint=10)
+    assert mp.size(map) == 101
+    assert map["size"] <= map["limit_factor"] * map["capacity"]
+    assert mp.get(map, "a") == 1
+    for i in range(100):
+        assert mp.get(map, i) == i * 2
+
+
+@handle_not_implemented
+def test_put_all_with_tombstones():
+    # Entradas vivas más casillas borradas no deben llenar la tabla
+    for size_hint in (None, 0):
+        map = mp.new_map(100, 0.7, min_load_factor=0)
+        for i in range(95):
+            mp.put(map, i, i)
+        for i in range(95):
+            mp.remove(map, i)
+        mp.put_all(map, ((i, i) for i in range(95, 197)), size_hint=size_hint)
+        assert mp.size(map) == 102
+        assert map["size"] + map["tombstones"] <= map["limit_factor"] * map["capacity"]
+        assert map["table"]["keys"].count(None) > 0
+        assert mp.get(map, 196) == 196
+        assert not mp.contains(map, 10**9 + 7)
+
+
+@handle_not_implemented
+def test_stats():
+    map = mp.new_map(5, 0.5, 7)
+    # Las llaves 0, 7 y 14 caen en la casilla 0 y forman un cluster de 3
+    mp.put(map, 0, "A")
+    mp.put(map, 7, "B")
+    mp.put(map, 14, "C")
+    mp.put(map, 5, "D")
+    mp.remove(map, 5)
+
+    stats = mp.stats(map)
+    assert stats["size"] == 3
+    assert stats["capacity"] == 11
+    assert stats["hit_probe_max"] == 3
+    assert stats["hit_probe_mean"] == 2
+    assert stats["cluster_histogram"] == {3: 1, 1: 1}
+    assert stats["miss_probe_max"] == 4
+    assert stats["tombstone_ratio"] == 1 / 11
+    assert stats["rehash_count"] == 0
+
+    for i in range(20):
+        mp.put(map, i, i)
+    stats = mp.stats(map)
+    assert stats["rehash_count"] > 0
+    assert stats["rehash_time"] >= 0
+    assert stats["tombstone_ratio"] == 0
+
+
+@handle_not_implemented
+def test_power_of_two():
+    map = mp.new_map(5, 0.5, 7, power_of_two=True)
+    assert map["capacity"] == 16
+    for i in range(100):
+        mp.put(map, "key" + str(i), i)
+
+    assert map["capacity"] & (map["capacity"] - 1) == 0
+    assert mp.size(map) == 100
+    for i in range(100):
+        assert mp.get(map, "key" + str(i)) == i
+    mp.remove(map, "key0")
+    assert not mp.contains(map, "key0")
+    assert mf.hash_value(map, "key1") == mf.mix_hash("key1") & (map["capacity"] - 1)
+
+
+@handle_not_implemented
+def test_capacity_primes():
+    for n in (0, 10, 1428, 5000, 2 ** 31):
+        capacity = mf.next_capacity(n)
+        assert capacity > n
+        assert mf.is_prime(capacity)
+        assert capacity in mf.CAPACITY_PRIMES
+
+    for n in (-1, 1, 2, 13, 1428, 99991, mf.SIEVE_MAX - 1, mf.SIEVE_MAX + 5):
+        prime = mf.next_prime(n)
+        assert prime > n and mf.is_prime(prime)
+        assert not any(mf.is_prime(x) for x in range(n + 1, prime))
+
+    map = mp.new_map(1000, 0.7)
+    capacity = map["capacity"]
+    mp.rehash(map)
+    assert map["capacity"] == mf.CAPACITY_PRIMES[mf.CAPACITY_PRIMES.index(capacity) + 1]
+
+
+@handle_not_implemented
+def test_shrink_on_remove():
+    map = mp.new_map(10, 0.5)
+    initial_capacity = map["capacity"]
+    for i in range(1000):
+        mp.put(map, i, str(i))
+    peak_capacity = map["capacity"]
+
+    for i in range(990):
+        mp.remove(map, i)
+    assert map["capacity"] < peak_capacity
+    assert map["capacity"] >= initial_capacity
+    assert mp.size(map) == 10
+    assert lt.size(mp.key_set(map)) == 10
+    for i in range(990, 1000):
+        assert mp.get(map, i) == str(i)
+
+    # Sin llaves la tabla vuelve a la capacidad inicial, nunca a una menor
+    for i in range(990, 1000):
+        mp.remove(map, i)
+    assert map["capacity"] == initial_capacity
+
+    fixed = mp.new_map(10, 0.5, min_load_factor=0)
+    for i in range(1000):
+        mp.put(fixed, i, i)
+    capacity = fixed["capacity"]
+    for i in range(1000):
+        mp.remove(fixed, i)
+    assert fixed["capacity"] == capacity
+
+
+@handle_not_implemented
+def test_iterators():
+    map = mp.new_map(5, 0.5)
+    for i in range(50):
+        mp.put(map, i, str(i))
+    mp.remove(map, 7)
+
+    assert sorted(mp.iter_keys(map)) == [i for i in range(50) if i != 7]
+    assert sorted(mp.iter_values(map)) == sorted(str(i) for i in range(50) if i != 7)
+    assert dict(mp.iter_items(map)) == {i: str(i) for i in range(50) if i != 7}
+
+    # El recorrido se puede abandonar sin visitar toda la tabla
+    keys = mp.iter_keys(map)
+    first = next(keys)
+    assert mp.contains(map, first)
+    assert list(mp.iter_items(mp.new_map(5, 0.5))) == []
+
+
+@handle_not_implemented
+def test_get_or_insert_and_update():
+    map = mp.new_map(5, 0.5)
+    created = []
+
+    def factory():
+        created.append(1)
+        return lt.new_list()
+
+    for i in range(40):
+        lt.add_last(mp.get_or_insert(map, i % 10, factory), i)
+    assert len(created) == 10
+    assert mp.size(map) == 10
+    assert lt.size(mp.get(map, 3)) == 4
+
+    for word in ["a", "b", "a", "c", "a"]:
+        mp.update(map, word, lambda count: count + 1, 0)
+    assert mp.get(map, "a") == 3
+    assert mp.get(map, "c") == 1
+    assert mp.update(map, "b", lambda count: count * 10) == 10
+    assert mp.size(map) == 13
+
+    # Durante un rehash incremental las llaves sin migrar conservan su valor
+    counts = mp.new_map(5, 0.5, incremental=True)
+    for i in range(600):
+        mp.update(counts, i % 200, lambda count: count + 1, 0)
+    assert mp.size(counts) == 200
+    assert all(mp.get(counts, i) == 3 for i in range(200))
+
+
+@handle_not_implemented
+def test_get_many():
+    map = mp.new_map(5, 0.5, incremental=True)
+    for i in range(300):
+        mp.put(map, "key" + str(i), i)
+    mp.remove(map, "key5")
+
+    keys = ["key299", "key5", "nope", "key0", "key299"]
+    values = mp.get_many(map, keys)
+    assert values["elements"] == [299, None, None, 0, 299]
+    assert lt.size(values) == 5
+
+    key_list = lt.new_list()
+    for i in range(300):
+        lt.add_last(key_list, "key" + str(i))
+    values = mp.get_many(map, key_list)
+    assert values["elements"] == [mp.get(map, "key" + str(i)) for i in range(300)]
+    assert lt.size(mp.get_many(map, [])) == 0
+
+    pow2 = mp.new_map(5, 0.5, power_of_two=True)
+    mp.put(pow2, (1, 2), "a")
+    assert mp.get_many(pow2, [(1, 2), (2, 1)])["elements"] == ["a", None]
+
+    # Tabla sin casillas vacías: el sondeo de una llave ausente debe terminar
+    full = mp.new_map(5, 0.5, 7)
+    mp.put(full, "a", 1)
+    keys = full["table"]["keys"]
+    for pos in range(full["capacity"]):
+        if keys[pos] is None:
+            keys[pos] = "__EMPTY__"
+    assert mp.get_many(full, ["nope", "a"])["elements"] == [None, 1]
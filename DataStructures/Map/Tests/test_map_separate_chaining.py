@@ -142,3 +142,260 @@ def test_rehash():
     for i in range(6):
         assert mp.contains(map, i)
         assert mp.get(map, i) == i*10
+
+
+@handle_not_implemented
+def test_incremental_rehash():
+    map = mp.new_map(5, 0.5, 7, incremental=True)
+    migrating = False
+    for i in range(100):
+        mp.put(map, i, i * 10)
+        if i % 10 == 0:
+            mp.remove(map, i // 2)
+        migrating = migrating or map["old_table"] is not None
+
+    assert migrating
+    assert mp.size(map) == 90
+    assert lt.size(mp.key_set(map)) == 90
+    assert lt.size(mp.value_set(map)) == 90
+    for i in range(100):
+        expected = None if (i % 5 == 0 and i < 50) else i * 10
+        assert mp.get(map, i) == expected
+        assert mp.contains(map, i) == (expected is not None)
+
+    mp.put(map, 99, -1)
+    assert mp.get(map, 99) == -1
+    assert mp.size(map) == 90
+
+
+@handle_not_implemented
+def test_entries_keep_hash():
+    map = mp.new_map(5, 0.5, 7)
+    for i in range(20):
+        mp.put(map, "key" + str(i), i)
+
+    for i in range(map["capacity"]):
+        for entry in mp.bucket_entries(lt.get_element(map["table"], i)):
+            assert me.get_hash(entry) == mf.full_hash(map, me.get_key(entry))
+            assert me.get_hash(entry) % map["capacity"] == i
+
+
+@handle_not_implemented
+def test_from_items():
+    items = [(i, str(i)) for i in range(100)] + [(0, "cero")]
+    map = mp.from_items(items, 0.5)
+    assert mp.size(map) == 100
+    assert map["capacity"] == mf.next_capacity(202)
+    assert mp.get(map, 0) == "cero"
+    assert mp.get(map, 99) == "99"
+    assert not mp.contains(map, 100)
+
+
+@handle_not_implemented
+def test_put_all():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, "a", 1)
+    # La estimación se queda corta: la tabla debe crecer sin perder entradas
+    mp.put_all(map, ((i, i * 2) for i in range(100)), size_hint=10)
+    assert mp.size(map) == 101
+    assert map["size"] <= map["limit_factor"] * map["capacity"]
+    assert mp.get(map, "a") == 1
+    for i in range(100):
+        assert mp.get(map, i) == i * 2
+
+
+@handle_not_implemented
+def test_stats():
+    map = mp.new_map(5, 0.5, 7)
+    stats = mp.stats(map)
+    assert stats["chain_histogram"] == {0: map["capacity"]}
+    assert stats["hit_probe_max"] == 0
+
+    for i in range(4):
+        mp.put(map, i, i)
+    stats = mp.stats(map)
+    assert stats["size"] == 4
+    assert sum(stats["chain_histogram"].values()) == map["capacity"]
+    assert sum(length * count for length, count in stats["chain_histogram"].items()) == 4
+    assert stats["miss_probe_mean"] == 4 / map["capacity"]
+    assert stats["hit_probe_max"] >= 1
+    assert stats["rehash_count"] == 0
+
+    for i in range(10):
+        mp.put(map, i, i)
+    assert mp.stats(map)["rehash_count"] > 0
+
+
+@handle_not_implemented
+def test_power_of_two():
+    map = mp.new_map(5, 0.5, 7, power_of_two=True)
+    assert map["capacity"] == 16
+    for i in range(100):
+        mp.put(map, "key" + str(i), i)
+
+    assert map["capacity"] & (map["capacity"] - 1) == 0
+    assert mp.size(map) == 100
+    for i in range(100):
+        assert mp.get(map, "key" + str(i)) == i
+    mp.remove(map, "key0")
+    assert not mp.contains(map, "key0")
+    assert mf.hash_value(map, "key1") == mf.mix_hash("key1") & (map["capacity"] - 1)
+
+
+@handle_not_implemented
+def test_lazy_buckets():
+    map = mp.new_map(5, 0.5, 7)
+    assert all(bucket is None for bucket in map["table"]["elements"])
+
+    # Se fuerzan colisiones guardando las llaves en la misma posición
+    map["scale"] = 1
+    map["shift"] = 0
+    mp.put(map, 1, "a")
+    index = mp.bucket_index(map, mf.full_hash(map, 1))
+    assert lt.get_element(map["table"], index) == me.new_map_entry(1, "a", mf.full_hash(map, 1))
+
+    mp.put(map, 1 + map["prime"], "b")
+    mp.put(map, 1 + 2 * map["prime"], "c")
+    bucket = lt.get_element(map["table"], index)
+    assert lt.size(bucket) == 3
+    assert mp.get(map, 1 + map["prime"]) == "b"
+
+    mp.remove(map, 1)
+    mp.remove(map, 1 + 2 * map["prime"])
+    assert lt.get_element(map["table"], index)["key"] == 1 + map["prime"]
+    mp.remove(map, 1 + map["prime"])
+    assert lt.get_element(map["table"], index) is None
+    assert mp.is_empty(map)
+
+
+@handle_not_implemented
+def test_sorted_chains():
+    map = mp.new_map(100, 0.5)
+    map["scale"] = 1
+    map["shift"] = 0
+    # Todas las llaves caen en el mismo bucket; las tres últimas repiten un hash completo
+    step = map["capacity"]
+    keys = [i * step for i in range(1, 15)] + [i * step + map["prime"] for i in range(1, 4)]
+    for key in keys:
+        mp.put(map, key, str(key))
+
+    index = mp.bucket_index(map, mf.full_hash(map, keys[0]))
+    bucket = lt.get_element(map["table"], index)
+    assert lt.size(bucket) == len(keys)
+    assert "hashes" in bucket
+    assert bucket["hashes"] == sorted(bucket["hashes"])
+    for key in keys:
+        assert mp.get(map, key) == str(key)
+    assert not mp.contains(map, 15 * step)
+    assert mp.stats(map)["sorted_buckets"] == 1
+
+    for key in keys[:-mp.UNSORT_THRESHOLD]:
+        mp.remove(map, key)
+    bucket = lt.get_element(map["table"], index)
+    assert "hashes" not in bucket
+    assert mp.size(map) == mp.UNSORT_THRESHOLD
+    for key in keys[-mp.UNSORT_THRESHOLD:]:
+        assert mp.get(map, key) == str(key)
+
+
+@handle_not_implemented
+def test_shrink_on_remove():
+    map = mp.new_map(10, 0.5)
+    initial_capacity = map["capacity"]
+    for i in range(1000):
+        mp.put(map, i, str(i))
+    peak_capacity = map["capacity"]
+
+    for i in range(990):
+        mp.remove(map, i)
+    assert map["capacity"] < peak_capacity
+    assert map["capacity"] >= initial_capacity
+    assert mp.size(map) == 10
+    assert lt.size(mp.key_set(map)) == 10
+    for i in range(990, 1000):
+        assert mp.get(map, i) == str(i)
+
+    # Sin llaves la tabla vuelve a la capacidad inicial, nunca a una menor
+    for i in range(990, 1000):
+        mp.remove(map, i)
+    assert map["capacity"] == initial_capacity
+
+    fixed = mp.new_map(10, 0.5, min_load_factor=0)
+    for i in range(1000):
+        mp.put(fixed, i, i)
+    capacity = fixed["capacity"]
+    for i in range(1000):
+        mp.remove(fixed, i)
+    assert fixed["capacity"] == capacity
+
+
+@handle_not_implemented
+def test_iterators():
+    map = mp.new_map(5, 0.5)
+    for i in range(50):
+        mp.put(map, i, str(i))
+    mp.remove(map, 7)
+
+    assert sorted(mp.iter_keys(map)) == [i for i in range(50) if i != 7]
+    assert sorted(mp.iter_values(map)) == sorted(str(i) for i in range(50) if i != 7)
+    assert dict(mp.iter_items(map)) == {i: str(i) for i in range(50) if i != 7}
+
+    # El recorrido se puede abandonar sin visitar toda la tabla
+    keys = mp.iter_keys(map)
+    first = next(keys)
+    assert mp.contains(map, first)
+    assert list(mp.iter_items(mp.new_map(5, 0.5))) == []
+
+
+@handle_not_implemented
+def test_get_or_insert_and_update():
+    map = mp.new_map(5, 0.5)
+    created = []
+
+    def factory():
+        created.append(1)
+        return lt.new_list()
+
+    for i in range(40):
+        lt.add_last(mp.get_or_insert(map, i % 10, factory), i)
+    assert len(created) == 10
+    assert mp.size(map) == 10
+    assert lt.size(mp.get(map, 3)) == 4
+
+    for word in ["a", "b", "a", "c", "a"]:
+        mp.update(map, word, lambda count: count + 1, 0)
+    assert mp.get(map, "a") == 3
+    assert mp.get(map, "c") == 1
+    assert mp.update(map, "b", lambda count: count * 10) == 10
+    assert mp.size(map) == 13
+
+    # Durante un rehash incremental las llaves sin migrar conservan su valor
+    counts = mp.new_map(5, 0.5, incremental=True)
+    for i in range(600):
+        mp.update(counts, i % 200, lambda count: count + 1, 0)
+    assert mp.size(counts) == 200
+    assert all(mp.get(counts, i) == 3 for i in range(200))
+
+
+@handle_not_implemented
+def test_get_many():
+    map = mp.new_map(5, 0.5, incremental=True)
+    for i in range(300):
+        mp.put(map, "key" + str(i), i)
+    mp.remove(map, "key5")
+
+    keys = ["key299", "key5", "nope", "key0", "key299"]
+    values = mp.get_many(map, keys)
+    assert values["elements"] == [299, None, None, 0, 299]
+    assert lt.size(values) == 5
+
+    key_list = lt.new_list()
+    for i in range(300):
+        lt.add_last(key_list, "key" + str(i))
+    values = mp.get_many(map, key_list)
+    assert values["elements"] == [mp.get(map, "key" + str(i)) for i in range(300)]
+    assert lt.size(mp.get_many(map, [])) == 0
+
+    pow2 = mp.new_map(5, 0.5, power_of_two=True)
+    mp.put(pow2, (1, 2), "a")
+    assert mp.get_many(pow2, [(1, 2), (2, 1)])["elements"] == ["a", None]
@@ -0,0 +1,54 @@
+from DataStructures.Map import multimap as mm
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    my_multimap = mm.new_map(5, 0.5)
+    for i in range(30):
+        mm.add(my_multimap, i % 3, i)
+    return my_multimap
+
+
+@handle_not_implemented
+def test_new_map():
+    my_multimap = mm.new_map(5, 0.5)
+    assert mm.is_empty(my_multimap)
+    assert mm.size(my_multimap) == 0
+    assert mm.key_count(my_multimap) == 0
+
+
+@handle_not_implemented
+def test_add_count():
+    my_multimap = setup_tests()
+    assert mm.size(my_multimap) == 30
+    assert mm.key_count(my_multimap) == 3
+    assert mm.count(my_multimap, 1) == 10
+    assert mm.count(my_multimap, 7) == 0
+    assert mm.contains(my_multimap, 2)
+    assert not mm.contains(my_multimap, 7)
+    assert sorted(mm.iter_keys(my_multimap)) == [0, 1, 2]
+
+
+@handle_not_implemented
+def test_get_all():
+    my_multimap = setup_tests()
+    values = mm.get_all(my_multimap, 2)
+    assert lt.size(values) == 10
+    assert values["elements"] == list(range(2, 30, 3))
+
+    # La lista retornada es una copia: modificarla no cambia el grupo
+    lt.add_last(values, 99)
+    assert mm.count(my_multimap, 2) == 10
+    assert lt.size(mm.get_all(my_multimap, 7)) == 0
+
+
+@handle_not_implemented
+def test_iter_group():
+    my_multimap = setup_tests()
+    assert list(mm.iter_group(my_multimap, 0)) == list(range(0, 30, 3))
+    assert list(mm.iter_group(my_multimap, 7)) == []
+
+    group = mm.iter_group(my_multimap, 1)
+    assert next(group) == 1
+    assert next(group) == 4
@@ -3,7 +3,7 @@
 """
 
 
-def new_map_entry(key, value):
+def new_map_entry(key, value, hash_code=None):
     """
     Crea una nueva entrada (de tipo :ref:`map_entry<map-entry>`) de una tabla con una llave y un valor dados.
 
@@ -11,16 +11,19 @@ def new_map_entry(key, value):
 
     * **key**: Llave de la entrada. Inicializada con el valor de la llave dada ``key``.
     * **value**: Valor de la entrada. Inicializada con el valor del valor dado ``value``.
+    * **hash**: Hash de la llave antes de reducirlo a la capacidad de la tabla. Inicializado con ``hash_code``.
 
     :param key: Llave de la entrada.
     :type key: any
     :param value: Valor de la entrada.
     :type value: any
+    :param hash_code: Hash de la llave que la tabla guarda para no recalcularlo.
+    :type hash_code: int
 
     :return: Entrada de una tabla.
     :rtype: :ref:`map_entry<map-entry>`
     """
-    entry = {"key": key, "value": value}
+    entry = {"key": key, "value": value, "hash": hash_code}
     return entry
 
 
@@ -80,3 +83,16 @@ def get_value(my_entry):
     :rtype: any
     """
     return my_entry["value"]
+
+
+def get_hash(my_entry):
+    """
+    Obtiene el hash ``hash`` guardado en una entrada recibida.
+
+    :param my_entry: Entrada de la cual se desea obtener el hash.
+    :type my_entry: :ref:`map_entry<map-entry>`
+
+    :return: Hash de la llave de la entrada.
+    :rtype: int
+    """
+    return my_entry["hash"]
@@ -1,8 +1,24 @@
 import math
+from bisect import bisect_right
 """
     Funciones auxiliares para el manejo de tablas de simbolos (**mapas**)
 """
 
+# Primos de capacidad: cada uno es el siguiente primo mayor al doble del anterior.
+# Cubren tablas hasta más allá de 2^31 y se consultan con búsqueda binaria.
+CAPACITY_PRIMES = [
+    2, 5, 11, 23, 47, 97, 197, 397, 797, 1597, 3203, 6421, 12853, 25717,
+    51437, 102877, 205759, 411527, 823117, 1646237, 3292489, 6584983,
+    13169977, 26339969, 52679969, 105359939, 210719881, 421439783,
+    842879579, 1685759167, 3371518343,
+]
+
+# Límite del tamaño de la criba de next_prime; por encima se usa is_prime
+SIEVE_MAX = 1 << 22
+
+# Criba de Eratóstenes que se extiende de forma perezosa según se necesite
+_sieve = {"limit": 0, "primes": []}
+
 
 def is_prime(n):
     """Valida si un número es primo o no
@@ -32,26 +48,78 @@ def next_prime(n):
     """
     Encuentra el siguiente número primo mayor a n
 
+    Para n menor a SIEVE_MAX la respuesta sale de una criba de Eratóstenes que
+    se construye la primera vez y se duplica cuando hace falta; la búsqueda
+    en ella es binaria. Para n mayores se prueba número a número con is_prime.
+
     :param n: Número a partir del cual se busca el siguiente primo
     :type n: int
 
     :return: El siguiente número primo mayor a n
     """
-    found = False
-    next_p = 1
-    # Base case
+    n = int(n)
     if n <= 1:
-        next_p = 2
-        found = True
-    if found is False:
-        next_p = int(n)
-        # Loop continuously until is_prime returns
-        # True for a number greater than n
-        while not found:
-            next_p = next_p + 1
-            if is_prime(next_p):
-                found = True
-    return int(next_p)
+        return 2
+    if n < SIEVE_MAX:
+        if bisect_right(_sieve["primes"], n) == len(_sieve["primes"]):
+            extend_sieve(n)
+        primes = _sieve["primes"]
+        pos = bisect_right(primes, n)
+        if pos < len(primes):
+            return primes[pos]
+
+    next_p = max(n, SIEVE_MAX - 1)
+    # Loop continuously until is_prime returns
+    # True for a number greater than n
+    while True:
+        next_p = next_p + 1
+        if is_prime(next_p):
+            return next_p
+
+
+def extend_sieve(n):
+    """
+    Extiende la criba de next_prime para que contenga al menos un primo mayor a n.
+
+    El límite se duplica hasta superar 2n (por el postulado de Bertrand siempre
+    hay un primo entre n y 2n), sin pasar de SIEVE_MAX.
+
+    :param n: Número que la criba debe cubrir
+    :type n: int
+    """
+    limit = max(1024, _sieve["limit"])
+    while limit <= 2 * n and limit < SIEVE_MAX:
+        limit *= 2
+    limit = min(limit, SIEVE_MAX)
+    if limit <= _sieve["limit"]:
+        return
+
+    flags = bytearray([1]) * limit
+    flags[0] = flags[1] = 0
+    for i in range(2, int(math.sqrt(limit - 1)) + 1):
+        if flags[i]:
+            flags[i * i::i] = bytes(len(range(i * i, limit, i)))
+    _sieve["primes"] = [i for i in range(limit) if flags[i]]
+    _sieve["limit"] = limit
+
+
+def next_capacity_prime(n):
+    """
+    Encuentra el menor primo de CAPACITY_PRIMES mayor a n.
+
+    Como la tabla crece aproximadamente al doble, usarla como siguiente
+    capacidad hace que cada rehash duplique la tabla. Si n supera la tabla
+    se usa next_prime.
+
+    :param n: Número a partir del cual se busca la capacidad
+    :type n: int
+
+    :return: El menor primo de capacidad mayor a n
+    """
+    pos = bisect_right(CAPACITY_PRIMES, n)
+    if pos < len(CAPACITY_PRIMES):
+        return CAPACITY_PRIMES[pos]
+    return next_prime(n)
 
 
 def hash_value(table, key):
@@ -73,12 +141,82 @@ def hash_value(table, key):
     :rtype int
     """
 
+    if table.get("power_of_two", False):
+        return full_hash(table, key) & (table["capacity"] - 1)
+    return full_hash(table, key) % table["capacity"]
+
+
+def full_hash(table, key):
+    """
+    Calcula la parte del hash MAD que no depende del tamaño de la tabla:
+    full_hash(y) = (a*y + b) % p.
+
+    Las tablas la guardan junto a cada entrada, de modo que al cambiar de
+    capacidad solo se debe recalcular el módulo M.
+
+    :param table: Tabla de hash
+    :type table: map
+    :param key: Llave a la que se le calculará el hash
+    :type key: any
+
+    :return: Valor del hash antes de reducirlo a la capacidad
+    :rtype int
+    """
+    if table.get("power_of_two", False):
+        return mix_hash(key)
+
     h = hash(key)
     a = table["scale"]
     b = table["shift"]
     p = table["prime"]
-    m = table["capacity"]
 
-    value = int((abs(a * h + b) % p) % m)
-    return value
+    return int(abs(a * h + b) % p)
+
+
+def mix_hash(key):
+    """
+    Calcula un hash de 64 bits para tablas cuya capacidad es potencia de dos.
+
+    Se multiplica hash(key) por la constante de Fibonacci 2^64/phi y se mezclan
+    los 32 bits altos con los bajos. Así los bits bajos, que son los que usa la
+    máscara capacity - 1, dependen de todos los bits de la llave.
+
+    :param key: Llave a la que se le calculará el hash
+    :type key: any
+
+    :return: Hash de 64 bits, no negativo
+    :rtype int
+    """
+    h = (hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    return h ^ (h >> 32)
+
+
+def next_power_of_two(n):
+    """
+    Encuentra la siguiente potencia de dos mayor a n
+
+    :param n: Número a partir del cual se busca la potencia
+    :type n: int
+
+    :return: La siguiente potencia de dos mayor a n
+    """
+    return 1 << max(0, int(n)).bit_length()
+
+
+def next_capacity(n, power_of_two=False):
+    """
+    Encuentra la capacidad de tabla que sigue a n según la política de la tabla:
+    el siguiente primo de CAPACITY_PRIMES o la siguiente potencia de dos.
+    Pasar la capacidad actual da la capacidad del siguiente rehash (el doble).
+
+    :param n: Número a partir del cual se busca la capacidad
+    :type n: int
+    :param power_of_two: True si la tabla usa capacidades potencia de dos
+    :type power_of_two: bool
+
+    :return: La siguiente capacidad mayor a n
+    """
+    if power_of_two:
+        return next_power_of_two(n)
+    return next_capacity_prime(n)
 
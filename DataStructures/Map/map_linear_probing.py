@@ -1,68 +1,456 @@
+import time
 from DataStructures.Map import map_entry as me
 from DataStructures.Map import map_functions as mf
 from DataStructures.Map.map_functions import next_prime
 from DataStructures.List import array_list as al
 
 
-def new_map(num_elements, load_factor, prime=109345121):
-    """Crea una nueva tabla de símbolos con sondeo lineal."""
-    capacity = mf.next_prime(int(num_elements / load_factor))  
-    scale = 1  
-    shift = 0  
-    table = [{'key': None, 'value': None} for _ in range(capacity)] 
+def new_map(num_elements, load_factor, prime=109345121, robin_hood=False, incremental=False,
+            power_of_two=False, min_load_factor=None, exact_capacity=False):
+    """Crea una nueva tabla de símbolos con sondeo lineal.
+
+    Con robin_hood=True las inserciones usan la política Robin Hood y las
+    eliminaciones desplazan hacia atrás las entradas siguientes en vez de
+    dejar casillas borradas.
+
+    Con incremental=True el rehash no reubica todas las entradas de una vez:
+    la tabla anterior se conserva en 'old_table' y cada put o remove mueve
+    'migrate_step' casillas de ella a la tabla nueva.
+
+    Con power_of_two=True la capacidad es siempre potencia de dos, el hash se
+    mezcla con mf.mix_hash en vez de MAD y la posición se obtiene con una
+    máscara de bits en lugar del módulo.
+
+    Cuando remove deja el factor de carga por debajo de min_load_factor (por
+    defecto load_factor / 4; 0 lo desactiva) la tabla se reduce hasta quedar
+    a la mitad de load_factor, sin bajar de la capacidad inicial. La distancia
+    entre ambos límites evita crecer y reducir la tabla una y otra vez.
+
+    La capacidad inicial es la capacidad de CAPACITY_PRIMES que sigue a
+    num_elements / load_factor. Con exact_capacity=True es el primo siguiente,
+    para cuando num_elements ya es una estimación ajustada del número de llaves
+    y redondear a la siguiente capacidad de la tabla desperdiciaría casillas.
+    """
+    if exact_capacity and not power_of_two:
+        capacity = mf.next_prime(int(num_elements / load_factor))
+    else:
+        capacity = mf.next_capacity(int(num_elements / load_factor), power_of_two)
+    if min_load_factor is None:
+        min_load_factor = load_factor / 4
+    scale = 1
+    shift = 0
 
     return {
         'prime': prime,
         'capacity': capacity,
         'scale': scale,
         'shift': shift,
-        'table': {'size': capacity, 'elements': table},
+        'table': new_table(capacity),
         'current_factor': 0,
         'limit_factor': load_factor,
+        'min_factor': min_load_factor,
+        'min_capacity': capacity,
         'size': 0,
+        'tombstones': 0,
+        'robin_hood': robin_hood,
+        'incremental': incremental,
+        'old_table': None,
+        'migrate_pos': 0,
+        'migrate_step': 8,
+        'rehash_count': 0,
+        'rehash_time': 0,
+        'power_of_two': power_of_two,
+    }
+
+def new_table(capacity):
+    """Crea las casillas de la tabla como arreglos paralelos de llaves, valores y hashes.
+
+    Una casilla vacía tiene llave None y una casilla borrada tiene llave '__EMPTY__'.
+    En 'hashes' se guarda el hash MAD sin reducir a la capacidad, de modo que un
+    rehash solo debe recalcular el módulo.
+    """
+    return {
+        'size': capacity,
+        'keys': [None] * capacity,
+        'values': [None] * capacity,
+        'hashes': [None] * capacity,
     }
 
+def full_hash(my_map, key):
+    """Calcula el hash MAD de una llave antes de reducirlo a la capacidad de la tabla."""
+    if my_map['power_of_two']:
+        return mf.mix_hash(key)
+    return (my_map['scale'] * hash(key) + my_map['shift']) % my_map['prime']
+
+def index_of(my_map, key_hash):
+    """Reduce un hash completo a una posición de la tabla.
+
+    Con capacidad potencia de dos se usa la máscara capacity - 1. Como los hash
+    completos no son negativos, el resultado coincide con key_hash % capacity,
+    que es lo que usan los recorridos internos de la tabla.
+    """
+    if my_map['power_of_two']:
+        return key_hash & (my_map['capacity'] - 1)
+    return key_hash % my_map['capacity']
+
 def hash_value(my_map, key):
     """Calcula el índice de almacenamiento usando una función hash."""
-    return (my_map['scale'] * hash(key) + my_map['shift']) % my_map['prime'] % my_map['capacity']
+    return index_of(my_map, full_hash(my_map, key))
 
 
-def find_slot(my_map, key, hash_value):
-    """Encuentra un espacio disponible usando sondeo lineal."""
+def find_slot(my_map, key, hash_value, key_hash=None):
+    """Encuentra un espacio disponible usando sondeo lineal.
+
+    Las casillas borradas ('__EMPTY__') no detienen la búsqueda, pero si la llave
+    no está se retorna la primera de ellas para reutilizarla. Antes de comparar
+    llaves se compara el hash guardado en la casilla con key_hash.
+    """
     index = hash_value
     capacity = my_map['capacity']
-    
+    keys = my_map['table']['keys']
+    hashes = my_map['table']['hashes']
+    if key_hash is None:
+        key_hash = full_hash(my_map, key)
+    first_deleted = None
+
     for i in range(capacity):
         pos = (index + i) % capacity
-        element = my_map['table']['elements'][pos]
-        
-        if element['key'] is None:
-            return (False, pos)  
-        if element['key'] == key:
-            return (True, pos)  
-    
+        slot_key = keys[pos]
+
+        if slot_key is None:
+            if first_deleted is not None:
+                return (False, first_deleted)
+            return (False, pos)
+        if slot_key == '__EMPTY__':
+            if first_deleted is None:
+                first_deleted = pos
+        elif hashes[pos] == key_hash and slot_key == key:
+            return (True, pos)
+
+    return (False, first_deleted)
+
+def find_slot_robin_hood(my_map, key, hash_value, key_hash=None):
+    """Encuentra la llave o su punto de inserción en una tabla Robin Hood.
+
+    La búsqueda se detiene en cuanto la casilla actual está menos desplazada de
+    su posición ideal que la llave buscada: si la llave existiera, estaría antes.
+    """
+    capacity = my_map['capacity']
+    table = my_map['table']
+    keys = table['keys']
+    hashes = table['hashes']
+    if key_hash is None:
+        key_hash = full_hash(my_map, key)
+    pos = hash_value
+
+    for dist in range(capacity):
+        slot_key = keys[pos]
+        if slot_key is None:
+            return (False, pos)
+        slot_hash = hashes[pos]
+        if (pos - slot_hash % capacity) % capacity < dist:
+            return (False, pos)
+        if slot_hash == key_hash and slot_key == key:
+            return (True, pos)
+        pos = (pos + 1) % capacity
+
     return (False, None)
 
+def locate(my_map, key, key_hash):
+    """Busca la llave, dado su hash completo, con la política de sondeo configurada en el mapa."""
+    if my_map['robin_hood']:
+        return find_slot_robin_hood(my_map, key, index_of(my_map, key_hash), key_hash)
+    return find_slot(my_map, key, index_of(my_map, key_hash), key_hash)
+
+def insert_robin_hood(table, capacity, pos, key, value, hash_val):
+    """Inserta una entrada a partir de pos intercambiándola con las entradas menos desplazadas."""
+    keys = table['keys']
+    values = table['values']
+    hashes = table['hashes']
+    dist = (pos - hash_val % capacity) % capacity
+
+    while keys[pos] is not None:
+        slot_dist = (pos - hashes[pos] % capacity) % capacity
+        if slot_dist < dist:
+            key, keys[pos] = keys[pos], key
+            value, values[pos] = values[pos], value
+            hash_val, hashes[pos] = hashes[pos], hash_val
+            dist = slot_dist
+        pos = (pos + 1) % capacity
+        dist += 1
+
+    keys[pos] = key
+    values[pos] = value
+    hashes[pos] = hash_val
+
+def shift_back(table, capacity, pos):
+    """Vacía la casilla pos corriendo hacia atrás las entradas desplazadas que la siguen."""
+    keys = table['keys']
+    values = table['values']
+    hashes = table['hashes']
+    next_pos = (pos + 1) % capacity
+
+    while keys[next_pos] is not None and (next_pos - hashes[next_pos] % capacity) % capacity > 0:
+        keys[pos] = keys[next_pos]
+        values[pos] = values[next_pos]
+        hashes[pos] = hashes[next_pos]
+        pos = next_pos
+        next_pos = (next_pos + 1) % capacity
+
+    keys[pos] = None
+    values[pos] = None
+    hashes[pos] = None
+
+def find_in_table(table, key, hash_val):
+    """Busca una llave en una tabla dada con sondeo lineal simple.
+
+    Sirve para la tabla anterior durante un rehash incremental, cuya capacidad es
+    distinta a la del mapa. Retorna la posición de la llave o None si no está.
+    """
+    capacity = table['size']
+    keys = table['keys']
+    hashes = table['hashes']
+    pos = hash_val % capacity
+
+    for _ in range(capacity):
+        slot_key = keys[pos]
+        if slot_key is None:
+            return None
+        if hashes[pos] == hash_val and slot_key == key:
+            return pos
+        pos = (pos + 1) % capacity
+
+    return None
+
+def take_from_old(my_map, key, hash_val):
+    """Retira la llave de la tabla anterior si aún no se ha migrado. Retorna True si la encontró."""
+    return pop_from_old(my_map, key, hash_val)[0]
+
+def pop_from_old(my_map, key, hash_val):
+    """Retira la llave de la tabla anterior si aún no se ha migrado.
+
+    Retorna la pareja (encontrada, valor); el valor es None si no la encontró.
+    """
+    old_table = my_map['old_table']
+    if old_table is None:
+        return False, None
+    pos = find_in_table(old_table, key, hash_val)
+    if pos is None:
+        return False, None
+    value = old_table['values'][pos]
+    old_table['keys'][pos] = '__EMPTY__'
+    old_table['values'][pos] = None
+    old_table['hashes'][pos] = None
+    return True, value
+
+def place(my_map, key, value, hash_val):
+    """Ubica en la tabla actual una entrada cuya llave se sabe que no está en ella."""
+    table = my_map['table']
+    capacity = my_map['capacity']
+    pos = hash_val % capacity
+
+    if my_map['robin_hood']:
+        insert_robin_hood(table, capacity, pos, key, value, hash_val)
+        return
+
+    keys = table['keys']
+    while keys[pos] is not None and keys[pos] != '__EMPTY__':
+        pos = (pos + 1) % capacity
+    if keys[pos] == '__EMPTY__':
+        my_map['tombstones'] -= 1
+    keys[pos] = key
+    table['values'][pos] = value
+    table['hashes'][pos] = hash_val
+
+def migrate(my_map, steps):
+    """Mueve a la tabla actual las entradas de hasta steps casillas de la tabla anterior.
+
+    Las casillas migradas quedan marcadas como borradas para no cortar las
+    secuencias de sondeo de las llaves que aún no se han movido.
+    """
+    old_table = my_map['old_table']
+    if old_table is None:
+        return my_map
+
+    start_time = time.perf_counter()
+    old_keys = old_table['keys']
+    start = my_map['migrate_pos']
+    stop = min(start + steps, old_table['size'])
+
+    for pos in range(start, stop):
+        key = old_keys[pos]
+        if key is not None and key != '__EMPTY__':
+            place(my_map, key, old_table['values'][pos], old_table['hashes'][pos])
+            old_keys[pos] = '__EMPTY__'
+            old_table['values'][pos] = None
+            old_table['hashes'][pos] = None
+
+    my_map['migrate_pos'] = stop
+    if stop == old_table['size']:
+        my_map['old_table'] = None
+    my_map['rehash_time'] += (time.perf_counter() - start_time) * 1000
+    return my_map
+
 def put(my_map, key, value):
     """Agrega una nueva entrada llave-valor a la tabla de hash."""
-    hash_val = hash_value(my_map, key)
-    occupied, pos = find_slot(my_map, key, hash_val)
+    if my_map['old_table'] is not None:
+        migrate(my_map, my_map['migrate_step'])
+
+    hash_val = full_hash(my_map, key)
+    occupied, pos = locate(my_map, key, hash_val)
 
     if pos is not None:
-        if not occupied:  
-            my_map['size'] += 1
-            my_map['current_factor'] = my_map['size'] / my_map['capacity']
-        my_map['table']['elements'][pos] = {'key': key, 'value': value}
-    
+        if occupied:
+            my_map['table']['values'][pos] = value
+        else:
+            if not take_from_old(my_map, key, hash_val):
+                my_map['size'] += 1
+                my_map['current_factor'] = my_map['size'] / my_map['capacity']
+            insert_at(my_map, pos, key, value, hash_val)
+
+    return check_load(my_map)
+
+def insert_at(my_map, pos, key, value, hash_val):
+    """Guarda una llave nueva en la casilla libre pos que encontró locate."""
+    table = my_map['table']
+    if my_map['robin_hood']:
+        insert_robin_hood(table, my_map['capacity'], pos, key, value, hash_val)
+    else:
+        if table['keys'][pos] == '__EMPTY__':
+            my_map['tombstones'] -= 1
+        table['keys'][pos] = key
+        table['values'][pos] = value
+        table['hashes'][pos] = hash_val
+
+def check_load(my_map):
+    """Hace crecer o compacta la tabla si las entradas o las casillas borradas sobrepasan el límite."""
     if my_map['current_factor'] > my_map['limit_factor']:
         rehash(my_map)
-    
+    elif (my_map['size'] + my_map['tombstones']) / my_map['capacity'] > my_map['limit_factor']:
+        # Las casillas borradas llenan la tabla: se compacta sin crecer, salvo que
+        # las entradas vivas ocupen más de la mitad del límite (evita compactar seguido)
+        if my_map['current_factor'] * 2 > my_map['limit_factor']:
+            rehash(my_map)
+        else:
+            rebuild(my_map, my_map['capacity'])
+
     return my_map
 
+def get_or_insert(my_map, key, factory):
+    """Retorna el valor de la llave; si no está, guarda factory() con esa llave y lo retorna.
+
+    Reemplaza la secuencia get + put (o contains + get + put) con un solo
+    sondeo. Por ejemplo, get_or_insert(index, author, al.new_list) entrega la
+    lista del autor, creándola la primera vez. factory no debe modificar el mapa.
+    """
+    return upsert(my_map, key, None, factory)
+
+def update(my_map, key, fn, default=None):
+    """Reemplaza el valor de la llave por fn(valor) y retorna el valor nuevo.
+
+    Si la llave no está se guarda fn(default). Por ejemplo, update(counts,
+    tag, lambda c: c + 1, 0) cuenta apariciones con un solo sondeo. fn no debe
+    modificar el mapa.
+    """
+    return upsert(my_map, key, fn, lambda: default)
+
+def upsert(my_map, key, fn, missing):
+    """Sondeo único de get_or_insert y update.
+
+    Si la llave está, se le aplica fn a su valor (si fn no es None). Si no
+    está, se guarda fn(missing()) o missing(). Retorna el valor que queda
+    asociado a la llave.
+    """
+    if my_map['old_table'] is not None:
+        migrate(my_map, my_map['migrate_step'])
+
+    hash_val = full_hash(my_map, key)
+    occupied, pos = locate(my_map, key, hash_val)
+    values = my_map['table']['values']
+
+    if occupied:
+        if fn is not None:
+            values[pos] = fn(values[pos])
+        return values[pos]
+
+    found, value = pop_from_old(my_map, key, hash_val)
+    if not found:
+        value = missing()
+        my_map['size'] += 1
+        my_map['current_factor'] = my_map['size'] / my_map['capacity']
+    if fn is not None:
+        value = fn(value)
+    insert_at(my_map, pos, key, value, hash_val)
+    check_load(my_map)
+    return value
+
+def put_all(my_map, items, size_hint=None):
+    """Agrega todas las parejas (llave, valor) de items redimensionando la tabla una sola vez.
+
+    La capacidad se calcula con len(items) o con size_hint si items no tiene
+    longitud. Si la estimación se queda corta, la tabla crece al llenarse.
+    """
+    if size_hint is None:
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        size_hint = len(items)
+
+    if my_map['old_table'] is not None:
+        migrate(my_map, my_map['old_table']['size'])
+    # Las casillas borradas también ocupan la tabla: si con ellas se pasa el límite se
+    # reconstruye (creciendo solo si las entradas vivas lo necesitan) para descartarlas
+    needed = my_map['size'] + size_hint
+    if needed + my_map['tombstones'] > my_map['limit_factor'] * my_map['capacity']:
+        new_capacity = my_map['capacity']
+        if needed > my_map['limit_factor'] * new_capacity:
+            new_capacity = mf.next_capacity(int(needed / my_map['limit_factor']), my_map['power_of_two'])
+        rebuild(my_map, new_capacity)
+
+    robin_hood = my_map['robin_hood']
+    capacity = my_map['capacity']
+    table = my_map['table']
+    threshold = int(my_map['limit_factor'] * capacity)
+
+    for key, value in items:
+        hash_val = full_hash(my_map, key)
+        occupied, pos = locate(my_map, key, hash_val)
+        if occupied:
+            table['values'][pos] = value
+            continue
+        my_map['size'] += 1
+        if robin_hood:
+            insert_robin_hood(table, capacity, pos, key, value, hash_val)
+        else:
+            if table['keys'][pos] == '__EMPTY__':
+                my_map['tombstones'] -= 1
+            table['keys'][pos] = key
+            table['values'][pos] = value
+            table['hashes'][pos] = hash_val
+        if my_map['size'] + my_map['tombstones'] > threshold:
+            if my_map['size'] > threshold:
+                rebuild(my_map, mf.next_capacity(capacity, my_map['power_of_two']))
+            else:
+                rebuild(my_map, capacity)
+            capacity = my_map['capacity']
+            table = my_map['table']
+            threshold = int(my_map['limit_factor'] * capacity)
+
+    my_map['current_factor'] = my_map['size'] / capacity
+    return my_map
+
+def from_items(items, load_factor, size_hint=None, prime=109345121, robin_hood=False, power_of_two=False):
+    """Crea una tabla de símbolos con las parejas (llave, valor) de items."""
+    if size_hint is None:
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        size_hint = len(items)
+    my_map = new_map(max(1, size_hint), load_factor, prime, robin_hood, power_of_two=power_of_two)
+    return put_all(my_map, items, size_hint)
+
 def is_available(table, pos):
     """Verifica si una posición en la tabla está disponible."""
-    entry = al.get_element(table, pos)
-    if me.get_key(entry) is None or me.get_key(entry) == "__EMPTY__":
+    key = table['keys'][pos]
+    if key is None or key == "__EMPTY__":
         return True
     return False
 
@@ -76,43 +464,116 @@ def default_compare(key, entry):
 
 def contains(my_map, key):
     """Verifica si la llave existe en la tabla."""
-    index = hash_value(my_map, key)
-    capacity = my_map['capacity']
-    
-    for i in range(capacity):
-        pos = (index + i) % capacity
-        element = my_map['table']['elements'][pos]
-        if element['key'] == key:
-            return True
-        if element['key'] is None:
-            return False
-    return False
+    hash_val = full_hash(my_map, key)
+    occupied, _ = locate(my_map, key, hash_val)
+    if not occupied and my_map['old_table'] is not None:
+        return find_in_table(my_map['old_table'], key, hash_val) is not None
+    return occupied
+
 
-    
 def get(my_map, key):
     """Obtiene el valor asociado a una llave dada."""
-    index = hash_value(my_map, key)
-    capacity = my_map['capacity']
-    
-    for i in range(capacity):
-        pos = (index + i) % capacity
-        element = my_map['table']['elements'][pos]
-        if element['key'] == key:
-            return element['value']
-        if element['key'] is None:
-            return None 
+    hash_val = full_hash(my_map, key)
+    occupied, pos = locate(my_map, key, hash_val)
+    if occupied:
+        return my_map['table']['values'][pos]
+    if my_map['old_table'] is not None:
+        pos = find_in_table(my_map['old_table'], key, hash_val)
+        if pos is not None:
+            return my_map['old_table']['values'][pos]
     return None
 
+def get_many(my_map, keys):
+    """Obtiene los valores de un lote de llaves en el mismo orden en que llegan.
+
+    keys puede ser un arraylist o cualquier iterable de llaves. El hash y el
+    sondeo se hacen en un solo ciclo con la tabla en variables locales, sin
+    pasar por get en cada llave. Retorna un arraylist con None en las llaves
+    que no están.
+    """
+    if isinstance(keys, dict) and 'elements' in keys:
+        keys = keys['elements']
+
+    table = my_map['table']
+    slot_keys = table['keys']
+    slot_hashes = table['hashes']
+    slot_values = table['values']
+    capacity = my_map['capacity']
+    power_of_two = my_map['power_of_two']
+    scale = my_map['scale']
+    shift = my_map['shift']
+    prime = my_map['prime']
+    old_table = my_map['old_table']
+
+    values = []
+    for key in keys:
+        if power_of_two:
+            hash_val = mf.mix_hash(key)
+        else:
+            hash_val = (scale * hash(key) + shift) % prime
+        pos = hash_val % capacity
+        value = None
+        found = False
+        # Las casillas borradas no detienen el sondeo; una vacía indica que la llave no
+        # está. Como en find_slot, se sondean a lo sumo capacity casillas.
+        for _ in range(capacity):
+            slot_key = slot_keys[pos]
+            if slot_key is None:
+                break
+            if slot_hashes[pos] == hash_val and slot_key == key:
+                value = slot_values[pos]
+                found = True
+                break
+            pos += 1
+            if pos == capacity:
+                pos = 0
+        if not found and old_table is not None:
+            old_pos = find_in_table(old_table, key, hash_val)
+            if old_pos is not None:
+                value = old_table['values'][old_pos]
+        values.append(value)
+
+    return {'elements': values, 'size': len(values)}
+
 
 def remove(my_map, key):
     """Elimina una entrada de la tabla de símbolos."""
-    hash_val = hash_value(my_map, key)
-    occupied, pos = find_slot(my_map, key, hash_val)
-    
+    if my_map['old_table'] is not None:
+        migrate(my_map, my_map['migrate_step'])
+
+    hash_val = full_hash(my_map, key)
+    occupied, pos = locate(my_map, key, hash_val)
+
     if occupied:
-        my_map['table']['elements'][pos] = {'key': '__EMPTY__', 'value': '__EMPTY__'}
+        table = my_map['table']
+        if my_map['robin_hood']:
+            shift_back(table, my_map['capacity'], pos)
+        else:
+            table['keys'][pos] = '__EMPTY__'
+            table['values'][pos] = None
+            table['hashes'][pos] = None
+            my_map['tombstones'] += 1
+        my_map['size'] -= 1
+        my_map['current_factor'] = my_map['size'] / my_map['capacity']
+    elif take_from_old(my_map, key, hash_val):
         my_map['size'] -= 1
-    
+        my_map['current_factor'] = my_map['size'] / my_map['capacity']
+
+    if my_map['current_factor'] < my_map['min_factor'] and my_map['capacity'] > my_map['min_capacity']:
+        shrink(my_map)
+    return my_map
+
+
+def shrink(my_map):
+    """Reduce la tabla para que el factor de carga quede en la mitad de limit_factor.
+
+    La capacidad no baja de la que se pidió al crear el mapa. La tabla se
+    reconstruye de una vez, también en modo incremental.
+    """
+    new_capacity = mf.next_capacity(int(2 * my_map['size'] / my_map['limit_factor']), my_map['power_of_two'])
+    new_capacity = max(new_capacity, my_map['min_capacity'])
+    if new_capacity < my_map['capacity']:
+        rebuild(my_map, new_capacity)
     return my_map
 
 
@@ -124,33 +585,195 @@ def is_empty(my_map):
     """Valida si la tabla de símbolos está vacía."""
     return my_map['size'] == 0
 
+def tables(my_map):
+    """Retorna las tablas con entradas del mapa: la actual y, durante un rehash incremental, la anterior."""
+    if my_map['old_table'] is not None:
+        return [my_map['table'], my_map['old_table']]
+    return [my_map['table']]
+
 def key_set(my_map):
     """Obtiene la lista de llaves de la tabla de símbolos."""
     keys = al.new_list()
-    for entry in my_map['table']['elements']:
-        if entry['key'] is not None and entry['key'] != '__EMPTY__':
-            al.add_last(keys, entry['key'])
+    for key in iter_keys(my_map):
+        al.add_last(keys, key)
     return keys
 
 def value_set(my_map):
     """Obtiene la lista de valores de la tabla de símbolos."""
     values = al.new_list()
-    for entry in my_map['table']['elements']:
-        if entry['key'] is not None and entry['key'] != '__EMPTY__':
-            al.add_last(values, entry['value'])
+    for value in iter_values(my_map):
+        al.add_last(values, value)
     return values
 
+def iter_items(my_map):
+    """Recorre las parejas (llave, valor) de la tabla sin construir una lista.
+
+    Es un generador: recorre las casillas directamente y se puede abandonar
+    en cualquier momento. El mapa no debe modificarse mientras se recorre.
+    """
+    for table in tables(my_map):
+        for key, value in zip(table['keys'], table['values']):
+            if key is not None and key != '__EMPTY__':
+                yield key, value
+
+def iter_keys(my_map):
+    """Recorre las llaves de la tabla sin construir una lista (ver iter_items)."""
+    for table in tables(my_map):
+        for key in table['keys']:
+            if key is not None and key != '__EMPTY__':
+                yield key
+
+def iter_values(my_map):
+    """Recorre los valores de la tabla sin construir una lista (ver iter_items)."""
+    for key, value in iter_items(my_map):
+        yield value
+
 def rehash(my_map):
     """Reajusta la tabla cuando se sobrepasa el factor de carga."""
-    old_elements = [entry for entry in my_map['table']['elements'] if entry['key'] is not None]
-    new_capacity = mf.next_prime(my_map['capacity'] * 2)  
+    new_capacity = mf.next_capacity(my_map['capacity'], my_map['power_of_two'])
+    if not my_map['incremental']:
+        return rebuild(my_map, new_capacity)
 
+    # Un rehash pendiente se termina antes de empezar el siguiente
+    if my_map['old_table'] is not None:
+        migrate(my_map, my_map['old_table']['size'])
+    start_time = time.perf_counter()
+    my_map['old_table'] = my_map['table']
+    my_map['migrate_pos'] = 0
+    my_map['table'] = new_table(new_capacity)
     my_map['capacity'] = new_capacity
-    my_map['table'] = {'size': new_capacity, 'elements': [{'key': None, 'value': None} for _ in range(new_capacity)]}
-    my_map['size'] = 0
-    my_map['current_factor'] = 0
-    
-    for entry in old_elements:
-        put(my_map, entry['key'], entry['value'])
+    my_map['current_factor'] = my_map['size'] / new_capacity
+    my_map['tombstones'] = 0
+    record_rehash(my_map, start_time)
+    return my_map
 
+def record_rehash(my_map, start_time):
+    """Actualiza los contadores de rehash con uno que empezó en start_time (time.perf_counter)."""
+    my_map['rehash_count'] += 1
+    my_map['rehash_time'] += (time.perf_counter() - start_time) * 1000
+
+def rebuild(my_map, new_capacity):
+    """Reconstruye la tabla con la capacidad dada descartando las casillas borradas.
+
+    Las entradas se reubican usando el hash guardado en cada casilla, sin
+    volver a pasar por put.
+    """
+    if my_map['old_table'] is not None:
+        migrate(my_map, my_map['old_table']['size'])
+
+    start_time = time.perf_counter()
+    old_table = my_map['table']
+    my_map['table'] = new_table(new_capacity)
+    my_map['capacity'] = new_capacity
+    my_map['tombstones'] = 0
+
+    for pos, key in enumerate(old_table['keys']):
+        if key is not None and key != '__EMPTY__':
+            place(my_map, key, old_table['values'][pos], old_table['hashes'][pos])
+
+    my_map['current_factor'] = my_map['size'] / new_capacity
+    record_rehash(my_map, start_time)
     return my_map
+
+def displacement_stats(my_map):
+    """Calcula el desplazamiento máximo y promedio de las entradas respecto a su posición ideal.
+
+    Durante un rehash incremental solo se consideran las entradas ya migradas.
+    """
+    table = my_map['table']
+    capacity = my_map['capacity']
+    hashes = table['hashes']
+    total = 0
+    longest = 0
+    count = 0
+
+    for pos, key in enumerate(table['keys']):
+        if key is not None and key != '__EMPTY__':
+            dist = (pos - hashes[pos] % capacity) % capacity
+            total += dist
+            count += 1
+            if dist > longest:
+                longest = dist
+
+    mean = total / count if count > 0 else 0
+    return {'max_displacement': longest, 'mean_displacement': mean}
+
+def stats(my_map):
+    """Calcula estadísticas de sondeo y ocupación de la tabla actual.
+
+    Las operaciones solo mantienen los contadores de rehash; las longitudes de
+    sondeo y los clusters se calculan aquí recorriendo la tabla una vez. La
+    longitud de sondeo cuenta las casillas revisadas, incluida la última.
+    Durante un rehash incremental no se consideran las entradas sin migrar.
+
+    Retorna un diccionario con size, capacity, load_factor, hit_probe_mean,
+    hit_probe_max, miss_probe_mean, miss_probe_max, cluster_histogram
+    (longitud de cluster -> cantidad), rehash_count, rehash_time (ms) y
+    tombstone_ratio (casillas borradas / capacidad).
+    """
+    table = my_map['table']
+    capacity = my_map['capacity']
+    keys = table['keys']
+    hashes = table['hashes']
+
+    hits = 0
+    hit_total = 0
+    hit_max = 0
+    for pos in range(capacity):
+        key = keys[pos]
+        if key is not None and key != '__EMPTY__':
+            probe = (pos - hashes[pos] % capacity) % capacity + 1
+            hits += 1
+            hit_total += probe
+            if probe > hit_max:
+                hit_max = probe
+
+    # Un cluster es una secuencia de casillas no vacías; se recorre desde una vacía
+    clusters = {}
+    start = 0
+    while start < capacity and keys[start] is not None:
+        start += 1
+    if start == capacity:
+        clusters[capacity] = 1
+    run = 0
+    for i in range(1, capacity + 1 if start < capacity else 1):
+        if keys[(start + i) % capacity] is None:
+            if run > 0:
+                clusters[run] = clusters.get(run, 0) + 1
+            run = 0
+        else:
+            run += 1
+
+    if my_map['robin_hood']:
+        miss_total = 0
+        miss_max = 0
+        for home in range(capacity):
+            pos = home
+            dist = 0
+            while keys[pos] is not None and (pos - hashes[pos] % capacity) % capacity >= dist:
+                pos = (pos + 1) % capacity
+                dist += 1
+            miss_total += dist + 1
+            if dist + 1 > miss_max:
+                miss_max = dist + 1
+    else:
+        # Desde cada casilla de un cluster de longitud L se revisan las que faltan y la vacía
+        miss_total = capacity - sum(length * count for length, count in clusters.items())
+        miss_max = 1
+        for length, count in clusters.items():
+            miss_total += count * (length * (length + 1) // 2 + length)
+            miss_max = max(miss_max, length + 1)
+
+    return {
+        'size': my_map['size'],
+        'capacity': capacity,
+        'load_factor': my_map['size'] / capacity,
+        'hit_probe_mean': hit_total / hits if hits > 0 else 0,
+        'hit_probe_max': hit_max,
+        'miss_probe_mean': miss_total / capacity,
+        'miss_probe_max': miss_max,
+        'cluster_histogram': clusters,
+        'rehash_count': my_map['rehash_count'],
+        'rehash_time': my_map['rehash_time'],
+        'tombstone_ratio': my_map['tombstones'] / capacity,
+    }
@@ -1,18 +1,43 @@
 import random
-from DataStructures.Map.map_entry import new_map_entry, get_key, get_value, set_value
+import time
+from bisect import bisect_left, bisect_right
+from DataStructures.Map.map_entry import new_map_entry, get_key, get_value, set_value, get_hash
 from DataStructures.List import array_list as al
-from DataStructures.Map.map_functions import next_prime, hash_value
+from DataStructures.Map.map_functions import full_hash, mix_hash, next_capacity
 
-def new_map(num_elements, load_factor, prime=109345121):
-    """Crea una nueva tabla hash con Separate Chaining."""
-    capacity = next_prime(max(1, int(num_elements / load_factor)))  # Evita dividir por 0
+# Una cadena con más entradas que SORT_THRESHOLD se ordena por hash y se busca con
+# búsqueda binaria; vuelve a ser una cadena simple al bajar a UNSORT_THRESHOLD.
+SORT_THRESHOLD = 8
+UNSORT_THRESHOLD = 6
+
+def new_map(num_elements, load_factor, prime=109345121, incremental=False, power_of_two=False,
+            min_load_factor=None):
+    """
+    Crea una nueva tabla hash con Separate Chaining.
+
+    Con incremental=True el rehash conserva la tabla anterior en 'old_table' y cada
+    put o remove mueve 'migrate_step' buckets de ella a la tabla nueva, en vez de
+    reubicar todas las entradas dentro de un solo put.
+
+    Con power_of_two=True la capacidad es siempre potencia de dos, el hash se mezcla
+    con mix_hash en vez de MAD y el bucket se obtiene con una máscara de bits.
+
+    Los buckets se crean al primer put: una posición vacía es None, un bucket con una
+    sola entrada guarda la entrada directamente y solo las colisiones usan un arraylist.
+    Las cadenas largas se mantienen ordenadas por hash (ver sort_chain).
+
+    Cuando remove deja el factor de carga por debajo de min_load_factor (por defecto
+    load_factor / 4; 0 lo desactiva) la tabla se reduce hasta quedar a la mitad de
+    load_factor, sin bajar de la capacidad inicial.
+    """
+    capacity = next_capacity(max(1, int(num_elements / load_factor)), power_of_two)  # Evita dividir por 0
+    if min_load_factor is None:
+        min_load_factor = load_factor / 4
     
     scale = random.randint(1, prime - 1)  # a > 0
     shift = random.randint(0, prime - 1)  # 0 <= b < prime
     
-    table = al.new_list()
-    for _ in range(capacity):
-        al.add_last(table, al.new_list())  # Agrega listas vacías a la tabla
+    table = new_table(capacity)
     
     return {
         'prime': prime,
@@ -22,33 +47,255 @@ def new_map(num_elements, load_factor, prime=109345121):
         'table': table,
         'current_factor': 0,
         'limit_factor': load_factor,
-        'size': 0
+        'min_factor': min_load_factor,
+        'min_capacity': capacity,
+        'size': 0,
+        'incremental': incremental,
+        'old_table': None,
+        'old_capacity': 0,
+        'migrate_pos': 0,
+        'migrate_step': 4,
+        'rehash_count': 0,
+        'rehash_time': 0,
+        'power_of_two': power_of_two
     }
 
+def new_table(capacity):
+    """
+    Crea la tabla de buckets: un arraylist con None en cada posición. Los buckets se
+    crean al insertar la primera entrada de cada posición.
+
+    :param capacity: Número de buckets de la tabla.
+    :return: Tabla de buckets vacíos.
+    """
+    return {'elements': [None] * capacity, 'size': capacity}
+
+def bucket_entries(bucket):
+    """
+    Retorna las entradas de un bucket sin importar su representación.
+
+    :param bucket: Posición de la tabla: None, una entrada o un arraylist.
+    :return: Lista (o tupla) de entradas del bucket.
+    """
+    if bucket is None:
+        return ()
+    if 'elements' in bucket:
+        return bucket['elements']
+    return (bucket,)
+
+def bucket_size(bucket):
+    """
+    Retorna la cantidad de entradas de un bucket.
+
+    :param bucket: Posición de la tabla: None, una entrada o un arraylist.
+    :return: Número de entradas del bucket.
+    """
+    if bucket is None:
+        return 0
+    if 'elements' in bucket:
+        return bucket['size']
+    return 1
+
+def add_to_bucket(buckets, index, entry):
+    """
+    Agrega una entrada al bucket de la posición dada. Una posición vacía guarda la
+    entrada en línea; la segunda entrada convierte el bucket en un arraylist.
+
+    :param buckets: Lista de buckets de la tabla (table['elements']).
+    :param index: Posición del bucket.
+    :param entry: Entrada a agregar.
+    """
+    bucket = buckets[index]
+    if bucket is None:
+        buckets[index] = entry
+    elif 'hashes' in bucket:
+        pos = bisect_right(bucket['hashes'], entry['hash'])
+        bucket['hashes'].insert(pos, entry['hash'])
+        bucket['elements'].insert(pos, entry)
+        bucket['size'] += 1
+    elif 'elements' in bucket:
+        al.add_last(bucket, entry)
+        if bucket['size'] > SORT_THRESHOLD:
+            sort_chain(bucket)
+    else:
+        buckets[index] = {'elements': [bucket, entry], 'size': 2}
+
+def remove_from_bucket(buckets, index, key, hash_code):
+    """
+    Retira la entrada de una llave del bucket de la posición dada. Si el bucket queda
+    con una sola entrada vuelve a guardarse en línea, y si queda vacío vuelve a None.
+
+    :param buckets: Lista de buckets de la tabla (table['elements']).
+    :param index: Posición del bucket.
+    :param key: Llave de la entrada a retirar.
+    :param hash_code: Hash completo de la llave.
+    :return: La entrada retirada o None si la llave no estaba en el bucket.
+    """
+    bucket = buckets[index]
+    if bucket is None:
+        return None
+    if 'elements' not in bucket:
+        if bucket['hash'] == hash_code and bucket['key'] == key:
+            buckets[index] = None
+            return bucket
+        return None
+    if 'hashes' in bucket:
+        i = find_sorted(bucket, key, hash_code)
+        if i < 0:
+            return None
+        entry = bucket['elements'].pop(i)
+        bucket['hashes'].pop(i)
+        bucket['size'] -= 1
+        if bucket['size'] <= UNSORT_THRESHOLD:
+            del bucket['hashes']  # Sigue ordenada, pero se recorre linealmente
+        return entry
+    for i, entry in enumerate(bucket['elements']):
+        if entry['hash'] == hash_code and entry['key'] == key:
+            al.delete_element(bucket, i)
+            if bucket['size'] == 1:
+                buckets[index] = bucket['elements'][0]
+            return entry
+    return None
+
+def sort_chain(bucket):
+    """
+    Ordena una cadena larga por hash completo y le agrega la lista paralela 'hashes',
+    para buscar en ella con búsqueda binaria en vez de recorrerla.
+
+    Es la misma idea de las cadenas convertidas en árbol de HashMap en Java: con llaves
+    de poca entropía o adversarias que caen en el mismo bucket, la búsqueda pasa de
+    O(n) a O(log n). Solo las llaves con el mismo hash completo se comparan una a una.
+
+    :param bucket: Cadena (arraylist) a ordenar.
+    """
+    bucket['elements'].sort(key=get_hash)
+    bucket['hashes'] = [entry['hash'] for entry in bucket['elements']]
+
+def find_sorted(bucket, key, hash_code):
+    """
+    Busca con búsqueda binaria la posición de una llave en una cadena ordenada.
+
+    :param bucket: Cadena ordenada por hash (con 'hashes').
+    :param key: Llave buscada.
+    :param hash_code: Hash completo de la llave.
+    :return: Posición de la entrada o -1 si la llave no está en la cadena.
+    """
+    hashes = bucket['hashes']
+    elements = bucket['elements']
+    i = bisect_left(hashes, hash_code)
+    while i < len(hashes) and hashes[i] == hash_code:
+        if elements[i]['key'] == key:
+            return i
+        i += 1
+    return -1
+
+def bucket_index(my_map, hash_code):
+    """
+    Reduce el hash completo de una llave a la posición de su bucket en la tabla actual.
+
+    :param my_map: Tabla de símbolos.
+    :param hash_code: Hash completo de la llave.
+    :return: Posición del bucket.
+    """
+    if my_map['power_of_two']:
+        return hash_code & (my_map['capacity'] - 1)
+    return hash_code % my_map['capacity']
+
 def get_entry(my_map, key):
     """Busca una entrada en la tabla hash por su clave y la retorna si existe."""
-    index = hash_value(my_map, key)  
-    bucket = al.get_element(my_map['table'], index)  # Obtiene el bucket correspondiente
+    hash_code = full_hash(my_map, key)
+    bucket = al.get_element(my_map['table'], bucket_index(my_map, hash_code))  # Obtiene el bucket correspondiente
+    return find_in_bucket(bucket, key, hash_code)
 
-    for i in range(al.size(bucket)):  # Recorre el bucket
-        entry = al.get_element(bucket, i)
-        if get_key(entry) == key:
-            return entry  # Retorna la entrada si encuentra la clave
+def find_in_bucket(bucket, key, hash_code):
+    """
+    Busca en un bucket la entrada de una llave con su hash completo ya calculado.
+
+    Recorre directamente la lista de elementos del bucket; se compara primero el hash
+    guardado para evitar comparar llaves distintas.
 
+    :param bucket: Posición de la tabla: None, una entrada o un arraylist.
+    :param key: Llave buscada.
+    :param hash_code: Hash completo de la llave.
+    :return: La entrada o None si la llave no está en el bucket.
+    """
+    if bucket is None:
+        return None
+    if 'elements' not in bucket:
+        if bucket['hash'] == hash_code and bucket['key'] == key:
+            return bucket
+        return None
+    if 'hashes' in bucket:
+        i = find_sorted(bucket, key, hash_code)
+        return bucket['elements'][i] if i >= 0 else None
+    for entry in bucket['elements']:
+        if entry['hash'] == hash_code and entry['key'] == key:
+            return entry
     return None
 
+def old_bucket(my_map, hash_code):
+    """
+    Retorna el bucket de la tabla anterior donde estaría una llave con el hash dado
+    durante un rehash incremental, o None si no hay un rehash en curso.
+    """
+    if my_map['old_table'] is None:
+        return None
+    return my_map['old_table']['elements'][hash_code % my_map['old_capacity']]
+
+def take_from_old(my_map, key, hash_code):
+    """
+    Retira la entrada de la llave de la tabla anterior si aún no se ha migrado.
+
+    :return: La entrada retirada o None si la llave no estaba en la tabla anterior.
+    """
+    if my_map['old_table'] is None:
+        return None
+    return remove_from_bucket(my_map['old_table']['elements'], hash_code % my_map['old_capacity'],
+                              key, hash_code)
+
+def migrate(my_map, steps):
+    """
+    Mueve a la tabla actual las entradas de hasta steps buckets de la tabla anterior.
+    Al terminar de recorrerla, la tabla anterior se descarta.
+    """
+    old_table = my_map['old_table']
+    if old_table is None:
+        return my_map
+
+    start_time = time.perf_counter()
+    start = my_map['migrate_pos']
+    stop = min(start + steps, my_map['old_capacity'])
+    buckets = my_map['table']['elements']
+    for i in range(start, stop):
+        for entry in bucket_entries(old_table['elements'][i]):
+            add_to_bucket(buckets, bucket_index(my_map, get_hash(entry)), entry)
+        old_table['elements'][i] = None
+
+    my_map['migrate_pos'] = stop
+    if stop == my_map['old_capacity']:
+        my_map['old_table'] = None
+        my_map['old_capacity'] = 0
+    my_map['rehash_time'] += (time.perf_counter() - start_time) * 1000
+    return my_map
+
 def put(my_map, key, value):
     """Inserta o actualiza un valor en la tabla hash."""
-    index = hash_value(my_map, key)
-    bucket = al.get_element(my_map['table'], index)
-    
-    existing_entry = get_entry(my_map, key)  # 🔹 Se llama get_entry con my_map como argumento
+    if my_map['old_table'] is not None:
+        migrate(my_map, my_map['migrate_step'])
+
+    # Una sola pasada: se calcula el hash, se ubica el bucket y se busca la llave en él
+    hash_code = full_hash(my_map, key)
+    buckets = my_map['table']['elements']
+    index = bucket_index(my_map, hash_code)
+    existing_entry = find_in_bucket(buckets[index], key, hash_code)
 
-    if existing_entry:
+    if existing_entry is not None:
         set_value(existing_entry, value)
+    elif my_map['old_table'] is not None and take_from_old(my_map, key, hash_code) is not None:
+        # La llave estaba en la tabla anterior: se mueve a la actual sin cambiar el tamaño
+        add_to_bucket(buckets, index, new_map_entry(key, value, hash_code))
     else:
-        new_entry = new_map_entry(key, value)
-        al.add_last(bucket, new_entry)
+        add_to_bucket(buckets, index, new_map_entry(key, value, hash_code))
         my_map['size'] += 1
         
         my_map['current_factor'] = my_map['size'] / my_map['capacity']
@@ -57,6 +304,66 @@ def put(my_map, key, value):
     
     return my_map
 
+def get_or_insert(my_map, key, factory):
+    """
+    Retorna el valor asociado a una llave; si no está, guarda factory() con esa llave y
+    lo retorna.
+
+    Reemplaza la secuencia get + put (o contains + get + put) con una sola búsqueda en
+    el bucket. factory no debe modificar el mapa.
+
+    :param my_map: Tabla de símbolos.
+    :param key: Llave buscada.
+    :param factory: Función sin parámetros que crea el valor de una llave nueva.
+    :return: Valor asociado a la llave.
+    """
+    return upsert(my_map, key, None, factory)
+
+def update(my_map, key, fn, default=None):
+    """
+    Reemplaza el valor asociado a una llave por fn(valor) y retorna el valor nuevo. Si
+    la llave no está se guarda fn(default). fn no debe modificar el mapa.
+
+    :param my_map: Tabla de símbolos.
+    :param key: Llave a actualizar.
+    :param fn: Función que recibe el valor actual y retorna el nuevo.
+    :param default: Valor que recibe fn cuando la llave no está.
+    :return: Valor nuevo asociado a la llave.
+    """
+    return upsert(my_map, key, fn, lambda: default)
+
+def upsert(my_map, key, fn, missing):
+    """
+    Búsqueda única de get_or_insert y update. Si la llave está, se le aplica fn a su
+    valor (si fn no es None); si no está, se guarda fn(missing()) o missing().
+
+    :return: Valor que queda asociado a la llave.
+    """
+    if my_map['old_table'] is not None:
+        migrate(my_map, my_map['migrate_step'])
+
+    hash_code = full_hash(my_map, key)
+    buckets = my_map['table']['elements']
+    index = bucket_index(my_map, hash_code)
+    entry = find_in_bucket(buckets[index], key, hash_code)
+
+    if entry is None:
+        entry = take_from_old(my_map, key, hash_code)
+        if entry is None:
+            entry = new_map_entry(key, missing(), hash_code)
+            my_map['size'] += 1
+        add_to_bucket(buckets, index, entry)
+        if fn is not None:
+            set_value(entry, fn(get_value(entry)))
+        my_map['current_factor'] = my_map['size'] / my_map['capacity']
+        if my_map['current_factor'] > my_map['limit_factor']:
+            rehash(my_map)
+        return get_value(entry)
+
+    if fn is not None:
+        set_value(entry, fn(get_value(entry)))
+    return get_value(entry)
+
 def default_compare(key, element):
     """
     Función de comparación por defecto para comparar una llave con una entrada.
@@ -81,16 +388,13 @@ def contains(my_map, key):
     :param key: Llave que se desea verificar.
     :return: True si la llave está en la tabla, False en caso contrario.
     """
-    index = hash_value(my_map, key)
-    
-    bucket = al.get_element(my_map['table'], index)
+    hash_code = full_hash(my_map, key)
     
-    for i in range(al.size(bucket)):
-        entry = al.get_element(bucket, i)
-        if default_compare(key, entry) == 0:
-            return True
-    
-    return False
+    bucket = my_map['table']['elements'][bucket_index(my_map, hash_code)]
+    if find_in_bucket(bucket, key, hash_code) is not None:
+        return True
+
+    return find_in_bucket(old_bucket(my_map, hash_code), key, hash_code) is not None
 
 def remove(my_map, key):
     """
@@ -100,22 +404,37 @@ def remove(my_map, key):
     :param key: Llave de la entrada que se desea eliminar.
     :return: Tabla de símbolos con la entrada eliminada.
     """
-    # Obtener el índice de la clave en la tabla
-    index = hash_value(my_map, key)
+    if my_map['old_table'] is not None:
+        migrate(my_map, my_map['migrate_step'])
 
-    # Obtener el bucket (lista dentro del arraylist)
-    bucket = al.get_element(my_map['table'], index)
+    # Obtener el hash de la clave, que también ubica su bucket en la tabla
+    hash_code = full_hash(my_map, key)
 
-    # Buscar la entrada con la clave dada
-    for i in range(al.size(bucket)):
-        entry = al.get_element(bucket, i)
-        if get_key(entry) == key:
-            al.delete_element(bucket, i)  # Eliminar la entrada del bucket
-            my_map['size'] -= 1  # Reducir el tamaño total de la tabla
-            return my_map  # Retornar la tabla actualizada
+    # Buscar y retirar la entrada con la clave dada de su bucket
+    # También puede seguir en la tabla anterior si hay un rehash incremental en curso
+    if remove_from_bucket(my_map['table']['elements'], bucket_index(my_map, hash_code), key, hash_code) is not None \
+            or take_from_old(my_map, key, hash_code) is not None:
+        my_map['size'] -= 1  # Reducir el tamaño total de la tabla
+        my_map['current_factor'] = my_map['size'] / my_map['capacity']
+        if my_map['current_factor'] < my_map['min_factor'] and my_map['capacity'] > my_map['min_capacity']:
+            shrink(my_map)
 
     return my_map  
 
+def shrink(my_map):
+    """
+    Reduce la tabla para que el factor de carga quede en la mitad de limit_factor, sin
+    bajar de la capacidad inicial. La tabla se reconstruye de una vez.
+
+    :param my_map: Tabla de símbolos a reducir.
+    :return: Tabla de símbolos reducida.
+    """
+    new_capacity = next_capacity(int(2 * my_map['size'] / my_map['limit_factor']), my_map['power_of_two'])
+    new_capacity = max(new_capacity, my_map['min_capacity'])
+    if new_capacity < my_map['capacity']:
+        resize(my_map, new_capacity)
+    return my_map
+
 def get(my_map, key):
     """
     Obtiene el valor asociado a una llave en la tabla de símbolos.
@@ -124,16 +443,58 @@ def get(my_map, key):
     :param key: Llave de la cual se desea obtener el valor asociado.
     :return: Valor asociado a la llave en la tabla de símbolos, o None si la llave no existe.
     """
-    index = hash_value(my_map, key)
-    bucket = al.get_element(my_map['table'], index)
-
-    for i in range(al.size(bucket)):
-        entry = al.get_element(bucket, i)
-        if get_key(entry) == key:
-            return get_value(entry) 
+    hash_code = full_hash(my_map, key)
+    entry = find_in_bucket(my_map['table']['elements'][bucket_index(my_map, hash_code)], key, hash_code)
+    if entry is None:
+        entry = find_in_bucket(old_bucket(my_map, hash_code), key, hash_code)
 
+    if entry is not None:
+        return get_value(entry)
     return None 
 
+def get_many(my_map, keys):
+    """
+    Obtiene los valores de un lote de llaves, en el mismo orden en que llegan.
+
+    El hash y la búsqueda en los buckets se hacen en un solo ciclo con la tabla en
+    variables locales, sin pasar por get en cada llave.
+
+    :param my_map: Tabla de símbolos de la cual se desean obtener los valores.
+    :param keys: Arraylist o cualquier iterable de llaves.
+    :return: Arraylist con el valor de cada llave, o None si la llave no existe.
+    """
+    if isinstance(keys, dict) and 'elements' in keys:
+        keys = keys['elements']
+
+    buckets = my_map['table']['elements']
+    capacity = my_map['capacity']
+    power_of_two = my_map['power_of_two']
+    scale = my_map['scale']
+    shift = my_map['shift']
+    prime = my_map['prime']
+    has_old = my_map['old_table'] is not None
+
+    values = []
+    for key in keys:
+        if power_of_two:
+            hash_code = mix_hash(key)
+        else:
+            hash_code = int(abs(scale * hash(key) + shift) % prime)
+        bucket = buckets[hash_code % capacity]
+        entry = None
+        if bucket is not None:
+            if 'elements' not in bucket:
+                # Bucket con una sola entrada en línea, el caso más común
+                if bucket['hash'] == hash_code and bucket['key'] == key:
+                    entry = bucket
+            else:
+                entry = find_in_bucket(bucket, key, hash_code)
+        if entry is None and has_old:
+            entry = find_in_bucket(old_bucket(my_map, hash_code), key, hash_code)
+        values.append(entry['value'] if entry is not None else None)
+
+    return {'elements': values, 'size': len(values)}
+
 def size(my_map):
     """
     Obtiene la cantidad de elementos en la tabla de símbolos.
@@ -152,16 +513,22 @@ def is_empty(my_map):
     """
     return my_map['size'] == 0
 
+def tables(my_map):
+    """
+    Obtiene las tablas con entradas del mapa: la actual y, durante un rehash
+    incremental, la anterior.
+    """
+    if my_map['old_table'] is not None:
+        return [my_map['table'], my_map['old_table']]
+    return [my_map['table']]
+
 def key_set(my_map):
     """
     Obtiene la lista de llaves de la tabla de símbolos.
     """
     keys = al.new_list()  
-    for i in range(al.size(my_map['table'])):  # Itera sobre los buckets
-        bucket = al.get_element(my_map['table'], i)
-        for j in range(al.size(bucket)):  # Itera sobre cada entrada en el bucket
-            entry = al.get_element(bucket, j)
-            al.add_last(keys, get_key(entry))
+    for key in iter_keys(my_map):
+        al.add_last(keys, key)
     
     return keys
 
@@ -170,28 +537,238 @@ def value_set(my_map):
     Obtiene la lista de valores de la tabla de símbolos.
     """
     values = al.new_list()
-    for i in range(al.size(my_map['table'])):
-        bucket = al.get_element(my_map['table'], i)
-        for j in range(al.size(bucket)):
-            entry = al.get_element(bucket, j)
-            al.add_last(values, get_value(entry))
+    for value in iter_values(my_map):
+        al.add_last(values, value)
     
     return values
 
+def iter_items(my_map):
+    """
+    Recorre las parejas (llave, valor) de la tabla de símbolos sin construir una lista.
+
+    Es un generador: recorre los buckets directamente y se puede abandonar en cualquier
+    momento. El mapa no debe modificarse mientras se recorre.
+
+    :param my_map: Tabla de símbolos a recorrer.
+    :return: Generador de parejas (llave, valor).
+    """
+    for table in tables(my_map):
+        for bucket in table['elements']:  # Itera sobre los buckets
+            if bucket is None:
+                continue
+            if 'elements' not in bucket:
+                yield bucket['key'], bucket['value']
+            else:
+                for entry in bucket['elements']:  # Itera sobre cada entrada en el bucket
+                    yield entry['key'], entry['value']
+
+def iter_keys(my_map):
+    """
+    Recorre las llaves de la tabla de símbolos sin construir una lista (ver iter_items).
+
+    :param my_map: Tabla de símbolos a recorrer.
+    :return: Generador de llaves.
+    """
+    for key, value in iter_items(my_map):
+        yield key
+
+def iter_values(my_map):
+    """
+    Recorre los valores de la tabla de símbolos sin construir una lista (ver iter_items).
+
+    :param my_map: Tabla de símbolos a recorrer.
+    :return: Generador de valores.
+    """
+    for key, value in iter_items(my_map):
+        yield value
+
 
 def rehash(my_map):
     """Duplica la capacidad de la tabla hash y reorganiza los elementos."""
     old_table = my_map['table']
-    new_capacity = my_map['capacity'] * 2 + 1  # Asegura que crezca correctamente
+    new_capacity = grown_capacity(my_map)
+
+    if my_map['incremental']:
+        # Un rehash pendiente se termina antes de empezar el siguiente
+        if my_map['old_table'] is not None:
+            migrate(my_map, my_map['old_capacity'])
+        start_time = time.perf_counter()
+        my_map['old_table'] = old_table
+        my_map['old_capacity'] = my_map['capacity']
+        my_map['migrate_pos'] = 0
+        my_map['capacity'] = new_capacity
+        my_map['table'] = new_table(new_capacity)
+        my_map['current_factor'] = my_map['size'] / new_capacity
+        record_rehash(my_map, start_time)
+        return my_map
+
+    return resize(my_map, new_capacity)
+
+
+def record_rehash(my_map, start_time):
+    """
+    Actualiza los contadores de rehash del mapa.
+
+    :param my_map: Tabla de símbolos que se redimensionó.
+    :param start_time: Instante de inicio del rehash, tomado con time.perf_counter.
+    """
+    my_map['rehash_count'] += 1
+    my_map['rehash_time'] += (time.perf_counter() - start_time) * 1000
+
+
+def grown_capacity(my_map):
+    """
+    Calcula la capacidad a la que crece la tabla en un rehash: el siguiente primo de
+    capacidad (aproximadamente el doble), o el doble si la tabla usa potencias de dos.
+
+    :param my_map: Tabla de símbolos que va a crecer.
+    :return: Nueva capacidad.
+    """
+    return next_capacity(my_map['capacity'], my_map['power_of_two'])
+
+
+def resize(my_map, new_capacity):
+    """
+    Reubica todas las entradas en una tabla nueva con la capacidad dada.
+
+    :param my_map: Tabla de símbolos a redimensionar.
+    :param new_capacity: Número de buckets de la tabla nueva.
+    :return: Tabla de símbolos redimensionada.
+    """
+    if my_map['old_table'] is not None:
+        migrate(my_map, my_map['old_capacity'])
+
+    start_time = time.perf_counter()
+    old_table = my_map['table']
     my_map['capacity'] = new_capacity
-    my_map['size'] = 0  # Se reinicia porque se volverán a insertar los elementos
-    
-    my_map['table'] = al.new_list()
-    for _ in range(new_capacity):
-        al.add_last(my_map['table'], al.new_list())  # Agregamos listas vacías
-
-    for i in range(al.size(old_table)):
-        bucket = al.get_element(old_table, i)
-        for j in range(al.size(bucket)):
-            entry = al.get_element(bucket, j)
-            put(my_map, get_key(entry), get_value(entry))  
+    my_map['table'] = new_table(new_capacity)
+
+    # Cada entrada guarda su hash, así que basta con recalcular el módulo
+    buckets = my_map['table']['elements']
+    for bucket in old_table['elements']:
+        for entry in bucket_entries(bucket):
+            add_to_bucket(buckets, bucket_index(my_map, get_hash(entry)), entry)
+
+    my_map['current_factor'] = my_map['size'] / new_capacity
+    record_rehash(my_map, start_time)
+    return my_map
+
+
+def put_all(my_map, items, size_hint=None):
+    """
+    Agrega todas las parejas (llave, valor) de items redimensionando la tabla una sola vez.
+
+    La capacidad se calcula con len(items) o con size_hint si items no tiene longitud.
+    Si la estimación se queda corta, la tabla crece al sobrepasar el factor de carga.
+
+    :param my_map: Tabla de símbolos en la que se insertan las parejas.
+    :param items: Iterable de parejas (llave, valor).
+    :param size_hint: Número estimado de parejas.
+    :return: Tabla de símbolos con las parejas agregadas.
+    """
+    if size_hint is None:
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        size_hint = len(items)
+
+    needed = my_map['size'] + size_hint
+    if my_map['old_table'] is not None or needed > my_map['limit_factor'] * my_map['capacity']:
+        resize(my_map, max(my_map['capacity'],
+                           next_capacity(int(needed / my_map['limit_factor']), my_map['power_of_two'])))
+
+    capacity = my_map['capacity']
+    buckets = my_map['table']['elements']
+    threshold = int(my_map['limit_factor'] * capacity)
+
+    for key, value in items:
+        hash_code = full_hash(my_map, key)
+        index = bucket_index(my_map, hash_code)
+        entry = find_in_bucket(buckets[index], key, hash_code)
+        if entry is not None:
+            entry['value'] = value
+        else:
+            add_to_bucket(buckets, index, new_map_entry(key, value, hash_code))
+            my_map['size'] += 1
+            if my_map['size'] > threshold:
+                resize(my_map, grown_capacity(my_map))
+                capacity = my_map['capacity']
+                buckets = my_map['table']['elements']
+                threshold = int(my_map['limit_factor'] * capacity)
+
+    my_map['current_factor'] = my_map['size'] / capacity
+    return my_map
+
+
+def from_items(items, load_factor, size_hint=None, prime=109345121, power_of_two=False):
+    """
+    Crea una tabla de símbolos con las parejas (llave, valor) de items.
+
+    :param items: Iterable de parejas (llave, valor).
+    :param load_factor: Factor de carga límite de la tabla.
+    :param size_hint: Número estimado de parejas, si items no tiene longitud.
+    :param prime: Primo usado por la función de hash MAD.
+    :param power_of_two: True para usar capacidades potencia de dos.
+    :return: Tabla de símbolos con las parejas de items.
+    """
+    if size_hint is None:
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        size_hint = len(items)
+    my_map = new_map(max(1, size_hint), load_factor, prime, power_of_two=power_of_two)
+    return put_all(my_map, items, size_hint)
+
+
+def stats(my_map):
+    """
+    Calcula estadísticas de las cadenas de la tabla actual.
+
+    Las operaciones solo mantienen los contadores de rehash; las longitudes se
+    calculan aquí recorriendo los buckets una vez. Una búsqueda exitosa compara
+    tantas llaves como la posición de la entrada en su cadena más uno; una fallida
+    compara todas las llaves de la cadena. En una cadena ordenada ambas comparan a lo
+    sumo bit_length(n) hashes. Durante un rehash incremental no se consideran las
+    entradas sin migrar.
+
+    :param my_map: Tabla de símbolos a analizar.
+    :return: Diccionario con size, capacity, load_factor, hit_probe_mean, hit_probe_max,
+        miss_probe_mean, miss_probe_max, chain_histogram (longitud de cadena -> cantidad
+        de buckets), sorted_buckets (cadenas ordenadas), rehash_count, rehash_time (ms) y
+        tombstone_ratio, que siempre es 0.
+    """
+    capacity = my_map['capacity']
+    chains = {}
+    hits = 0
+    hit_total = 0
+    miss_total = 0
+    probe_max = 0
+    sorted_buckets = 0
+    for bucket in my_map['table']['elements']:
+        length = bucket_size(bucket)
+        chains[length] = chains.get(length, 0) + 1
+        hits += length
+        if bucket is not None and 'hashes' in bucket:
+            # La búsqueda binaria compara a lo sumo bit_length(n) hashes
+            sorted_buckets += 1
+            probes = length.bit_length()
+            hit_total += length * probes
+            miss_total += probes
+        else:
+            probes = length
+            hit_total += length * (length + 1) // 2
+            miss_total += length
+        probe_max = max(probe_max, probes)
+
+    return {
+        'size': my_map['size'],
+        'capacity': capacity,
+        'load_factor': my_map['size'] / capacity,
+        'hit_probe_mean': hit_total / hits if hits > 0 else 0,
+        'hit_probe_max': probe_max,
+        'miss_probe_mean': miss_total / capacity,
+        'miss_probe_max': probe_max,
+        'chain_histogram': chains,
+        'sorted_buckets': sorted_buckets,
+        'rehash_count': my_map['rehash_count'],
+        'rehash_time': my_map['rehash_time'],
+        'tombstone_ratio': 0,
+    }
@@ -0,0 +1,105 @@
+"""
+    Tabla de símbolos con varios valores por llave (**multimapa**).
+
+    Guarda cada grupo de valores como una lista de Python dentro de un mapa de
+    linear probing (llave -> lista), en vez de un array_list por llave. Los valores
+    de una llave quedan contiguos, agregar un valor hace un solo sondeo y cada llave
+    no paga el diccionario de un array_list.
+"""
+
+from DataStructures.Map import map_linear_probing as lp
+from DataStructures.List import array_list as al
+
+
+def new_map(num_elements, load_factor, exact_capacity=False):
+    """
+    Crea un multimapa vacío.
+
+    :param num_elements: Número estimado de llaves distintas.
+    :type num_elements: int
+    :param load_factor: Factor de carga límite del mapa de llaves.
+    :type load_factor: float
+    :param exact_capacity: Ver map_linear_probing.new_map.
+    :type exact_capacity: bool
+
+    :return: Multimapa vacío.
+    :rtype: dict
+    """
+    return {'map': lp.new_map(num_elements, load_factor, exact_capacity=exact_capacity), 'size': 0}
+
+
+def add(my_multimap, key, value):
+    """
+    Agrega un valor al grupo de una llave, creando el grupo si la llave es nueva.
+
+    :param my_multimap: Multimapa en el que se agrega el valor.
+    :param key: Llave del grupo.
+    :param value: Valor a agregar al final del grupo.
+    :return: El multimapa con el valor agregado.
+    """
+    lp.get_or_insert(my_multimap['map'], key, list).append(value)
+    my_multimap['size'] += 1
+    return my_multimap
+
+
+def get_all(my_multimap, key):
+    """
+    Retorna los valores de una llave, en el orden en que se agregaron.
+
+    :param my_multimap: Multimapa en el que se busca.
+    :param key: Llave del grupo.
+    :return: Lista (array_list) con una copia de los valores; vacía si la llave no existe.
+    """
+    values = lp.get(my_multimap['map'], key)
+    if values is None:
+        return al.new_list()
+    return {'elements': list(values), 'size': len(values)}
+
+
+def count(my_multimap, key):
+    """
+    Retorna el número de valores de una llave, 0 si no existe.
+    """
+    values = lp.get(my_multimap['map'], key)
+    if values is None:
+        return 0
+    return len(values)
+
+
+def iter_group(my_multimap, key):
+    """
+    Recorre los valores de una llave sin copiarlos. Es un generador que se puede
+    abandonar en cualquier momento; el grupo no debe modificarse mientras se recorre.
+
+    :param my_multimap: Multimapa en el que se busca.
+    :param key: Llave del grupo.
+    :return: Generador de valores; no produce nada si la llave no existe.
+    """
+    values = lp.get(my_multimap['map'], key)
+    if values is not None:
+        yield from values
+
+
+def contains(my_multimap, key):
+    """Indica si la llave tiene al menos un valor."""
+    return lp.contains(my_multimap['map'], key)
+
+
+def size(my_multimap):
+    """Retorna el número total de valores del multimapa."""
+    return my_multimap['size']
+
+
+def key_count(my_multimap):
+    """Retorna el número de llaves distintas del multimapa."""
+    return lp.size(my_multimap['map'])
+
+
+def is_empty(my_multimap):
+    """Indica si el multimapa no tiene valores."""
+    return my_multimap['size'] == 0
+
+
+def iter_keys(my_multimap):
+    """Recorre las llaves distintas del multimapa sin construir una lista."""
+    return lp.iter_keys(my_multimap['map'])
@@ -0,0 +1,101 @@
+import random
+
+from DataStructures.Tree import red_black_tree as rbt
+from DataStructures.Tree import rbt_node as rbn
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    tree = rbt.new_map()
+    for key in [50, 20, 80, 10, 30, 70, 90, 60]:
+        rbt.put(tree, key, str(key))
+    return tree
+
+
+def black_height(node):
+    """Valida las propiedades del árbol y retorna su altura negra."""
+    if node is None:
+        return 1
+    assert not rbn.is_red(node["right"])
+    assert not (rbn.is_red(node) and rbn.is_red(node["left"]))
+    assert node["size"] == 1 + rbt.size_tree(node["left"]) + rbt.size_tree(node["right"])
+    left = black_height(node["left"])
+    assert left == black_height(node["right"])
+    return left + (0 if rbn.is_red(node) else 1)
+
+
+@handle_not_implemented
+def test_new_map():
+    tree = rbt.new_map()
+    assert rbt.is_empty(tree)
+    assert rbt.size(tree) == 0
+    assert rbt.get_min(tree) is None
+    assert rbt.get(tree, 1) is None
+
+
+@handle_not_implemented
+def test_put_get():
+    tree = setup_tests()
+    assert rbt.size(tree) == 8
+    assert rbt.get(tree, 30) == "30"
+    assert rbt.contains(tree, 60)
+    assert not rbt.contains(tree, 65)
+
+    rbt.put(tree, 30, "treinta")
+    assert rbt.get(tree, 30) == "treinta"
+    assert rbt.size(tree) == 8
+
+
+@handle_not_implemented
+def test_balance():
+    tree = rbt.new_map()
+    # Llaves en orden: el peor caso de un árbol binario sin balancear
+    for key in range(1024):
+        rbt.put(tree, key, key)
+    assert rbt.size(tree) == 1024
+    assert rbt.height(tree) <= 2 * 10
+    black_height(tree["root"])
+
+    keys = list(range(2000))
+    random.Random(7).shuffle(keys)
+    tree = rbt.new_map()
+    for key in keys:
+        rbt.put(tree, key, key)
+    black_height(tree["root"])
+    assert lt.size(rbt.key_set(tree)) == 2000
+    assert rbt.key_set(tree)["elements"] == sorted(keys)
+
+
+@handle_not_implemented
+def test_min_max_floor_ceiling():
+    tree = setup_tests()
+    assert rbt.get_min(tree) == 10
+    assert rbt.get_max(tree) == 90
+    assert rbt.floor(tree, 55) == 50
+    assert rbt.floor(tree, 50) == 50
+    assert rbt.floor(tree, 5) is None
+    assert rbt.ceiling(tree, 55) == 60
+    assert rbt.ceiling(tree, 90) == 90
+    assert rbt.ceiling(tree, 95) is None
+
+
+@handle_not_implemented
+def test_range():
+    tree = setup_tests()
+    assert rbt.keys(tree, 25, 70)["elements"] == [30, 50, 60, 70]
+    assert rbt.values(tree, 10, 20)["elements"] == ["10", "20"]
+    assert lt.size(rbt.keys(tree, 91, 100)) == 0
+    assert rbt.value_set(tree)["elements"] == [str(key) for key in [10, 20, 30, 50, 60, 70, 80, 90]]
+
+
+@handle_not_implemented
+def test_cmp_function():
+    def reverse(key_a, key_b):
+        return rbt.default_compare(key_b, key_a)
+
+    tree = rbt.new_map(reverse)
+    for key in range(10):
+        rbt.put(tree, key, key)
+    assert rbt.get_min(tree) == 9
+    assert rbt.keys(tree, 7, 3)["elements"] == [7, 6, 5, 4, 3]
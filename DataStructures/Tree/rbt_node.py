@@ -0,0 +1,56 @@
+"""
+  Estructura que contiene la información a guardar en un nodo de un árbol rojo-negro
+"""
+
+RED = 0
+BLACK = 1
+
+
+def new_node(key, value, color=RED):
+    """
+    Crea un nuevo nodo de un árbol rojo-negro con una llave y un valor dados.
+
+    El nodo es creado con los siguientes atributos:
+
+    * **key**: Llave del nodo.
+    * **value**: Valor asociado a la llave.
+    * **size**: Número de nodos del subárbol que tiene al nodo como raíz. Inicializado en 1.
+    * **color**: Color del enlace que llega al nodo desde su padre (RED o BLACK).
+    * **left**: Hijo izquierdo. Inicializado en None.
+    * **right**: Hijo derecho. Inicializado en None.
+
+    :param key: Llave del nodo.
+    :type key: any
+    :param value: Valor del nodo.
+    :type value: any
+    :param color: Color del nodo.
+    :type color: int
+
+    :return: Nodo creado.
+    :rtype: dict
+    """
+    node = {"key": key, "value": value, "size": 1, "color": color, "left": None, "right": None}
+    return node
+
+
+def is_red(node):
+    """
+    Indica si el enlace que llega a un nodo es rojo. Un nodo vacío (None) es negro.
+
+    :param node: Nodo a examinar.
+    :type node: rbt_node
+
+    :return: True si el nodo es rojo.
+    :rtype: bool
+    """
+    return node is not None and node["color"] == RED
+
+
+def get_key(node):
+    """Retorna la llave de un nodo."""
+    return node["key"]
+
+
+def get_value(node):
+    """Retorna el valor de un nodo."""
+    return node["value"]
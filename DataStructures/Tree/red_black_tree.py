@@ -0,0 +1,295 @@
+"""
+    Tabla de símbolos ordenada implementada con un árbol rojo-negro inclinado a la
+    izquierda (left-leaning red-black tree, Sedgewick).
+
+    A diferencia de los mapas de hash, las llaves se mantienen en orden, por lo que
+    además de put/get permite consultas por rango (keys, values), floor, ceiling,
+    get_min y get_max en O(log n) más el tamaño de la respuesta.
+"""
+
+from DataStructures.Tree import rbt_node as rbn
+from DataStructures.List import array_list as al
+
+
+def new_map(cmp_function=None):
+    """
+    Crea una tabla de símbolos ordenada vacía.
+
+    :param cmp_function: Función de comparación de llaves cmp(key_a, key_b) que retorna
+        -1, 0 o 1. Si es None se usa default_compare.
+    :type cmp_function: function
+
+    :return: Árbol rojo-negro vacío.
+    :rtype: dict
+    """
+    if cmp_function is None:
+        cmp_function = default_compare
+    return {"root": None, "cmp_function": cmp_function}
+
+
+def default_compare(key_a, key_b):
+    """
+    Función de comparación por defecto entre dos llaves.
+
+    :return: 0 si son iguales, 1 si key_a > key_b, -1 si key_a < key_b
+    """
+    if key_a == key_b:
+        return 0
+    elif key_a > key_b:
+        return 1
+    return -1
+
+
+def size_tree(node):
+    """Retorna el número de nodos del subárbol, 0 si es vacío."""
+    if node is None:
+        return 0
+    return node["size"]
+
+
+def rotate_left(node):
+    """Rota a la izquierda el enlace rojo derecho de node. Retorna la nueva raíz del subárbol."""
+    child = node["right"]
+    node["right"] = child["left"]
+    child["left"] = node
+    child["color"] = node["color"]
+    node["color"] = rbn.RED
+    child["size"] = node["size"]
+    node["size"] = 1 + size_tree(node["left"]) + size_tree(node["right"])
+    return child
+
+
+def rotate_right(node):
+    """Rota a la derecha el enlace rojo izquierdo de node. Retorna la nueva raíz del subárbol."""
+    child = node["left"]
+    node["left"] = child["right"]
+    child["right"] = node
+    child["color"] = node["color"]
+    node["color"] = rbn.RED
+    child["size"] = node["size"]
+    node["size"] = 1 + size_tree(node["left"]) + size_tree(node["right"])
+    return child
+
+
+def flip_colors(node):
+    """Divide un nodo 4 temporal: los hijos pasan a negro y el enlace a node a rojo."""
+    node["color"] = rbn.RED
+    node["left"]["color"] = rbn.BLACK
+    node["right"]["color"] = rbn.BLACK
+
+
+def put(my_rbt, key, value):
+    """
+    Agrega una pareja llave-valor al árbol. Si la llave ya existe se reemplaza su valor.
+
+    :param my_rbt: Árbol en el que se inserta.
+    :param key: Llave a insertar.
+    :param value: Valor asociado a la llave.
+    :return: El árbol con la pareja agregada.
+    """
+    my_rbt["root"] = insert_node(my_rbt["root"], key, value, my_rbt["cmp_function"])
+    my_rbt["root"]["color"] = rbn.BLACK
+    return my_rbt
+
+
+def insert_node(node, key, value, cmp_function):
+    """
+    Inserta la pareja en el subárbol con raíz node y lo rebalancea de regreso.
+
+    :return: La nueva raíz del subárbol.
+    """
+    if node is None:
+        return rbn.new_node(key, value)
+
+    cmp = cmp_function(key, node["key"])
+    if cmp < 0:
+        node["left"] = insert_node(node["left"], key, value, cmp_function)
+    elif cmp > 0:
+        node["right"] = insert_node(node["right"], key, value, cmp_function)
+    else:
+        node["value"] = value
+
+    # Se mantiene la inclinación a la izquierda y se dividen los nodos 4
+    if rbn.is_red(node["right"]) and not rbn.is_red(node["left"]):
+        node = rotate_left(node)
+    if rbn.is_red(node["left"]) and rbn.is_red(node["left"]["left"]):
+        node = rotate_right(node)
+    if rbn.is_red(node["left"]) and rbn.is_red(node["right"]):
+        flip_colors(node)
+
+    node["size"] = 1 + size_tree(node["left"]) + size_tree(node["right"])
+    return node
+
+
+def get_node(my_rbt, key):
+    """Retorna el nodo de la llave o None si no está en el árbol."""
+    node = my_rbt["root"]
+    cmp_function = my_rbt["cmp_function"]
+    while node is not None:
+        cmp = cmp_function(key, node["key"])
+        if cmp == 0:
+            return node
+        node = node["left"] if cmp < 0 else node["right"]
+    return None
+
+
+def get(my_rbt, key):
+    """
+    Obtiene el valor asociado a una llave.
+
+    :return: El valor asociado o None si la llave no existe.
+    """
+    node = get_node(my_rbt, key)
+    if node is None:
+        return None
+    return node["value"]
+
+
+def contains(my_rbt, key):
+    """Indica si la llave se encuentra en el árbol."""
+    return get_node(my_rbt, key) is not None
+
+
+def size(my_rbt):
+    """Retorna el número de parejas llave-valor del árbol."""
+    return size_tree(my_rbt["root"])
+
+
+def is_empty(my_rbt):
+    """Indica si el árbol está vacío."""
+    return my_rbt["root"] is None
+
+
+def height(my_rbt):
+    """Retorna la altura del árbol; un árbol vacío tiene altura 0."""
+    return height_tree(my_rbt["root"])
+
+
+def height_tree(node):
+    """Retorna la altura del subárbol con raíz node."""
+    if node is None:
+        return 0
+    return 1 + max(height_tree(node["left"]), height_tree(node["right"]))
+
+
+def get_min(my_rbt):
+    """Retorna la menor llave del árbol o None si está vacío."""
+    node = my_rbt["root"]
+    if node is None:
+        return None
+    while node["left"] is not None:
+        node = node["left"]
+    return node["key"]
+
+
+def get_max(my_rbt):
+    """Retorna la mayor llave del árbol o None si está vacío."""
+    node = my_rbt["root"]
+    if node is None:
+        return None
+    while node["right"] is not None:
+        node = node["right"]
+    return node["key"]
+
+
+def floor(my_rbt, key):
+    """
+    Retorna la mayor llave del árbol menor o igual a key, o None si no existe.
+    """
+    node = my_rbt["root"]
+    cmp_function = my_rbt["cmp_function"]
+    best = None
+    while node is not None:
+        cmp = cmp_function(key, node["key"])
+        if cmp == 0:
+            return node["key"]
+        if cmp < 0:
+            node = node["left"]
+        else:
+            best = node["key"]
+            node = node["right"]
+    return best
+
+
+def ceiling(my_rbt, key):
+    """
+    Retorna la menor llave del árbol mayor o igual a key, o None si no existe.
+    """
+    node = my_rbt["root"]
+    cmp_function = my_rbt["cmp_function"]
+    best = None
+    while node is not None:
+        cmp = cmp_function(key, node["key"])
+        if cmp == 0:
+            return node["key"]
+        if cmp > 0:
+            node = node["right"]
+        else:
+            best = node["key"]
+            node = node["left"]
+    return best
+
+
+def keys(my_rbt, key_initial, key_final):
+    """
+    Retorna en orden las llaves del árbol que están en el rango [key_initial, key_final].
+
+    Solo se visitan los subárboles que pueden tener llaves del rango.
+
+    :return: Lista (array_list) de llaves.
+    """
+    result = al.new_list()
+    collect_range(my_rbt["root"], key_initial, key_final, my_rbt["cmp_function"], result, "key")
+    return result
+
+
+def values(my_rbt, key_initial, key_final):
+    """
+    Retorna, en el orden de sus llaves, los valores cuyas llaves están en el rango
+    [key_initial, key_final].
+
+    :return: Lista (array_list) de valores.
+    """
+    result = al.new_list()
+    collect_range(my_rbt["root"], key_initial, key_final, my_rbt["cmp_function"], result, "value")
+    return result
+
+
+def collect_range(node, key_initial, key_final, cmp_function, result, field):
+    """
+    Agrega a result, en orden, el campo field ('key' o 'value') de los nodos del subárbol
+    cuyas llaves están en [key_initial, key_final].
+    """
+    if node is None:
+        return
+    cmp_low = cmp_function(key_initial, node["key"])
+    cmp_high = cmp_function(key_final, node["key"])
+    if cmp_low < 0:
+        collect_range(node["left"], key_initial, key_final, cmp_function, result, field)
+    if cmp_low <= 0 <= cmp_high:
+        al.add_last(result, node[field])
+    if cmp_high > 0:
+        collect_range(node["right"], key_initial, key_final, cmp_function, result, field)
+
+
+def key_set(my_rbt):
+    """Retorna en orden todas las llaves del árbol."""
+    result = al.new_list()
+    collect_all(my_rbt["root"], result, "key")
+    return result
+
+
+def value_set(my_rbt):
+    """Retorna todos los valores del árbol en el orden de sus llaves."""
+    result = al.new_list()
+    collect_all(my_rbt["root"], result, "value")
+    return result
+
+
+def collect_all(node, result, field):
+    """Agrega a result, en orden, el campo field de todos los nodos del subárbol."""
+    if node is None:
+        return
+    collect_all(node["left"], result, field)
+    al.add_last(result, node[field])
+    collect_all(node["right"], result, field)
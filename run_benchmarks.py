@@ -0,0 +1,1131 @@
+import os
+import csv
+import time
+import random
+import tempfile
+import tracemalloc
+
+from App import logic
+from DataStructures.Map import map_linear_probing as lp
+from DataStructures.Map import map_separate_chaining as sp
+from DataStructures.Map import map_functions as mf
+from DataStructures.Map import multimap as mm
+from DataStructures.List import array_list as al
+from DataStructures.List import array_deque as dq
+from DataStructures.List import single_linked_list as sl
+from DataStructures.Tree import red_black_tree as rbt
+
+
+def load_sample_books(num_books=10000):
+    """
+    Carga los libros del catálogo de GoodReads si el archivo está en la carpeta Data.
+    En caso contrario genera un catálogo sintético con la misma forma para que las
+    mediciones se puedan repetir sin los datos del curso.
+    """
+    booksfile = logic.data_dir + "books.csv"
+    if os.path.exists(booksfile):
+        with open(booksfile, encoding='utf-8') as file:
+            return list(csv.DictReader(file))
+
+    rnd = random.Random(1225)
+    authors = ["Author " + str(i) + " " + "".join(rnd.choice("abcdefghij") for _ in range(12))
+               for i in range(num_books // 2)]
+    books = []
+    for i in range(num_books):
+        book_authors = rnd.sample(authors, rnd.randint(1, 3))
+        books.append({
+            "goodreads_book_id": str(rnd.randint(1, 30000000)),
+            "authors": ", ".join(book_authors),
+            "title": "Title " + str(i) + " " + "".join(rnd.choice("klmnopqrst") for _ in range(20)),
+            "original_publication_year": str(float(rnd.randint(1800, 2017))),
+            "average_rating": str(round(rnd.uniform(2.5, 5.0), 2)),
+        })
+    return books
+
+
+def load_sample_book_tags(num_rows=300000):
+    """
+    Carga las filas de book_tags del catálogo de GoodReads si el archivo está en la
+    carpeta Data. En caso contrario genera filas sintéticas con la misma forma.
+    """
+    bookstagsfile = logic.data_dir + "book_tags.csv"
+    if os.path.exists(bookstagsfile):
+        with open(bookstagsfile, encoding='utf-8') as file:
+            return list(csv.DictReader(file))
+
+    # Cada libro de muestra recibe 30 tags, como en el archivo original
+    book_ids = [book["goodreads_book_id"] for book in load_sample_books()]
+    rnd = random.Random(1225)
+    return [{"goodreads_book_id": book_ids[(row // 30) % len(book_ids)], "tag_id": str(rnd.randint(0, 34251)),
+             "count": str(rnd.randint(1, 5000))} for row in range(num_rows)]
+
+
+def measure_time(function, *args):
+    """
+    Ejecuta la función dada y retorna su resultado y el tiempo en milisegundos.
+    La medición se hace sin tracemalloc activo para no distorsionar los tiempos.
+    """
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    start_time = logic.getTime()
+    result = function(*args)
+    stop_time = logic.getTime()
+    return result, logic.deltaTime(stop_time, start_time)
+
+
+def measure_memory(function, *args):
+    """
+    Ejecuta la función dada y retorna su resultado y la memoria alocada en kB
+    que sigue viva al terminar su ejecución.
+    """
+    start_memory = logic.getMemory()
+    result = function(*args)
+    stop_memory = logic.getMemory()
+    tracemalloc.stop()
+    return result, logic.deltaMemory(start_memory, stop_memory)
+
+
+def measure_peak_memory(function, *args):
+    """
+    Ejecuta la función dada y retorna su resultado y el pico de memoria en kB que
+    alocó durante su ejecución, aunque la haya liberado al terminar.
+    """
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    result = function(*args)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, (peak_memory - start_memory) / 1024.0
+
+
+def print_row(label, *values):
+    print(label.ljust(40) + "".join(str(value).rjust(16) for value in values))
+
+
+#  -------------------------------------------------------------
+# Mapas con linear probing
+#  -------------------------------------------------------------
+
+def build_lp_index(pairs, robin_hood=False):
+    my_map = lp.new_map(1000, 0.7, robin_hood=robin_hood)
+    for key, value in pairs:
+        lp.put(my_map, key, value)
+    return my_map
+
+
+def lookup_lp_index(my_map, keys):
+    for key in keys:
+        lp.get(my_map, key)
+
+
+def bench_lp_layout():
+    """
+    Mide memoria y latencia de put/get del mapa linear probing sobre los índices
+    books_by_id y books_by_authors del catálogo.
+    """
+    books = load_sample_books()
+    by_id = [(book["goodreads_book_id"], book) for book in books]
+    by_author = [(author.strip(), book) for book in books for author in book["authors"].split(",")]
+
+    print_row("Indice", "put (ms)", "put (kB)", "get (ms)", "vacio (kB)")
+    for label, pairs in (("books_by_id", by_id), ("books_by_authors", by_author)):
+        _, put_memory = measure_memory(build_lp_index, pairs)
+        _, empty_memory = measure_memory(lp.new_map, 1000, 0.7)
+        my_map, put_time = measure_time(build_lp_index, pairs)
+        _, get_time = measure_time(lookup_lp_index, my_map, [key for key, _ in pairs])
+        print_row(label, round(put_time, 2), round(put_memory, 2), round(get_time, 2), round(empty_memory, 2))
+
+
+def lp_probe_lengths(my_map):
+    """
+    Retorna la longitud de sondeo promedio y máxima de las búsquedas exitosas y la
+    longitud promedio de las búsquedas fallidas, recorriendo la tabla del mapa.
+    """
+    table = my_map['table']
+    capacity = my_map['capacity']
+    keys = table['keys']
+    hits = []
+    for pos, key in enumerate(keys):
+        if key is not None and key != '__EMPTY__':
+            hits.append((pos - table['hashes'][pos] % capacity) % capacity + 1)
+    misses = 0
+    for home in range(capacity):
+        length = 1
+        while keys[(home + length - 1) % capacity] is not None and length <= capacity:
+            length += 1
+        misses += length
+    mean_hit = sum(hits) / len(hits) if hits else 0
+    return round(mean_hit, 2), max(hits, default=0), round(misses / capacity, 2)
+
+
+def bench_lp_churn(rounds=20, num_keys=5000):
+    """
+    Inserta num_keys llaves y en cada ronda elimina la mitad de ellas e inserta
+    la misma cantidad de llaves nuevas, reportando las longitudes de sondeo.
+    """
+    rnd = random.Random(1225)
+    my_map = lp.new_map(num_keys, 0.7)
+    live = [str(key) for key in range(num_keys)]
+    next_key = num_keys
+    for key in live:
+        lp.put(my_map, key, key)
+
+    print_row("Ronda", "hit prom", "hit max", "miss prom", "capacidad", "borradas")
+    for churn_round in range(rounds + 1):
+        if churn_round % 5 == 0:
+            print_row(str(churn_round), *lp_probe_lengths(my_map), my_map['capacity'], my_map['tombstones'])
+        rnd.shuffle(live)
+        for key in live[:num_keys // 2]:
+            lp.remove(my_map, key)
+        live = live[num_keys // 2:]
+        for _ in range(num_keys // 2):
+            live.append(str(next_key))
+            lp.put(my_map, str(next_key), next_key)
+            next_key += 1
+
+
+def bench_lp_robin_hood():
+    """
+    Compara el desplazamiento y la latencia de get entre sondeo lineal y Robin Hood
+    sobre los índices books_by_id y books_by_authors.
+    """
+    books = load_sample_books()
+    by_id = [(book["goodreads_book_id"], book) for book in books]
+    by_author = [(author.strip(), book) for book in books for author in book["authors"].split(",")]
+    missing = ["missing-" + str(i) for i in range(len(books))]
+
+    print_row("Indice", "desp max", "desp prom", "get hit (ms)", "get miss (ms)")
+    for label, pairs in (("books_by_id", by_id), ("books_by_authors", by_author)):
+        for robin_hood in (False, True):
+            my_map = build_lp_index(pairs, robin_hood)
+            stats = lp.displacement_stats(my_map)
+            _, hit_time = measure_time(lookup_lp_index, my_map, [key for key, _ in pairs])
+            _, miss_time = measure_time(lookup_lp_index, my_map, missing)
+            mode = " (robin hood)" if robin_hood else " (lineal)"
+            print_row(label + mode, stats["max_displacement"], round(stats["mean_displacement"], 3),
+                      round(hit_time, 2), round(miss_time, 2))
+
+
+#  -------------------------------------------------------------
+# Mediciones comunes a ambos mapas
+#  -------------------------------------------------------------
+
+def build_with_put(module, pairs):
+    my_map = module.new_map(1000, 0.7)
+    for key, value in pairs:
+        module.put(my_map, key, value)
+    return my_map
+
+
+def bench_bulk_load():
+    """
+    Compara la carga con un put por registro desde new_map(1000, 0.7) contra
+    from_items, que dimensiona la tabla una sola vez.
+    """
+    books = load_sample_books()
+    book_tags = load_sample_book_tags()
+    by_id = [(book["goodreads_book_id"], book) for book in books]
+    by_book_tag = [((row["goodreads_book_id"], row["tag_id"]), row) for row in book_tags]
+
+    print_row("Indice", "put (ms)", "from_items (ms)", "capacidad put", "cap. from_items")
+    for label, pairs in (("books_by_id", by_id), ("book_tags", by_book_tag)):
+        for name, module in (("lp", lp), ("sc", sp)):
+            loop_map, loop_time = measure_time(build_with_put, module, pairs)
+            bulk_map, bulk_time = measure_time(module.from_items, pairs, 0.7)
+            print_row(label + " (" + name + ")", round(loop_time, 2), round(bulk_time, 2),
+                      loop_map["capacity"], bulk_map["capacity"])
+
+def put_two_pass(my_map, key, value):
+    """
+    put de separate chaining como era antes: ubica el bucket y luego llama a get_entry,
+    que vuelve a calcular el hash y a buscar el mismo bucket. Solo para comparar.
+    """
+    hash_code = sp.full_hash(my_map, key)
+    index = sp.bucket_index(my_map, hash_code)
+    existing_entry = sp.get_entry(my_map, key)
+    if existing_entry:
+        sp.set_value(existing_entry, value)
+    else:
+        sp.add_to_bucket(my_map["table"]["elements"], index, sp.new_map_entry(key, value, hash_code))
+        my_map["size"] += 1
+        my_map["current_factor"] = my_map["size"] / my_map["capacity"]
+        if my_map["current_factor"] > my_map["limit_factor"]:
+            sp.rehash(my_map)
+    return my_map
+
+
+def bench_sc_put(update_rounds=10):
+    """
+    Compara el put de una sola pasada de separate chaining con el de dos pasadas en
+    una carga de solo inserciones (book_tags) y una de solo actualizaciones (llaves
+    de books_by_id escritas varias veces). La tabla se crea con el tamaño final para
+    que los rehash no oculten el costo del put.
+    """
+    books = load_sample_books()
+    by_book_tag = [((row["goodreads_book_id"], row["tag_id"]), row) for row in load_sample_book_tags()]
+    by_id = [(book["goodreads_book_id"], book) for book in books]
+
+    def load(put_function, my_map, pairs, rounds):
+        for _ in range(rounds):
+            for key, value in pairs:
+                put_function(my_map, key, value)
+        return my_map
+
+    print_row("Carga", "dos pasadas (ms)", "una pasada (ms)", "puts/s antes", "puts/s ahora")
+    for label, pairs, rounds in (("inserciones", by_book_tag, 1), ("actualizaciones", by_id, update_rounds)):
+        total = len(pairs) * rounds
+        # Solo se conserva el tiempo para que la primera tabla no quede viva en la segunda medición
+        before = measure_time(load, put_two_pass, sp.new_map(len(pairs), 0.7), pairs, rounds)[1]
+        after = measure_time(load, sp.put, sp.new_map(len(pairs), 0.7), pairs, rounds)[1]
+        print_row(label, round(before, 2), round(after, 2),
+                  int(total / (before / 1000)), int(total / (after / 1000)))
+
+
+def with_eager_buckets(my_map):
+    """
+    Convierte cada posición de la tabla en un arraylist, como los creaba new_map antes
+    de crear los buckets al primer put. Solo para comparar la memoria.
+    """
+    buckets = my_map["table"]["elements"]
+    for i, bucket in enumerate(buckets):
+        buckets[i] = {"elements": list(sp.bucket_entries(bucket)), "size": sp.bucket_size(bucket)}
+    return my_map
+
+
+def bench_sc_buckets():
+    """
+    Compara la memoria del índice completo de book_tags en separate chaining con
+    buckets creados al primer put (y entradas únicas en línea) contra un arraylist
+    por posición.
+    """
+    pairs = [((row["goodreads_book_id"], row["tag_id"]), row) for row in load_sample_book_tags()]
+
+    lazy_map, lazy_memory = measure_memory(build_with_put, sp, pairs)
+    stats = sp.stats(lazy_map)
+    del lazy_map
+    _, eager_memory = measure_memory(lambda: with_eager_buckets(build_with_put(sp, pairs)))
+
+    print("Entradas: " + str(stats["size"]) + ", buckets: " + str(stats["capacity"]) + ", vacíos: " +
+          str(stats["chain_histogram"].get(0, 0)) + ", con una entrada: " +
+          str(stats["chain_histogram"].get(1, 0)))
+    print_row("Buckets", "memoria (kB)")
+    print_row("arraylist por posición", round(eager_memory, 2))
+    print_row("al primer put / en línea", round(lazy_memory, 2))
+    print_row("ahorro", round(eager_memory - lazy_memory, 2))
+
+
+def bench_sc_sorted_chains(num_keys=2000):
+    """
+    Compara get y remove en un bucket con num_keys llaves de poca entropía (múltiplos
+    de la capacidad, con hash MAD sin mezcla) recorriendo la cadena linealmente y con
+    la cadena ordenada por hash.
+    """
+    def build(sort_threshold):
+        original = sp.SORT_THRESHOLD
+        sp.SORT_THRESHOLD = sort_threshold
+        try:
+            my_map = sp.new_map(2 * num_keys, 0.7)
+            my_map["scale"] = 1
+            my_map["shift"] = 0
+            keys = [i * my_map["capacity"] for i in range(1, num_keys + 1)]
+            for key in keys:
+                sp.put(my_map, key, key)
+        finally:
+            sp.SORT_THRESHOLD = original
+        return my_map, keys
+
+    def get_and_remove(my_map, keys):
+        for key in keys:
+            sp.get(my_map, key)
+        for key in keys:
+            sp.contains(my_map, -key)
+        for key in keys:
+            sp.remove(my_map, key)
+
+    print_row("Cadena de " + str(num_keys), "put (ms)", "get+rem (ms)", "miss max")
+    for label, threshold in (("lineal", num_keys + 1), ("ordenada por hash", sp.SORT_THRESHOLD)):
+        (my_map, keys), put_time = measure_time(build, threshold)
+        probes = sp.stats(my_map)["miss_probe_max"]
+        query_time = measure_time(get_and_remove, my_map, keys)[1]
+        print_row(label, round(put_time, 2), round(query_time, 2), probes)
+
+
+def bench_shrink(num_keys=200000, keep=0.05):
+    """
+    Borra el 95% de las llaves de un mapa grande y compara la memoria que queda en uso
+    y el tiempo de key_set/value_set con la reducción al borrar desactivada (min_load_factor=0)
+    y activada (valor por defecto).
+    """
+    keys = list(range(num_keys))
+    purge = keys[int(num_keys * keep):]
+    kept = num_keys - len(purge)
+
+    def mass_delete(module, my_map):
+        for key in purge:
+            module.remove(my_map, key)
+        return my_map
+
+    def iterate(module, my_map):
+        for _ in range(20):
+            module.key_set(my_map)
+            module.value_set(my_map)
+
+    def build(module, min_load_factor):
+        my_map = module.new_map(1000, 0.7, min_load_factor=min_load_factor)
+        for key in keys:
+            module.put(my_map, key, key)
+        return my_map
+
+    print("Llaves: " + str(num_keys) + ", quedan: " + str(kept))
+    print_row("Mapa", "cap. final", "memoria (kB)", "borrado (ms)", "iterar (ms)")
+    for name, module in (("lp", lp), ("sc", sp)):
+        for label, min_load_factor in (("sin reducir", 0), ("reduce", None)):
+            # La memoria se mide en otra copia para que tracemalloc no afecte los tiempos
+            delete_time = measure_time(mass_delete, module, build(module, min_load_factor))[1]
+            my_map, memory = measure_memory(lambda: mass_delete(module, build(module, min_load_factor)))
+            iterate_time = measure_time(iterate, module, my_map)[1]
+            print_row(name + " (" + label + ")", my_map["capacity"], round(memory, 2),
+                      round(delete_time, 2), round(iterate_time, 2))
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def bench_incremental_rehash(num_keys=200000):
+    """
+    Mide la latencia de cada put al cargar num_keys llaves desde new_map(1000, 0.7)
+    y reporta sus percentiles con rehash completo y con rehash incremental.
+    """
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    keys = [str(key) for key in range(num_keys)]
+
+    print_row("Mapa", "p50 (us)", "p99 (us)", "p99.9 (us)", "max (us)")
+    for label, module in (("linear probing", lp), ("separate chaining", sp)):
+        for incremental in (False, True):
+            my_map = module.new_map(1000, 0.7, incremental=incremental)
+            latencies = []
+            for key in keys:
+                start = time.perf_counter_ns()
+                module.put(my_map, key, key)
+                latencies.append(time.perf_counter_ns() - start)
+            latencies.sort()
+            mode = " (incremental)" if incremental else " (completo)"
+            print_row(label + mode, *[round(percentile(latencies, fraction) / 1000, 1)
+                                      for fraction in (0.5, 0.99, 0.999, 1)])
+
+
+def bench_power_of_two():
+    """
+    Compara capacidades primas con hash MAD contra capacidades potencia de dos con
+    hash multiplicativo y máscara, sobre las llaves del catálogo.
+    """
+    books = load_sample_books()
+    by_id = [(book["goodreads_book_id"], book) for book in books]
+    by_author = [(author.strip(), book) for book in books for author in book["authors"].split(",")]
+
+    print_row("Indice", "put (ms)", "get (ms)", "rehash (ms)", "hit prom", "hit max")
+    for label, pairs in (("books_by_id", by_id), ("books_by_authors", by_author)):
+        keys = [key for key, _ in pairs]
+        for name, module in (("lp", lp), ("sc", sp)):
+            for power_of_two in (False, True):
+                def build():
+                    my_map = module.new_map(1000, 0.7, power_of_two=power_of_two)
+                    for key, value in pairs:
+                        module.put(my_map, key, value)
+                    return my_map
+                my_map, put_time = measure_time(build)
+                _, get_time = measure_time(lambda: [module.get(my_map, key) for key in keys])
+                stats = module.stats(my_map)
+                policy = " pot. dos" if power_of_two else " primo"
+                print_row(label + " (" + name + policy + ")", round(put_time, 2), round(get_time, 2),
+                          round(stats["rehash_time"], 2), round(stats["hit_probe_mean"], 3),
+                          stats["hit_probe_max"])
+
+
+def trial_next_prime(n):
+    """Búsqueda del siguiente primo probando número a número, como antes del caché."""
+    candidate = int(n) + 1
+    while not mf.is_prime(candidate):
+        candidate += 1
+    return candidate
+
+
+def bench_prime_selection(num_maps=20000):
+    """
+    Mide la selección de capacidad al crear muchos mapas pequeños, como los mapas
+    por autor de books_by_year_author, y al recorrer las capacidades de rehash.
+    """
+    sizes = [int(1000 / 0.7)] * num_maps
+    print_row("Operacion", "trial (ms)", "tabla (ms)")
+    _, trial_time = measure_time(lambda: [trial_next_prime(n) for n in sizes])
+    _, table_time = measure_time(lambda: [mf.next_capacity(n) for n in sizes])
+    print_row(str(num_maps) + " capacidades", round(trial_time, 2), round(table_time, 2))
+
+    growth = mf.CAPACITY_PRIMES[:-1]
+    _, trial_time = measure_time(lambda: [trial_next_prime(2 * n - 1) for n in growth])
+    _, table_time = measure_time(lambda: [mf.next_capacity(n) for n in growth])
+    print_row("rehash 2 -> 2^31", round(trial_time, 2), round(table_time, 2))
+
+    _, map_time = measure_time(lambda: [lp.new_map(1000, 0.7) for _ in range(2000)])
+    print_row("2000 lp.new_map", "", round(map_time, 2))
+
+
+#  -------------------------------------------------------------
+# Índices del catálogo
+#  -------------------------------------------------------------
+
+def build_sample_catalog():
+    """
+    Construye el catálogo con la lógica de la aplicación a partir de los libros de
+    muestra, sin cargar tags.
+    """
+    catalog = logic.new_logic()
+    for book in load_sample_books():
+        logic.add_book(catalog, book)
+    return catalog
+
+
+def bench_catalog_stats():
+    """
+    Reporta las estadísticas de sondeo, clusters y rehash de los índices del catálogo,
+    los datos que se registran en la tabla de datos del laboratorio.
+    """
+    catalog = build_sample_catalog()
+    print_row("Indice", "carga", "hit prom", "hit max", "miss prom", "miss max", "rehashes", "rehash (ms)")
+    for index in ("books_by_id", "books_by_authors", "books_by_year_author"):
+        # Los índices de uno a muchos son multimapas sobre un mapa linear probing
+        my_map = catalog[index]["map"] if "map" in catalog[index] else catalog[index]
+        stats = lp.stats(my_map)
+        print_row(index, round(stats["load_factor"], 3), round(stats["hit_probe_mean"], 3),
+                  stats["hit_probe_max"], round(stats["miss_probe_mean"], 3), stats["miss_probe_max"],
+                  stats["rehash_count"], round(stats["rehash_time"], 2))
+        histogram = sorted(stats["cluster_histogram"].items())
+        print("    clusters (longitud: cantidad): " + ", ".join(str(length) + ": " + str(count)
+                                                             for length, count in histogram[:12]))
+
+
+def bench_map_iteration():
+    """
+    Compara key_set/value_set contra iter_keys/iter_items en el índice books_by_authors:
+    un recorrido completo que cuenta libros y una búsqueda que termina en la primera
+    llave que cumple la condición.
+    """
+    catalog = build_sample_catalog()
+    index = catalog["books_by_authors"]["map"]
+    target = list(lp.iter_keys(index))[lp.size(index) // 10]
+
+    def count_with_lists():
+        total = 0
+        for _ in lp.value_set(index)["elements"]:
+            total += 1
+        return total
+
+    def count_with_iter():
+        total = 0
+        for _ in lp.iter_items(index):
+            total += 1
+        return total
+
+    def find_with_lists():
+        keys = lp.key_set(index)
+        for key in keys["elements"]:
+            if key == target:
+                return key
+
+    def find_with_iter():
+        for key in lp.iter_keys(index):
+            if key == target:
+                return key
+
+    print("Autores: " + str(lp.size(index)) + ", capacidad: " + str(index["capacity"]))
+    print_row("Recorrido", "tiempo (ms)", "pico mem. (kB)")
+    for label, function in (("conteo con value_set", count_with_lists), ("conteo con iter_items", count_with_iter),
+                            ("búsqueda con key_set", find_with_lists), ("búsqueda con iter_keys", find_with_iter)):
+        elapsed = measure_time(function)[1]
+        memory = measure_peak_memory(function)[1]
+        print_row(label, round(elapsed, 2), round(memory, 2))
+
+
+def add_book_get_put(catalog, book):
+    """
+    add_book como era antes de get_or_insert: cada índice por autor se actualiza con
+    get seguido de put. Solo para comparar.
+    """
+    al.add_last(catalog["books"], book)
+    lp.put(catalog["books_by_id"], book["goodreads_book_id"], book)
+    for author in book["authors"].split(","):
+        author_name = author.strip()
+        authors_books = lp.get(catalog["books_by_authors"], author_name)
+        if authors_books is None:
+            authors_books = al.new_list()
+            lp.put(catalog["books_by_authors"], author_name, authors_books)
+        al.add_last(authors_books, book)
+
+        author_year = (author_name, book["original_publication_year"])
+        pub_year_books = lp.get(catalog["books_by_year_author"], author_year)
+        if pub_year_books is None:
+            pub_year_books = al.new_list()
+            lp.put(catalog["books_by_year_author"], author_year, pub_year_books)
+        al.add_last(pub_year_books, book)
+    return catalog
+
+
+def add_book_tag_contains_get_put(catalog, book_tag):
+    """add_book_tag como era antes de get_or_insert: contains, get y put. Solo para comparar."""
+    tag_id = book_tag["tag_id"]
+    if lp.contains(catalog["book_tags"], tag_id):
+        al.add_last(lp.get(catalog["book_tags"], tag_id), book_tag)
+    else:
+        book_tag_list = al.new_list()
+        al.add_last(book_tag_list, book_tag)
+        lp.put(catalog["book_tags"], tag_id, book_tag_list)
+    return catalog
+
+
+def bench_loaders_upsert():
+    """
+    Compara la carga de libros y de book_tags con las funciones de la lógica contra las
+    versiones anteriores con get/contains + put sobre mapas de listas.
+    """
+    books = load_sample_books()
+    book_tags = load_sample_book_tags()
+
+    def load(add_book_function, add_book_tag_function):
+        catalog = logic.new_logic()
+        if add_book_function is add_book_get_put:
+            # Índices de uno a muchos como mapas de listas, como antes del multimapa
+            for index in ("books_by_authors", "books_by_year_author", "book_tags"):
+                catalog[index] = lp.new_map(1000, 0.7)
+        books_time = measure_time(lambda: [add_book_function(catalog, book) for book in books])[1]
+        tags_time = measure_time(lambda: [add_book_tag_function(catalog, row) for row in book_tags])[1]
+        return books_time, tags_time
+
+    print_row("Carga", "libros (ms)", "book_tags (ms)")
+    for label, add_book_function, add_book_tag_function in (
+            ("get/contains + put", add_book_get_put, add_book_tag_contains_get_put),
+            ("lógica actual", logic.add_book, logic.add_book_tag)):
+        books_time, tags_time = load(add_book_function, add_book_tag_function)
+        print_row(label, round(books_time, 2), round(tags_time, 2))
+
+
+def bench_get_many(rounds=3):
+    """
+    Une las filas de book_tags con books_by_id: una llamada a get por fila contra una
+    sola llamada a get_many por lote, en linear probing y separate chaining.
+    """
+    books = load_sample_books()
+    book_ids = [row["goodreads_book_id"] for row in load_sample_book_tags()]
+    pairs = [(book["goodreads_book_id"], book) for book in books]
+
+    print("Filas a unir: " + str(len(book_ids)) + " x " + str(rounds))
+    print_row("Mapa", "get (ms)", "get_many (ms)")
+    for name, module in (("lp", lp), ("sc", sp)):
+        books_by_id = module.from_items(pairs, 0.7)
+
+        def join_with_get():
+            for _ in range(rounds):
+                found = al.new_list()
+                for book_id in book_ids:
+                    al.add_last(found, module.get(books_by_id, book_id))
+            return found
+
+        def join_with_get_many():
+            for _ in range(rounds):
+                found = module.get_many(books_by_id, book_ids)
+            return found
+
+        found_get, get_time = measure_time(join_with_get)
+        found_many, many_time = measure_time(join_with_get_many)
+        assert found_get["elements"] == found_many["elements"]
+        print_row(name, round(get_time, 2), round(many_time, 2))
+
+
+def scan_range(catalog, field, low, high):
+    """Consulta por rango recorriendo la lista completa de libros, como antes de los árboles."""
+    books = al.new_list()
+    for book in catalog["books"]["elements"]:
+        value = logic.parse_number(book[field])
+        if value is not None and low <= value <= high:
+            al.add_last(books, book)
+    return books
+
+
+def bench_range_queries(num_queries=200):
+    """
+    Compara las consultas por rango de año y de rating con los árboles rojo-negro del
+    catálogo contra un recorrido de toda la lista de libros.
+    """
+    catalog = build_sample_catalog()
+    rnd = random.Random(1225)
+    year_ranges = [(year, year + rnd.randint(0, 10)) for year in
+                   (rnd.randint(1800, 2017) for _ in range(num_queries))]
+    rating_ranges = [(rating, round(rating + rnd.choice((0.05, 0.1, 0.3)), 2)) for rating in
+                     (round(rnd.uniform(2.5, 5.0), 2) for _ in range(num_queries))]
+
+    print("Libros: " + str(al.size(catalog["books"])) + ", años en el árbol: " +
+          str(rbt.size(catalog["books_by_year"])) + ", altura: " + str(rbt.height(catalog["books_by_year"])))
+    print_row(str(num_queries) + " consultas", "recorrido (ms)", "árbol (ms)", "libros")
+    for label, field, ranges, query in (
+            ("año", "original_publication_year", year_ranges, logic.get_books_by_year_range),
+            ("rating", "average_rating", rating_ranges, logic.get_books_by_rating_range)):
+        scanned, scan_time = measure_time(lambda: [scan_range(catalog, field, low, high) for low, high in ranges])
+        found, tree_time = measure_time(lambda: [query(catalog, low, high) for low, high in ranges])
+        total = sum(al.size(books) for books in found)
+        assert total == sum(al.size(books) for books in scanned)
+        print_row(label, round(scan_time, 2), round(tree_time, 2), total)
+
+
+def add_book_author_and_year_nested(index, author_name, book):
+    """
+    Índice por autor y año como era antes de la llave compuesta: un mapa de años
+    new_map(1000, 0.7) por cada autor. Solo para comparar.
+    """
+    author_value = lp.get_or_insert(index, author_name, lambda: lp.new_map(1000, 0.7))
+    al.add_last(lp.get_or_insert(author_value, book["original_publication_year"], al.new_list), book)
+
+
+def bench_author_year_index():
+    """
+    Compara el índice books_by_year_author con mapas de años anidados por autor contra
+    la tabla con llave compuesta (autor, año): memoria, tiempo de carga y de consulta.
+    """
+    books = load_sample_books()
+    pairs = [(author.strip(), book) for book in books for author in book["authors"].split(",")]
+
+    def load_nested():
+        index = lp.new_map(1000, 0.7)
+        for author_name, book in pairs:
+            add_book_author_and_year_nested(index, author_name, book)
+        return index
+
+    def load_flat():
+        catalog = {"books_by_year_author": mm.new_map(1000, 0.7)}
+        for author_name, book in pairs:
+            logic.add_book_author_and_year(catalog, author_name, book)
+        return catalog["books_by_year_author"]
+
+    def query_nested(index):
+        for author_name, book in pairs:
+            lp.get(lp.get(index, author_name), book["original_publication_year"])
+
+    def query_flat(index):
+        for author_name, book in pairs:
+            mm.get_all(index, (author_name, book["original_publication_year"]))
+
+    print_row("books_by_year_author", "carga (ms)", "memoria (kB)", "consulta (ms)")
+    for label, load, query in (("mapas anidados", load_nested, query_nested),
+                               ("llave compuesta", load_flat, query_flat)):
+        load_time = measure_time(load)[1]
+        index, memory = measure_memory(load)
+        query_time = measure_time(query, index)[1]
+        print_row(label, round(load_time, 2), round(memory, 2), round(query_time, 2))
+        del index
+
+
+def bench_multimap():
+    """
+    Compara los índices de uno a muchos del catálogo (books_by_authors,
+    books_by_year_author y book_tags) como mapas de array_list con get_or_insert
+    contra el multimapa: memoria y tiempo de carga.
+    """
+    books = load_sample_books()
+    groups = {
+        "books_by_authors": [(author.strip(), book) for book in books for author in book["authors"].split(",")],
+        "books_by_year_author": [((author.strip(), book["original_publication_year"]), book)
+                                 for book in books for author in book["authors"].split(",")],
+        "book_tags": [(row["tag_id"], row) for row in load_sample_book_tags()],
+    }
+
+    def load_lists(pairs):
+        index = lp.new_map(1000, 0.7)
+        for key, value in pairs:
+            al.add_last(lp.get_or_insert(index, key, al.new_list), value)
+        return index
+
+    def load_multimap(pairs):
+        index = mm.new_map(1000, 0.7)
+        for key, value in pairs:
+            mm.add(index, key, value)
+        return index
+
+    print_row("Indice", "listas (ms)", "multimapa (ms)", "listas (kB)", "multimapa (kB)")
+    for label, pairs in groups.items():
+        lists_time = measure_time(load_lists, pairs)[1]
+        multimap_time = measure_time(load_multimap, pairs)[1]
+        lists_memory = measure_memory(load_lists, pairs)[1]
+        multimap_memory = measure_memory(load_multimap, pairs)[1]
+        print_row(label, round(lists_time, 2), round(multimap_time, 2),
+                  round(lists_memory, 2), round(multimap_memory, 2))
+
+
+def write_sample_files(directory):
+    """
+    Escribe books.csv, tags.csv y book_tags.csv de muestra en directory, con las columnas
+    que usan los cargadores de la lógica.
+    """
+    files = {"books.csv": load_sample_books(),
+             "tags.csv": [{"tag_id": str(i), "tag_name": "tag-" + str(i)} for i in range(34252)],
+             "book_tags.csv": load_sample_book_tags()}
+    for filename, rows in files.items():
+        with open(os.path.join(directory, filename), "w", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def bench_initial_capacity():
+    """
+    Compara la carga del catálogo con 1000 llaves iniciales en cada índice contra las
+    capacidades estimadas a partir del tamaño de los archivos: estimado vs real,
+    capacidad final, número de rehash y tiempo de carga.
+    """
+    original_dir = logic.data_dir
+    with tempfile.TemporaryDirectory() as directory:
+        if not os.path.exists(original_dir + "books.csv"):
+            write_sample_files(directory)
+            logic.data_dir = directory + "/"
+        try:
+            estimates = logic.estimate_sizes()
+            fixed = dict.fromkeys(estimates, 0)
+
+            def load(sizes):
+                catalog = logic.new_logic(sizes)
+                logic.load_books(catalog)
+                logic.load_tags(catalog)
+                logic.load_books_tags(catalog)
+                return catalog
+
+            for label, sizes in (("Fija (1000)", fixed), ("Estimada", estimates)):
+                catalog, load_time = measure_time(load, sizes)
+                print(label + ": carga en " + str(round(load_time, 2)) + " ms")
+                print_row("Indice", "estimado", "real", "capacidad", "rehashes")
+                for index, row in logic.size_report(catalog).items():
+                    print_row(index, row["estimated"], row["actual"], row["capacity"], row["rehash_count"])
+                del catalog
+        finally:
+            logic.data_dir = original_dir
+
+
+def prepend_all(module, num_elements):
+    """Agrega num_elements al inicio de una lista nueva del módulo dado."""
+    my_list = module.new_list()
+    for i in range(num_elements):
+        module.add_first(my_list, i)
+    return my_list
+
+
+def drain_front_array_list(my_list):
+    """Vacía una array_list retirando siempre el primer elemento."""
+    while al.size(my_list) > 0:
+        al.first_element(my_list)
+        al.delete_element(my_list, 0)
+
+
+def drain_front_deque(my_list):
+    """Vacía una lista circular retirando siempre el primer elemento."""
+    while not dq.is_empty(my_list):
+        dq.remove_first(my_list)
+
+
+def bench_array_deque(sizes=(10000, 30000, 100000, 1000000), array_list_max=100000):
+    """
+    Compara una carga con muchas inserciones al inicio y una cola vaciada por el frente
+    en array_list contra la lista circular. array_list copia la lista en cada add_first
+    y delete_element(0), así que solo se mide hasta array_list_max elementos.
+    """
+    print_row("Elementos", "al add_first", "deque add_first", "al vaciar", "deque vaciar")
+    for num_elements in sizes:
+        deque, deque_prepend = measure_time(prepend_all, dq, num_elements)
+        deque_drain = measure_time(drain_front_deque, deque)[1]
+        if num_elements <= array_list_max:
+            array, array_prepend = measure_time(prepend_all, al, num_elements)
+            array_drain = measure_time(drain_front_array_list, array)[1]
+            print_row(str(num_elements), round(array_prepend, 2), round(deque_prepend, 2),
+                      round(array_drain, 2), round(deque_drain, 2))
+        else:
+            print_row(str(num_elements), "-", round(deque_prepend, 2), "-", round(deque_drain, 2))
+
+
+def walk_by_position(module, my_list):
+    """Recorre la lista con un get_element por posición, como los ciclos de la vista."""
+    for pos in range(module.size(my_list)):
+        module.get_element(my_list, pos)
+
+
+def walk_by_iterator(module, my_list, reverse=False):
+    """Recorre la lista con el generador iterator del módulo."""
+    for _ in module.iterator(my_list, reverse=reverse):
+        pass
+
+
+def bench_list_iterators(sizes=(1000, 5000, 20000)):
+    """
+    Compara el recorrido completo de array_list y single_linked_list por posición
+    (get_element) contra el generador iterator, hacia adelante y en reversa.
+    """
+    print_row("Lista", "por posición", "iterator", "reversa")
+    for num_elements in sizes:
+        for module, name in ((al, "array_list"), (sl, "single_linked_list")):
+            my_list = module.new_list()
+            for i in range(num_elements):
+                module.add_last(my_list, i)
+            position_time = measure_time(walk_by_position, module, my_list)[1]
+            iterator_time = measure_time(walk_by_iterator, module, my_list)[1]
+            reverse_time = measure_time(walk_by_iterator, module, my_list, True)[1]
+            print_row(name + " (" + str(num_elements) + ")", round(position_time, 2),
+                      round(iterator_time, 2), round(reverse_time, 2))
+
+
+def walk_without_cursor(my_list):
+    """Recorre la lista por posición borrando el cursor antes de cada consulta."""
+    for pos in range(sl.size(my_list)):
+        my_list["cursor"] = None
+        sl.get_element(my_list, pos)
+
+
+def bench_linked_list_cursor(sizes=(1000, 10000, 100000), no_cursor_max=10000):
+    """
+    Mide un ciclo por posiciones (get_element) sobre single_linked_list con el cursor
+    de la última consulta y sin él. Sin cursor cada consulta parte del primer nodo
+    (O(n^2) en total), así que solo se mide hasta no_cursor_max nodos.
+    """
+    print_row("Nodos", "sin cursor (ms)", "con cursor (ms)")
+    for num_elements in sizes:
+        my_list = sl.new_list()
+        for i in range(num_elements):
+            sl.add_last(my_list, i)
+        cursor_time = measure_time(walk_by_position, sl, my_list)[1]
+        no_cursor_time = "-"
+        if num_elements <= no_cursor_max:
+            no_cursor_time = round(measure_time(walk_without_cursor, my_list)[1], 2)
+        print_row(str(num_elements), no_cursor_time, round(cursor_time, 2))
+
+
+def compare_numbers(number1, number2):
+    """Criterio de comparación -1/0/1 que esperaban los ordenamientos anteriores."""
+    return (number1 > number2) - (number1 < number2)
+
+
+def shell_sort_by_position(my_list, cmp_function):
+    """Shell Sort anterior de single_linked_list: un get_node_at por cada acceso."""
+    n = my_list["size"]
+    gap = n // 2
+    while gap > 0:
+        for i in range(gap, n):
+            temp_node = sl.get_node_at(my_list, i)
+            j = i
+            while j >= gap and cmp_function(sl.get_node_at(my_list, j - gap)["info"], temp_node["info"]) > 0:
+                sl.swap_nodes(sl.get_node_at(my_list, j), sl.get_node_at(my_list, j - gap))
+                j -= gap
+        gap //= 2
+    return my_list
+
+
+def merge_sort_copying(my_list, cmp_function):
+    """Merge Sort anterior de single_linked_list: copia las mitades con sub_list y add_last."""
+    if my_list["size"] <= 1:
+        return my_list
+    mid = my_list["size"] // 2
+    left = merge_sort_copying(sl.sub_list(my_list, 1, mid), cmp_function)
+    right = merge_sort_copying(sl.sub_list(my_list, mid + 1, my_list["size"] - mid), cmp_function)
+    merged = sl.new_list()
+    left_node, right_node = left["first"], right["first"]
+    while left_node and right_node:
+        if cmp_function(left_node["info"], right_node["info"]) <= 0:
+            sl.add_last(merged, left_node["info"])
+            left_node = left_node["next"]
+        else:
+            sl.add_last(merged, right_node["info"])
+            right_node = right_node["next"]
+    for node in (left_node, right_node):
+        while node:
+            sl.add_last(merged, node["info"])
+            node = node["next"]
+    return merged
+
+
+def quick_sort_get_previous(my_list, low, high, cmp_function):
+    """QuickSort anterior de single_linked_list: intercambia valores y busca el nodo anterior al pivote."""
+    if low is not None and high is not None and low != high and low != high["next"]:
+        pivot = high["info"]
+        i = j = low
+        while j is not high:
+            if cmp_function(j["info"], pivot) < 0:
+                i["info"], j["info"] = j["info"], i["info"]
+                i = i["next"]
+            j = j["next"]
+        i["info"], high["info"] = high["info"], i["info"]
+        quick_sort_get_previous(my_list, low, sl.get_previous(my_list, i), cmp_function)
+        quick_sort_get_previous(my_list, i["next"], high, cmp_function)
+    return my_list
+
+
+def quick_sort_whole_list(my_list, cmp_function):
+    """Ordena toda la lista con el QuickSort anterior."""
+    return quick_sort_get_previous(my_list, my_list["first"], my_list["last"], cmp_function)
+
+
+def new_linked_list(elements):
+    """Crea una single_linked_list con los elementos dados."""
+    my_list = sl.new_list()
+    for element in elements:
+        sl.add_last(my_list, element)
+    return my_list
+
+
+def bench_linked_list_sorts(sizes=(1000, 3000, 10000, 100000, 1000000), previous_max=3000, shell_max=100000):
+    """
+    Compara los ordenamientos de single_linked_list anteriores (Shell Sort con
+    get_node_at, Merge Sort con copias, QuickSort con get_previous) contra los actuales
+    (Shell Sort sobre arreglo, Merge Sort natural y QuickSort de tres vías que reenlazan
+    nodos), en datos aleatorios y ya ordenados. Los anteriores son cuadráticos o peores,
+    así que solo se miden hasta previous_max elementos.
+    """
+    crit = sl.default_sort_criteria
+    rnd = random.Random(1225)
+    print_row("Caso", "shell ant.", "shell", "merge ant.", "merge", "quick ant.", "quick")
+    for num_elements in sizes:
+        shuffled = [rnd.random() for _ in range(num_elements)]
+        for label, elements in (("aleatorio", shuffled), ("ordenado", sorted(shuffled))):
+            row = []
+            for previous, current, current_max in (
+                    (shell_sort_by_position, sl.shell_sort, shell_max),
+                    (merge_sort_copying, sl.merge_sort, None),
+                    (quick_sort_whole_list, sl.quick_sort, None)):
+                previous_time = "-"
+                if num_elements <= previous_max:
+                    try:
+                        previous_time = round(measure_time(previous, new_linked_list(elements), compare_numbers)[1], 2)
+                    except RecursionError:
+                        # QuickSort anterior: en datos ordenados la recursión tiene profundidad n
+                        previous_time = "recursión"
+                current_time = "-"
+                if current_max is None or num_elements <= current_max:
+                    current_time = round(measure_time(current, new_linked_list(elements), crit)[1], 2)
+                row += [previous_time, current_time]
+            print_row(label + " (" + str(num_elements) + ")", *row)
+
+
+def merge_sort_slicing(elements, cmp_function):
+    """
+    Merge Sort recursivo de arriba hacia abajo que copia las mitades con slices en cada
+    mezcla, como el mergeSort anterior de array_list (con la recursión corregida).
+    """
+    if len(elements) <= 1:
+        return elements
+    mid = len(elements) // 2
+    left = merge_sort_slicing(elements[:mid], cmp_function)
+    right = merge_sort_slicing(elements[mid:], cmp_function)
+    merged = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if cmp_function(right[j], left[i]) < 0:
+            merged.append(right[j])
+            j += 1
+        else:
+            merged.append(left[i])
+            i += 1
+    return merged + left[i:] + right[j:]
+
+
+def bench_array_list_merge_sort(sizes=(1000, 10000, 100000, 1000000), insertion_max=3000):
+    """
+    Compara el Merge Sort iterativo de array_list (un buffer, bloques de inserción y
+    detección de bloques ya ordenados) contra un Merge Sort recursivo con slices y contra
+    insertion_sort, en libros con rating aleatorio y ya ordenados por rating.
+    """
+    rnd = random.Random(1225)
+    crit = al.default_sort_criteria
+
+    def compare_ratings(book1, book2):
+        return compare_numbers(float(book1["average_rating"]), float(book2["average_rating"]))
+
+    def new_array_list(elements):
+        return {"elements": list(elements), "size": len(elements)}
+
+    print_row("Caso", "inserción", "recursivo", "iterativo")
+    for num_elements in sizes:
+        books = [{"average_rating": str(round(rnd.uniform(2.5, 5.0), 2))} for _ in range(num_elements)]
+        for label, elements in (("aleatorio", books),
+                                ("ordenado", sorted(books, key=lambda book: float(book["average_rating"])))):
+            insertion_time = "-"
+            if num_elements <= insertion_max:
+                insertion_time = round(measure_time(al.insertion_sort, new_array_list(elements), crit)[1], 2)
+            recursive_time = measure_time(merge_sort_slicing, list(elements), compare_ratings)[1]
+            iterative_time = measure_time(al.merge_sort, new_array_list(elements), crit)[1]
+            print_row(label + " (" + str(num_elements) + ")", insertion_time,
+                      round(recursive_time, 2), round(iterative_time, 2))
+
+
+def print_benchmark_options():
+    print(" Mediciones de rendimiento de EDA ".center(80, "="))
+    print("1. Disposición de casillas del mapa linear probing")
+    print("2. Rotación de llaves (churn) en el mapa linear probing")
+    print("3. Sondeo lineal vs Robin Hood")
+    print("4. Latencia de put con rehash completo vs incremental")
+    print("5. Carga registro a registro vs from_items")
+    print("6. Estadísticas de los índices del catálogo")
+    print("7. Capacidad prima (MAD) vs potencia de dos (máscara)")
+    print("8. Selección de primos: búsqueda por división vs tabla de capacidades")
+    print("9. put de separate chaining: dos pasadas vs una pasada")
+    print("10. Memoria de buckets de separate chaining en book_tags")
+    print("11. Cadenas largas de separate chaining: lineal vs ordenada por hash")
+    print("12. Reducción de la tabla después de un borrado masivo")
+    print("13. Recorrido de books_by_authors: key_set/value_set vs generadores")
+    print("14. Carga de libros y book_tags: get/contains + put vs get_or_insert")
+    print("15. Unión de book_tags con books_by_id: get por fila vs get_many")
+    print("16. Consultas por rango de año y rating: recorrido vs árbol rojo-negro")
+    print("17. Índice por autor y año: mapas anidados vs llave compuesta")
+    print("18. Índices de uno a muchos: mapas de listas vs multimapa")
+    print("19. Capacidad inicial de los índices: fija vs estimada por tamaño de archivo")
+    print("20. Inserciones al inicio: array_list vs lista circular (deque)")
+    print("21. Recorrido de listas: get_element por posición vs iterator")
+    print("22. Ciclo por posiciones en single_linked_list: sin cursor vs con cursor")
+    print("23. Ordenamientos de single_linked_list: versiones anteriores vs reenlazando nodos")
+    print("24. Merge Sort de array_list: recursivo con slices vs iterativo con un buffer")
+    print("0. Salir")
+
+
+if __name__ == "__main__":
+    """Menú principal de mediciones"""
+    benchmarks = {
+        "1": bench_lp_layout,
+        "2": bench_lp_churn,
+        "3": bench_lp_robin_hood,
+        "4": bench_incremental_rehash,
+        "5": bench_bulk_load,
+        "6": bench_catalog_stats,
+        "7": bench_power_of_two,
+        "8": bench_prime_selection,
+        "9": bench_sc_put,
+        "10": bench_sc_buckets,
+        "11": bench_sc_sorted_chains,
+        "12": bench_shrink,
+        "13": bench_map_iteration,
+        "14": bench_loaders_upsert,
+        "15": bench_get_many,
+        "16": bench_range_queries,
+        "17": bench_author_year_index,
+        "18": bench_multimap,
+        "19": bench_initial_capacity,
+        "20": bench_array_deque,
+        "21": bench_list_iterators,
+        "22": bench_linked_list_cursor,
+        "23": bench_linked_list_sorts,
+        "24": bench_array_list_merge_sort,
+    }
+    print_benchmark_options()
+    input_option = str(input("Ingrese el número de la opción que desea ejecutar: \n")).strip()
+
+    if input_option in benchmarks:
+        benchmarks[input_option]()
+    elif input_option == "0":
+        print("Saliendo de las mediciones")
+    else:
+        print("Opción no válida")
+
+    print(" Gracias por ejecutar las mediciones ".center(80, "="))
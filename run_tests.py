@@ -11,6 +11,7 @@ def print_test_options():
     print("2. Listas")
     print("     2.A Lista de arreglos")
     print("     2.B Lista encadenadas")
+    print("     2.C Lista circular (deque)")
     print("3. Colas (Queues)")
     print("4. Pilas (Stacks)")
     print("5. Métodos de Ordenamiento")
@@ -19,6 +20,8 @@ def print_test_options():
     print("6. Mapas")
     print("     6.A Mapas con manejo linear probing")
     print("     6.B Mapas con manejo Separate Chaining")
+    print("     6.C Multimapa")
+    print("7. Árboles (mapa ordenado rojo-negro)")
     print("0. Salir")
 
 
@@ -29,6 +32,7 @@ def execute_all_tests():
     execute_stack_tests()
     execute_sorting_tests()
     execute_map_tests()
+    execute_tree_tests()
 
 
 def execute_list_tests(input_option="2"):
@@ -38,6 +42,8 @@ def execute_list_tests(input_option="2"):
         tests_names.append("test_array_list")
     if input_option.lower() == "2.b" or input_option == "2":
         tests_names.append("test_single_linked_list")
+    if input_option.lower() == "2.c" or input_option == "2":
+        tests_names.append("test_array_deque")
     for test_name in tests_names:
         execute_pytest_test(test_name)
 
@@ -71,10 +77,17 @@ def execute_map_tests(input_option="6"):
         tests_names.append("test_map_linear_probing")
     if input_option.lower() == "6.b" or input_option == "6":
         tests_names.append("test_map_separate_chaining")
+    if input_option.lower() == "6.c" or input_option == "6":
+        tests_names.append("test_multimap")
     for test_name in tests_names:
         execute_pytest_test(test_name)
 
 
+def execute_tree_tests():
+    """Ejecuta las pruebas del árbol rojo-negro"""
+    execute_pytest_test("test_red_black_tree")
+
+
 if __name__ == "__main__":
     """Menú principal de pruebas"""
     runned = False
@@ -102,7 +115,11 @@ if __name__ == "__main__":
         runned = True
         
     if input_option.startswith("6"):
-        execute_map_tests()
+        execute_map_tests(input_option)
+        runned = True
+
+    if input_option == "7":
+        execute_tree_tests()
         runned = True
 
     if input_option == "0":